@@ -275,6 +275,10 @@ SWAP_XY_SHP = True
 SWAP_LATLON_SHP = False
 
 FMT_SPACE_SIZE = 15
+DMS_DECIMALS = 6  # decimals of the DMS seconds, in every output
 
 CHUNK_SIZE = 10_000
-MAX_POINTS_FOR_DXF = 100_000
\ No newline at end of file
+DXF_VERSION = 'R2000'  # 'R12' or 'R2000'
+DXF_FORMAT = 'bin'     # 'bin' (binary) or 'asc' (ASCII)
+DXF_LABELS = 'text'    # 'text' (POINT + TEXT per point) or 'block' (one label definition, INSERT per point: about 2x larger and slower to load)
+INTERPOLATION = 'grid'  # 'grid' (the grid's own setting), 'bicubic', 'linear' (previews/QA) or 'colocate'
\ No newline at end of file
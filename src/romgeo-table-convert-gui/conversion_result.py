@@ -0,0 +1,133 @@
+# Columnar (structure-of-arrays) result of a conversion job.
+#
+# Imports only NumPy so pool workers (worker_entry) can build it; pandas/pyarrow are imported on demand.
+
+import numpy as np
+
+# Per-row status codes
+STATUS_OK            = 0  # converted
+STATUS_FLIPPED       = 1  # converted, latitude/longitude were swapped in the input
+STATUS_NOT_CONVERGED = 2  # converted, but the iterative ST70 inverse did not reach its tolerance
+STATUS_INVALID       = 3  # line not recognised
+STATUS_OUT_OF_BOUNDS = 4  # parsed, outside the Romanian bounding box
+STATUS_FAILED        = 5  # parsed, but the transformation returned no value (e.g. outside the grid)
+
+STATUS_TEXT = {
+    STATUS_OK:            'ok',
+    STATUS_FLIPPED:       'flipped lat/lon',
+    STATUS_NOT_CONVERGED: 'not converged',
+    STATUS_INVALID:       'invalid format',
+    STATUS_OUT_OF_BOUNDS: 'out of bounds',
+    STATUS_FAILED:        'transformation failed',
+}
+
+# Field order per direction, matching the legacy row tuples (name, *fields)
+ETRS_ST70_FIELDS = ('lat', 'lon', 'h_ell', 'st70_x', 'st70_y', 'h_mn')
+ST70_ETRS_FIELDS = ('st70_x', 'st70_y', 'h_mn', 'lat', 'lon', 'h_ell')
+
+
+def merge_info(infos):
+    """Combines per-chunk info dicts: counters are summed, 'max_' keys keep the maximum."""
+    info = {}
+    for chunk in infos:
+        for key, value in chunk.items():
+            info[key] = max(info.get(key, value), value) if key.startswith('max_') else info.get(key, 0) + value
+    return info
+
+
+def describe_dedup(info):
+    """'12000 lines, 10000 distinct (16.7% deduplicated), 9800 distinct points' from a result info dict."""
+    lines, unique = info.get('lines', 0), info.get('unique_lines', 0)
+    ratio = 100 * (1 - unique / lines) if lines else 0.0
+    return f"{lines} lines, {unique} distinct ({ratio:.1f}% deduplicated), {info.get('unique_points', 0)} distinct points"
+
+
+class ConversionResult:
+    """Columnar conversion result: a names array, one float64 array per field and a status-code array.
+
+    values is a single (fields, rows) float64 block, so every field is a contiguous view (result['lat'])
+    and a whole result moves as one buffer. Iterating yields the legacy (name, *fields) row tuples.
+
+    Args:
+        fields (tuple[str]): Field names, in row-tuple order (ETRS_ST70_FIELDS or ST70_ETRS_FIELDS).
+        names (np.ndarray): Point names (object array of str).
+        values (np.ndarray): (len(fields), rows) float64 array, NaN where a value is missing.
+        status (np.ndarray): int8 array of STATUS_* codes.
+        info (dict, optional): Per-job counters (e.g. points that did not converge).
+    """
+
+    def __init__(self, fields, names, values, status, info=None):
+        self.fields = tuple(fields)
+        self.names = names
+        self.values = values
+        self.status = status
+        self.info = info if info is not None else {}
+
+    @classmethod
+    def empty(cls, fields, rows):
+        """All-NaN result of rows rows, names '' and status STATUS_INVALID, to be filled in."""
+        names = np.full(rows, '', dtype=object)
+        values = np.full((len(fields), rows), np.nan, dtype=np.float64)
+        status = np.full(rows, STATUS_INVALID, dtype=np.int8)
+        return cls(fields, names, values, status)
+
+    @classmethod
+    def concat(cls, results):
+        """Joins per-chunk results (same fields) in order; missing (None) chunks are skipped."""
+        results = [r for r in results if r is not None]
+        if not results:
+            raise ValueError("no results to concatenate")
+
+        return cls(results[0].fields,
+                   np.concatenate([r.names for r in results]),
+                   np.concatenate([r.values for r in results], axis=1),
+                   np.concatenate([r.status for r in results]),
+                   merge_info(r.info for r in results))
+
+    def __len__(self):
+        return self.names.shape[0]
+
+    def __repr__(self):
+        return f"ConversionResult(rows={len(self)}, fields={self.fields}, status={self.status_counts()})"
+
+    def __getitem__(self, field):
+        return self.values[self.fields.index(field)]
+
+    def __iter__(self):
+        # Legacy row tuples; boxes every value, prefer the columns for large results
+        return zip(self.names, *(column.tolist() for column in self.values))
+
+    @property
+    def converted(self):
+        """Mask of rows with a value in every field."""
+        return ~np.isnan(self.values).any(axis=0)
+
+    def status_counts(self):
+        """{status text: number of rows} for the statuses present."""
+        codes, counts = np.unique(self.status, return_counts=True)
+        return {STATUS_TEXT.get(int(code), str(code)): int(count) for code, count in zip(codes, counts)}
+
+    def columns(self, labels=None):
+        """{label: array} for names and fields, without copying. labels renames (Name, *fields) positionally."""
+        labels = labels or ('name',) + self.fields
+        return dict(zip(labels, (self.names, *self.values)))
+
+    def to_pandas(self, columns=None):
+        """DataFrame whose float columns view the result values; columns renames (Name, *fields) positionally.
+
+        The frame is built from values as one float64 block (a dict of columns would let pandas consolidate,
+        i.e. copy, them) and the names are inserted as a separate column.
+        """
+        import pandas as pd
+        labels = list(columns or ('name',) + self.fields)
+        frame = pd.DataFrame(self.values.T, columns=labels[1:], copy=False)
+        frame.insert(0, labels[0], self.names)
+        return frame
+
+    def to_arrow(self, columns=None):
+        """pyarrow Table; the float columns are wrapped without copying, names are converted to strings."""
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ImportError("ConversionResult.to_arrow requires pyarrow (pip install pyarrow)") from exc
+        return pa.table(self.columns(columns))
\ No newline at end of file
@@ -0,0 +1,264 @@
+# Streaming DXF writer for point exports.
+#
+# ezdxf builds only the document skeleton (header, tables, blocks, objects) around an empty ENTITIES
+# section. The entities are written straight from the float64 coordinate arrays, a chunk of rows at a time:
+# the group codes and values of all rows are rendered as text_format columns (ASCII tags, or packed codes
+# and doubles for binary DXF) and joined into one buffer per chunk, so no entity object is created per point.
+#
+# Labels are either a POINT and a TEXT per row ('text'), or one block holding the point and NAME / HEIGHT
+# attribute definitions, inserted once per row with its attribute values ('block').
+
+import io
+import struct
+
+import numpy as np
+import ezdxf
+
+import config
+from text_format import Column, bytes_column, constant_column, decimal_column, join_columns, text_column
+
+VERSIONS = ('R12', 'R2000')
+FORMATS = ('asc', 'bin')
+LABEL_MODES = ('text', 'block')
+
+BLOCK_NAME = 'ROMGEO_POINT'
+
+_HEX = np.frombuffer(b'0123456789ABCDEF', dtype=np.uint8)
+
+
+def _save(doc, fmt):
+    # The whole document as bytes
+    if fmt == 'bin':
+        stream = io.BytesIO()
+        doc.write(stream, fmt='bin')
+        return stream.getvalue()
+    stream = io.StringIO()
+    doc.write(stream)
+    return stream.getvalue().encode(doc.output_encoding)
+
+
+def _entities_marker(version, fmt):
+    # Bytes that end the (empty) ENTITIES section header in a saved skeleton
+    if fmt == 'asc':
+        return b'  2\nENTITIES\n'
+    return (b'\x02' if version == 'R12' else b'\x02\x00') + b'ENTITIES\x00'
+
+
+def _define_block(doc, label_layer, label_offset, text_height):
+    # The labelled point block: a POINT at the insertion point, NAME and HEIGHT attributes beside it
+    block = doc.blocks.new(BLOCK_NAME)
+    block.add_point((0, 0, 0))
+    for tag, dy in _attribute_offsets(label_offset, text_height):
+        block.add_attdef(tag, (label_offset, dy, 0), dxfattribs={"height": text_height, "layer": label_layer})
+
+
+def _attribute_offsets(label_offset, text_height):
+    # (tag, y offset) of the block attributes; the x offset is label_offset for both
+    return (('NAME', label_offset), ('HEIGHT', label_offset - 1.5 * text_height))
+
+
+def _skeleton(version, fmt, layers, insunits, entities, setup=None):
+    """Saves an ezdxf document without entities and reserves handles for the streamed ones.
+
+    setup(doc), if given, adds definitions (e.g. blocks) before the document is saved. Returns the bytes
+    before and after the ENTITIES section content, the first reserved handle, the hex digits every
+    reserved handle has, and the model space owner handle.
+    """
+    doc = ezdxf.new(version)
+    if insunits is not None and version != 'R12':
+        doc.header["$INSUNITS"] = insunits
+    for layer in layers:
+        if not doc.layers.has_entry(layer):
+            doc.layers.add(layer)
+    if setup is not None:
+        setup(doc)
+
+    _save(doc, fmt)  # saving creates a few objects of its own; let it take their handles first
+    first = int(str(doc.entitydb.handles), 16)
+
+    # Same number of hex digits for every streamed handle, so handle columns have a fixed width
+    digits = len(f'{first:X}')
+    while max(first, 16 ** (digits - 1)) + entities > 16 ** digits:
+        digits += 1
+    start = max(first, 16 ** (digits - 1))
+    doc.entitydb.handles.reset(f'{start + entities:X}')  # written as $HANDSEED
+
+    data = _save(doc, fmt)
+    marker = _entities_marker(version, fmt)
+    split = data.index(marker) + len(marker)
+    return data[:split], data[split:], start, digits, doc.modelspace().block_record_handle
+
+
+def _handle_column(handles, digits):
+    # Fixed-width upper-case hex handles
+    shifts = 4 * np.arange(digits - 1, -1, -1, dtype=np.int64)
+    return bytes_column(_HEX[(handles[:, None] >> shifts) & 0xF])
+
+
+def _label_column(labels):
+    # Point names as DXF text: characters outside ASCII are written as \U+XXXX escapes
+    labels = np.asarray(labels, dtype=object).astype(str)
+    width = labels.dtype.itemsize // 4
+    if not width:
+        return text_column(labels)
+
+    special = labels.view(np.uint32).reshape(-1, width).max(axis=1) >= 128
+    if special.any():
+        labels = labels.astype(object)
+        labels[special] = [''.join(char if char.isascii() else f'\\U+{ord(char):04X}' for char in label)
+                           for label in labels[special].tolist()]
+    return text_column(labels)
+
+
+class _TagEncoder:
+    # Turns (group code, value) tags into columns for one DXF flavour; str/float/int values are constants,
+    # float arrays and rendered Columns are per-row values.
+
+    def __init__(self, version, fmt, rows, decimals):
+        self.version = version
+        self.fmt = fmt
+        self.rows = rows
+        self.decimals = decimals
+
+    def code(self, code):
+        if self.fmt == 'asc':
+            return f'{code:>3}\n'.encode('ascii')
+        return bytes([code]) if self.version == 'R12' else struct.pack('<h', code)
+
+    def end(self):
+        # After a string value
+        return b'\n' if self.fmt == 'asc' else b'\x00'
+
+    def constant(self, code, value):
+        if isinstance(value, str):
+            return self.code(code) + value.encode('cp1252') + self.end()
+        if self.fmt == 'asc':
+            return self.code(code) + f'{value}\n'.encode('ascii')
+        return self.code(code) + struct.pack('<d' if isinstance(value, float) else '<h', value)
+
+    def columns(self, tags):
+        columns, pending = [], b''
+        for code, value in tags:
+            if isinstance(value, (str, float, int)):
+                pending += self.constant(code, value)
+                continue
+
+            pending += self.code(code)
+            columns.append(constant_column(pending, self.rows))
+            if isinstance(value, Column):
+                columns.append(value)
+                pending = self.end()
+            elif self.fmt == 'asc':
+                columns.append(decimal_column(value, self.decimals))
+                pending = b'\n'
+            else:
+                columns.append(bytes_column(np.ascontiguousarray(value, dtype='<f8').view(np.uint8).reshape(-1, 8)))
+                pending = b''
+
+        if pending:
+            columns.append(constant_column(pending, self.rows))
+        return columns
+
+
+def _entity_start(r2000, name, handles, owner, layer, subclass):
+    # Common tags of an entity: type, handle, owner and layer
+    tags = [(0, name), (5, handles)]
+    tags += [(330, owner), (100, 'AcDbEntity')] if r2000 else []
+    tags += [(8, layer)]
+    tags += [(100, subclass)] if r2000 and subclass else []
+    return tags
+
+
+def _point_tags(r2000, owner, handles, layer, x, y, z):
+    return _entity_start(r2000, 'POINT', handles, owner, layer, 'AcDbPoint') + [(10, x), (20, y), (30, z)]
+
+
+def _text_tags(r2000, owner, handles, layer, x, y, z, height, text):
+    tags = _entity_start(r2000, 'TEXT', handles, owner, layer, 'AcDbText')
+    tags += [(10, x), (20, y), (30, z), (40, float(height)), (1, text)]
+    tags += [(100, 'AcDbText')] if r2000 else []
+    return tags
+
+
+def _insert_tags(r2000, owner, handles, layer, x, y, z, attribs, attrib_layer, height, seqend_handles):
+    # INSERT of the labelled point block, its ATTRIBs (tag, handles, x, y, z, value) and the SEQEND
+    tags = _entity_start(r2000, 'INSERT', handles, owner, layer, 'AcDbBlockReference')
+    tags += [(66, 1), (2, BLOCK_NAME), (10, x), (20, y), (30, z)]
+    for tag, attrib_handles, ax, ay, az, value in attribs:
+        tags += _entity_start(r2000, 'ATTRIB', attrib_handles, handles, attrib_layer, 'AcDbText')
+        tags += [(10, ax), (20, ay), (30, az), (40, float(height)), (1, value)]
+        tags += [(100, 'AcDbAttribute')] if r2000 else []
+        tags += [(2, tag), (70, 0)]
+    return tags + _entity_start(r2000, 'SEQEND', seqend_handles, handles, layer, None)
+
+
+def write_points(path, x, y, z, labels=None, layer='0', label_layer='Labels', version=None, fmt=None,
+                 label_mode=None, insunits=None, label_offset=5.0, text_height=2.5, decimals=6, chunk_rows=100_000):
+    """Writes points (and optional labels) as a DXF file, streaming the entities from the arrays.
+
+    Args:
+        path (str or Path): Output file.
+        x, y, z (np.ndarray): Point coordinates, written at float64 precision.
+        labels (np.ndarray, optional): Name of each point. Defaults to no labels.
+        layer (str, optional): Layer of the points. Defaults to '0'.
+        label_layer (str, optional): Layer of the labels. Defaults to 'Labels'.
+        version (str, optional): 'R12' or 'R2000'. Defaults to config.DXF_VERSION.
+        fmt (str, optional): 'asc' or 'bin'. Defaults to config.DXF_FORMAT.
+        label_mode (str, optional): 'text' writes a POINT and a TEXT (the name) at (x + label_offset,
+            y + label_offset, z) per row; 'block' inserts the BLOCK_NAME block per row, with the name and
+            the height (z) as its NAME and HEIGHT attributes. Defaults to config.DXF_LABELS.
+        insunits (int, optional): $INSUNITS header value (not written for R12).
+        label_offset (float, optional): Label offset from its point, in drawing units. Defaults to 5.0.
+        text_height (float, optional): Label height. Defaults to 2.5.
+        decimals (int, optional): Decimals of the coordinates in ASCII DXF. Defaults to 6.
+        chunk_rows (int, optional): Rows rendered per write. Defaults to 100_000.
+
+    Returns:
+        int: Number of points written.
+    """
+    # Read at call time, so settings changed in the running app apply to the next export
+    version = config.DXF_VERSION if version is None else version
+    fmt = config.DXF_FORMAT if fmt is None else fmt
+    label_mode = config.DXF_LABELS if label_mode is None else label_mode
+
+    if version not in VERSIONS or fmt not in FORMATS or label_mode not in LABEL_MODES:
+        raise ValueError(f"unsupported DXF output {version}/{fmt}/{label_mode}; "
+                         f"expected one of {VERSIONS}, {FORMATS} and {LABEL_MODES}")
+
+    x, y, z = (np.asarray(values, dtype=np.float64) for values in (x, y, z))
+    rows = x.shape[0]
+    r2000 = version != 'R12'
+    block = labels is not None and label_mode == 'block'
+
+    # handles per row: POINT [+ TEXT], or INSERT + NAME and HEIGHT ATTRIBs + SEQEND
+    per_row = 4 if block else 1 if labels is None else 2
+    layers = (layer,) if labels is None else (layer, label_layer)
+    setup = (lambda doc: _define_block(doc, label_layer, label_offset, text_height)) if block else None
+
+    head, tail, start, digits, owner = _skeleton(version, fmt, layers, insunits, rows * per_row, setup)
+
+    with open(path, 'wb') as f:
+        f.write(head)
+        for first in range(0, rows, chunk_rows):
+            chunk = slice(first, min(first + chunk_rows, rows))
+            count = chunk.stop - chunk.start
+            handles = start + per_row * np.arange(chunk.start, chunk.stop, dtype=np.int64)
+            cx, cy, cz = x[chunk], y[chunk], z[chunk]
+
+            if block:
+                values = (_label_column(labels[chunk]), decimal_column(cz, 3))
+                offsets = _attribute_offsets(label_offset, text_height)
+                attribs = [(tag, _handle_column(handles + 1 + i, digits), cx + label_offset, cy + dy, cz, value)
+                           for i, ((tag, dy), value) in enumerate(zip(offsets, values))]
+                tags = _insert_tags(r2000, owner, _handle_column(handles, digits), layer, cx, cy, cz,
+                                    attribs, label_layer, text_height, _handle_column(handles + 3, digits))
+            else:
+                tags = _point_tags(r2000, owner, _handle_column(handles, digits), layer, cx, cy, cz)
+                if labels is not None:
+                    tags += _text_tags(r2000, owner, _handle_column(handles + 1, digits), label_layer,
+                                       cx + label_offset, cy + label_offset, cz, text_height, _label_column(labels[chunk]))
+
+            f.write(join_columns(_TagEncoder(version, fmt, count, decimals).columns(tags), end=b'').data)
+        f.write(tail)
+
+    return rows
@@ -1,14 +1,16 @@
 import romgeo_lite as romgeo
 import numpy as np
 import re
-from functools import lru_cache
 
 import config
-from logutil import log_function
+from logutil import log_function, log
 
 import grid_mgmt
+import worker_entry
+from conversion_result import ConversionResult, describe_dedup
+from parse_plan import describe as describe_patterns
+from text_format import dms_strings
 
-@lru_cache()
 def _fmt(val: float, width: int, precision: str) -> str:
     """Formats a floating-point number to a specified width and precision.
     
@@ -23,9 +25,8 @@ def _fmt(val: float, width: int, precision: str) -> str:
     """
     return format(val, f"{width}{precision}") if not np.isnan(val) else "NaN".rjust(width)
 
-@lru_cache()
 def _dd2dms(dd:float, format:str="tuple"):
-    """Converts Decimal degrees to DD*MM'SS.ss", or to tuple (d,m,s) format
+    """Converts Decimal degrees to DD°MM'SS.ssssss" (text_format.dms_strings, 'safe' marks), or to tuple (d,m,s) format
 
     Args:
         dd (float): Value to be converted
@@ -35,108 +36,53 @@ def _dd2dms(dd:float, format:str="tuple"):
         string or tuple (d,m,s)
     """
 
+    if 'tuple' != format :
+        return str(dms_strings(np.array([dd]), marks='safe')[0])
+
     is_positive = dd >= 0
     dd = abs(dd)
     m,s = divmod(dd*3600,60)
     d,m = divmod(m,60)
     d = d if is_positive else -d
-    if 'tuple' == format :
-        return (d,m,s) 
-    else:
-        return f"{int(d):02d}\N{DEGREE SIGN}{int(m):02d}\N{Apostrophe}{int(s * 1e5) / 1e5:08.5f}\N{Quotation mark}"
+    return (d,m,s)
+
+def worker_settings() -> dict:
+    """Worker settings from config as plain data, for worker_entry.configure / the worker pool initializer.
 
-@lru_cache()
-def _parse_line_etrs(x) -> tuple[float, float, float, str, list[str]]:
-    """Converts parameter to decimal dgrees.
-        Also flips Lat/lon if needed
-    Args:
-        x (string, float, whatever): value to be converted
-    Raises:
-        Exception: "Bad Value" conversion cannot be done
     Returns:
-        float: Decimal degrees
+        dict: Patterns and bounds used by the line parsers, and the INTERPOLATION tier of the conversions.
     """
-    import re    
-
-    pointName = ''
-    comment = []
-
-    match = re.search(config.PREGEX_DMS4, x)
-    if not match:
-        # Try flipped version
-        match = re.search(config.PREGEX_DMS4_FLIPPED, x)
-        if not match:
-            return np.nan, np.nan, np.nan, pointName if pointName else 'invalid_format', ['invalid format'] 
-        flipped = True
-    else:
-        flipped = False
-
-    x = match.groupdict()
-    pointName = x['name'] if x['name'] else ''
-
-    def parse_coord(dd_key, d_key, m_key, s_key):
-        if x.get(d_key) and x.get(m_key) and x.get(s_key):
-            return float(x[d_key]) + float(x[m_key]) / 60 + float(x[s_key]) / 3600
-        elif x.get(dd_key):
-            return float(x[dd_key])
-        return np.nan
-
-    lat = parse_coord('lat_dd', 'lat_d', 'lat_m', 'lat_s')
-    lon = parse_coord('lon_dd', 'lon_d', 'lon_m', 'lon_s')
-    he = float(x['height']) if x['height'] else np.nan
-
+    return {
+        'PREGEX_DMS4':         config.PREGEX_DMS4,
+        'PREGEX_DMS4_FLIPPED': config.PREGEX_DMS4_FLIPPED,
+        'PREGEX_FLOAT4':       config.PREGEX_FLOAT4,
+        'PREGEX_DMS':          config.PREGEX_DMS,
+        'BBOX_RO_ETRS':        list(config.BBOX_RO_ETRS),
+        'INTERPOLATION':       config.INTERPOLATION,
+    }
 
+def parse_plan():
+    """Rebuilds the parse plan of this process (worker_entry.PLAN) from the current config.
 
-    if flipped:
-        lat, lon = lon, lat
-        comment.append('flipped lat/lon')
+    Called when the config changes: at import, by ui_settings_dialog.load_config_overrides and after the
+    settings dialog saves. The parsers below use the plan as it is, without checking the config per line.
 
-    if not _is_inside_bounds(lat, lon, "etrs"):
-        lat, lon, he = np.nan, np.nan, np.nan
-        comment.append('out of bounds')
-
-    return lat, lon, he, pointName, comment
-
-@lru_cache()
-def _split_floats_from_text(line: str) -> tuple[float, float, float, str]:
+    Returns:
+        ParsePlan: The active plan (parse_plan.ParsePlan).
     """
-    Extracts a name (optional) followed by exactly three floats from a line using named regex groups.
-    Supports any separator: spaces, commas, tabs.
-
-    Returns NaN for float values if not exactly 3 are found.
+    return worker_entry.configure(worker_settings())
 
-    Args:
-        line (str): Input line with optional name and three float values.
+# Plan of the config as imported; config changes rebuild it through parse_plan()
+parse_plan()
 
-    Returns:
-        Tuple[float, float, float, str]: Parsed values.
-    """
-    # Match pattern: optional name + 3 floats (with flexible separators)
-    # pattern = re.compile(
-    #     r"""^(?P<name>.*?)
-    #         [,\s\t]*  (?P<val1>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
-    #         [,\s\t]+  (?P<val2>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
-    #         [,\s\t]+  (?P<val3>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
-    #         [,\s\t]*$""",
-    #     re.VERBOSE
-    # )
-
-    pattern = re.compile(config.PREGEX_FLOAT4, re.VERBOSE)
-
-    match = pattern.match(line.strip())
-    if not match:
-        return np.nan, np.nan, np.nan, ""
+def _parse_line_etrs(x) -> tuple[float, float, float, str, list[str]]:
+    """Parses one ETRS89 line (see worker_entry._parse_line_etrs) with the configured patterns."""
+    return worker_entry._parse_line_etrs(x)
 
-    try:
-        x = float(match.group("val1"))
-        y = float(match.group("val2"))
-        z = float(match.group("val3"))
-        name = match.group("name").strip(" ,\t")
-        return x, y, z, name
-    except Exception:
-        return np.nan, np.nan, np.nan, ""
+def _split_floats_from_text(line: str) -> tuple[float, float, float, str]:
+    """Parses one ST70 line (see worker_entry._split_floats_from_text) with the configured pattern."""
+    return worker_entry._split_floats_from_text(line)
 
-@lru_cache()
 def _val_to_float(x):
     """Converts parameter to decimal dgrees
 
@@ -154,7 +100,6 @@ def _val_to_float(x):
     except:
         return np.nan
 
-@lru_cache()
 def _dd_or_dms(x):
     """Converts a given input into a decimal degree (DD) or degrees, minutes, seconds (DMS) format.
     
@@ -166,18 +111,16 @@ def _dd_or_dms(x):
     Returns:
         float: The decimal degree representation of the input if successful, otherwise NaN.
     """
-    import re
     try:
         return float(x)
     except:
         try:
-            x = re.search(config.PREGEX_DMS,x).groups()
+            x = worker_entry.PLAN.search('dms', x).groups()
             return float(x[1]) + float(x[3])/60 + float(x[5])/3600
         except:
             return np.nan
             #raise Exception("Bad Value") 
 
-@lru_cache()
 def _islat(v) -> bool:
     """Determines if a given value is a valid latitude.
     
@@ -198,7 +141,6 @@ def _islat(v) -> bool:
     else:
         return False
 
-@lru_cache()
 def _islon(v) -> bool:
     """Determines if a given value is a valid longitude within a specified bounding box.
     
@@ -215,7 +157,6 @@ def _islon(v) -> bool:
     else:
         return False
 
-@lru_cache()
 def _latlon_maybe_flipped(lat: float, lon: float) -> bool:
     """Determines if the latitude and longitude values may be flipped.
     
@@ -270,52 +211,16 @@ def _is_ascii_file(filepath: str, max_bytes: int = 4096) -> bool:
 
 def _dd_to_dms_vec(dd_array: np.ndarray, safe:bool=False) -> np.ndarray:
     """
-    Vectorized conversion from decimal degrees to DMS string (DD°MM′SS.SSSSS″).
+    Vectorized conversion from decimal degrees to DMS string (DD°MM′SS.ssssss″).
 
     Args:
         dd_array (np.ndarray): Array of decimal degree floats.
+        safe (bool, optional): Use ASCII minute/second marks (DD°MM'SS.ssssss"). Defaults to False.
 
     Returns:
-        np.ndarray of strings in DMS format.
+        np.ndarray of strings in DMS format, from the shared DMS engine (text_format.dms_strings).
     """
-    dd = np.abs(dd_array)
-    total_seconds = dd * 3600
-    minutes_total, seconds = divmod(total_seconds, 60)
-    degrees, minutes = divmod(minutes_total, 60)
-
-    d_int = degrees.astype(int)
-    m_int = minutes.astype(int)
-    s_float = np.round(seconds, 6)
-
-    # Split seconds into int and decimal string
-    s_int = s_float.astype(int)
-    s_decimals = s_float - s_int
-    s_int_str = np.char.zfill(s_int.astype(str), 2)
-    s_decimal_str = np.char.mod('%.6f', s_decimals).astype(str)
-    s_decimal_str = np.char.lstrip(s_decimal_str, '0')  # keep .xxxxxx part
-
-    # Recombine to SS.SSSSSS with padded integer part
-    s_str = np.char.add(s_int_str, s_decimal_str)
-
-    # Zero-padded degrees and minutes
-    d_str = np.char.zfill(d_int.astype(str), 2)
-    m_str = np.char.zfill(m_int.astype(str), 2)
-
-    # Final DMS string
-    if safe:
-        dms = np.char.add(d_str, '°')
-        dms = np.char.add(dms, m_str)
-        dms = np.char.add(dms, "'")
-        dms = np.char.add(dms, s_str)
-        dms = np.char.add(dms, '"')       
-    else:
-        dms = np.char.add(d_str, '°')
-        dms = np.char.add(dms, m_str)
-        dms = np.char.add(dms, '′')
-        dms = np.char.add(dms, s_str)
-        dms = np.char.add(dms, '″')
-
-    return dms
+    return dms_strings(dd_array, marks='safe' if safe else 'unicode')
 
 def _is_inside_bounds(a:float, b:float, type:str = "etrs")->bool:
     """Determines if the given coordinates are within specified bounds.
@@ -385,221 +290,108 @@ def _fill_missing_names(df, name_col="Name", prefix="Point "):
 
 
 @log_function(level='debug')
-def convert_etrs_st70(multiText: list[str], GRID = None) -> list[tuple[str, float, float, float, float, float, float]]:
+def convert_etrs_st70(multiText: list[str], GRID = None, INTERPOLATION = None) -> ConversionResult:
     """Converts coordinates from ETRS89 to the ST70 system.
     
     Args:
         multiText (list[str]): A list of strings, each containing coordinates in ETRS89 format.
+        INTERPOLATION (int | tuple[int, int], optional): Interpolation tier for this job (romgeo INTERP_COLOCATE,
+                               INTERP_LINEAR or INTERP_BICUBIC, or a (horizontal, vertical) pair).
+                               Defaults to config.INTERPOLATION ('grid': the grid's own setting).
     
     Returns:
-        list[tuple[str, float, float, float, float, float, float]]: A list of tuples, where each tuple contains:
-            - name (str): The name associated with the coordinates.
-            - n (float): The northing coordinate in ETRS89.
-            - e (float): The easting coordinate in ETRS89.
-            - h (float): The height coordinate in ETRS89.
-            - st_x (float): The converted easting coordinate in ST70.
-            - st_y (float): The converted northing coordinate in ST70.
-            - st_h (float): The converted height coordinate in ST70.
+        ConversionResult: Columnar result with a names array, a status-code array and the fields
+        (ETRS_ST70_FIELDS, in the order of the former row tuples):
+            - lat (float): The latitude in ETRS89.
+            - lon (float): The longitude in ETRS89.
+            - h_ell (float): The ellipsoidal height in ETRS89.
+            - st70_x (float): The converted easting coordinate in ST70.
+            - st70_y (float): The converted northing coordinate in ST70.
+            - h_mn (float): The converted height coordinate in ST70.
             
     If the input coordinates cannot be parsed or converted, NaN values will be returned for those fields.
     """
-    results = []
-
-    # Preallocate transformer
+    # Same code the pool workers run, with the grid and parser settings taken from this process
     if GRID is None:
         GRID = grid_mgmt.ROMGEO_GRID_FILE
 
-    t = romgeo.transformations.Transform(GRID)
+    result = worker_entry.convert_etrs_st70(multiText, GRID, INTERPOLATION)
 
-    for line in multiText:
-        name = ""
-        try:
-            n, e, h, name, comment = _parse_line_etrs(line)
-        except Exception:
-            n = e = h = np.nan
-
-        if not np.isnan(n) and not np.isnan(e) and not np.isnan(h):
-            st_y = st_x = st_h = np.nan
-            try:
-                # Prepare 1-element arrays
-                n_arr = np.array([n], dtype=float)
-                e_arr = np.array([e], dtype=float)
-                h_arr = np.array([h], dtype=float)
-                st_y_arr = np.full_like(e_arr, 0.0)
-                st_x_arr = np.full_like(n_arr, 0.0)
-                st_h_arr = np.full_like(h_arr, 0.0)
-
-                t.etrs_to_st70(n_arr, e_arr, h_arr, st_y_arr, st_x_arr, st_h_arr)
+    log(f"convert_etrs_st70: {describe_dedup(result.info)}; {result.info['parsed_fast']} read by the decimal fast path, "
+        f"{result.info['parsed_regex']} by the regex parser (patterns matched: {describe_patterns(result.info)})", level="debug")
 
-                st_x, st_y, st_h = st_x_arr[0], st_y_arr[0], st_h_arr[0]
-            except Exception:
-                pass  # leave output as NaN
-        else:
-            st_x = st_y = st_h = np.nan
-
-        results.append((name, n, e, h, st_x, st_y, st_h))
-
-    return results
+    return result
 
 
 
 @log_function(level='debug')
-def convert_st70_etrs89(multiText: list[str], GRID = None) -> list[tuple[str, float, float, float, float, float, float]]:
+def convert_st70_etrs89(multiText: list[str], GRID = None, INTERPOLATION = None) -> ConversionResult:
     """Converts coordinates from ST70 to ETRS89 for a list of input strings.
     
     Args:
         multiText (list[str]): A list of strings, each containing coordinates in the format 
                                suitable for conversion. Each string should include easting, 
                                northing, height, and a name.
+        INTERPOLATION (int | tuple[int, int], optional): Interpolation tier for this job (romgeo INTERP_COLOCATE,
+                               INTERP_LINEAR or INTERP_BICUBIC, or a (horizontal, vertical) pair).
+                               Defaults to config.INTERPOLATION ('grid': the grid's own setting).
     
     Returns:
-        list[tuple[str, float, float, float, float, float, float]]: A list of tuples, 
-        where each tuple contains the name, original easting, original northing, original 
-        height, converted latitude, converted longitude, and converted height (altitude) 
-        in ETRS89. If conversion fails or input values are NaN, the corresponding latitude, 
+        ConversionResult: Columnar result with a names array, a status-code array and the fields
+        (ST70_ETRS_FIELDS) original easting, northing and height, converted latitude, longitude
+        and height in ETRS89. If conversion fails or input values are NaN, the corresponding latitude, 
         longitude, and height will be NaN.
     """
-    results = []
-
-    # Preallocate transformer
+    # Same code the pool workers run, with the grid and parser settings taken from this process
     if GRID is None:
         GRID = grid_mgmt.ROMGEO_GRID_FILE
 
-    t = romgeo.transformations.Transform(GRID)
+    result = worker_entry.convert_st70_etrs89(multiText, GRID, INTERPOLATION)
 
-    for line in multiText:
-        e, n, h, name = _split_floats_from_text(line)
+    log(f"convert_st70_etrs89: {describe_dedup(result.info)} (patterns matched: {describe_patterns(result.info)})", level="debug")
 
-        if not np.isnan(n) and not np.isnan(e) and not np.isnan(h):
-            lat = lon = z = np.nan
-            try:
-                n_arr = np.array([n], dtype=float)
-                e_arr = np.array([e], dtype=float)
-                h_arr = np.array([h], dtype=float)
-                lat_arr = np.full(1, 0.0)
-                lon_arr = np.full(1, 0.0)
-                z_arr   = np.full(1, 0.0)
+    if result.info.get('not_converged'):
+        log(f"convert_st70_etrs89: {result.info['not_converged']} of {len(result)} points did not converge "
+            f"(max {result.info['max_iterations']} iterations)", level="warning")
 
-                t.st70_to_etrs(n_arr, e_arr, h_arr, lat_arr, lon_arr, z_arr)
-
-                lat, lon, z = lat_arr[0], lon_arr[0], z_arr[0]
-            except Exception:
-                pass
-        else:
-            lat = lon = z = np.nan
-
-        results.append((name, e, n, h, lat, lon, z))
-
-    return results
+    return result
 
 
 
 @log_function(level='debug')
-def batch_etrs_to_st70(multiText: list[str]) -> list[tuple[str, float, float, float, float, float, float]]:
+def batch_etrs_to_st70(multiText: list[str], INTERPOLATION = None) -> ConversionResult:
     """
-    Parses a list of ETRS89 coordinate lines, converts them in batch to ST70 using t.etrs_to_st70,
-    and returns a list of tuples (name, n, e, h, st_x, st_y, st_h).
+    Parses a list of ETRS89 coordinate lines and converts them in batch to ST70 with the active grid.
+    Same as convert_etrs_st70(multiText, INTERPOLATION=INTERPOLATION), which now converts in batch too.
 
     Args:
         multiText (list[str]): List of strings, each containing coordinates in ETRS89 format.
+        INTERPOLATION (int | tuple[int, int], optional): Interpolation tier for this job (romgeo INTERP_COLOCATE,
+                               INTERP_LINEAR or INTERP_BICUBIC, or a (horizontal, vertical) pair).
+                               Defaults to config.INTERPOLATION ('grid': the grid's own setting).
 
     Returns:
-        list[tuple[str, float, float, float, float, float, float]]: Each tuple contains:
-            - name (str)
-            - n (float): ETRS89 latitude
-            - e (float): ETRS89 longitude
-            - h (float): ETRS89 height
-            - st_x (float): ST70 X
-            - st_y (float): ST70 Y
-            - st_h (float): ST70 height
+        ConversionResult: Fields lat, lon, h_ell, st70_x, st70_y, h_mn.
     """
-    t = romgeo.transformations.Transform(grid_mgmt.ROMGEO_GRID_FILE)
-
-    n_arr, e_arr, h_arr, name_list = map(np.array, zip(*(_parse_line_etrs(line)[:4] for line in multiText)))
-    st_x_arr = np.full_like(n_arr, np.nan)
-    st_y_arr = np.full_like(e_arr, np.nan)
-    st_h_arr = np.full_like(h_arr, np.nan)
-
-    # Only convert if at least one valid row
-    mask = ~np.isnan(n_arr) & ~np.isnan(e_arr) & ~np.isnan(h_arr)
-    if np.any(mask):
-        try:
-            # Note: etrs_to_st70 expects (north, east, height, out_y, out_x, out_h)
-            # Output arrays must be passed as contiguous arrays, not masked views!
-            # So, create compact arrays for valid rows, then assign back.
-            n_valid = n_arr[mask]
-            e_valid = e_arr[mask]
-            h_valid = h_arr[mask]
-            st_y_valid = np.zeros_like(n_valid)
-            st_x_valid = np.zeros_like(e_valid)
-            st_h_valid = np.zeros_like(h_valid)
-
-            t.etrs_to_st70(n_valid, e_valid, h_valid, st_y_valid, st_x_valid, st_h_valid)
-
-            st_x_arr[mask] = st_x_valid
-            st_y_arr[mask] = st_y_valid
-            st_h_arr[mask] = st_h_valid
-        except Exception:
-            pass  # leave as NaN if conversion fails
-
-    results = [
-        (name_list[i], n_arr[i], e_arr[i], h_arr[i], st_x_arr[i], st_y_arr[i], st_h_arr[i])
-        for i in range(len(multiText))
-    ]
-    return results
+    return convert_etrs_st70(multiText, INTERPOLATION=INTERPOLATION)
 
 
 @log_function(level='debug')
-def bulk_st70_etrs89(multiText: list[str]) -> list[tuple[str, float, float, float, float, float, float]]:
+def bulk_st70_etrs89(multiText: list[str], INTERPOLATION = None) -> ConversionResult:
     """
-    Parses a list of ST70 coordinate lines, converts them in batch to ETRS89 using t.st70_to_etrs,
-    and returns a list of tuples (name, e, n, h, lat, lon, z).
+    Parses a list of ST70 coordinate lines and converts them in batch to ETRS89 with the active grid.
+    Same as convert_st70_etrs89(multiText, INTERPOLATION=INTERPOLATION), which now converts in batch too.
 
     Args:
         multiText (list[str]): List of strings, each containing coordinates in ST70 format.
+        INTERPOLATION (int | tuple[int, int], optional): Interpolation tier for this job (romgeo INTERP_COLOCATE,
+                               INTERP_LINEAR or INTERP_BICUBIC, or a (horizontal, vertical) pair).
+                               Defaults to config.INTERPOLATION ('grid': the grid's own setting).
 
     Returns:
-        list[tuple[str, float, float, float, float, float, float]]: Each tuple contains:
-            - name (str)
-            - e (float): ST70 easting
-            - n (float): ST70 northing
-            - h (float): ST70 height
-            - lat (float): ETRS89 latitude
-            - lon (float): ETRS89 longitude
-            - z (float): ETRS89 height
+        ConversionResult: Fields st70_x, st70_y, h_mn, lat, lon, h_ell.
     """
-    t = romgeo.transformations.Transform(grid_mgmt.ROMGEO_GRID_FILE)
-
-    # Parse all lines into arrays
-    e_arr, n_arr, h_arr, name_list = map(np.array, zip(*(_split_floats_from_text(line) for line in multiText)))
-    lat_arr = np.full_like(e_arr, np.nan)
-    lon_arr = np.full_like(n_arr, np.nan)
-    z_arr   = np.full_like(h_arr, np.nan)
-
-    # Only convert if at least one valid row
-    mask = ~np.isnan(e_arr) & ~np.isnan(n_arr) & ~np.isnan(h_arr)
-    if np.any(mask):
-        try:
-            e_valid = e_arr[mask]
-            n_valid = n_arr[mask]
-            h_valid = h_arr[mask]
-            lat_valid = np.zeros_like(e_valid)
-            lon_valid = np.zeros_like(n_valid)
-            z_valid   = np.zeros_like(h_valid)
-
-            t.st70_to_etrs(n_valid, e_valid, h_valid, lat_valid, lon_valid, z_valid)
-
-            lat_arr[mask] = lat_valid
-            lon_arr[mask] = lon_valid
-            z_arr[mask]   = z_valid
-        except Exception:
-            pass  # leave as NaN if conversion fails
-
-    results = [
-        (name_list[i], e_arr[i], n_arr[i], h_arr[i], lat_arr[i], lon_arr[i], z_arr[i])
-        for i in range(len(multiText))
-    ]
-    return results
+    return convert_st70_etrs89(multiText, INTERPOLATION=INTERPOLATION)
 
 def test_1():
     import numpy
@@ -6,11 +6,14 @@ import grid_mgmt
 from functions import _is_inside_bounds, _dd2dms, _filter_inside_bounds, _round_columns, _dd_to_dms_vec, _fill_missing_names
 
 from logutil import log
+from conversion_result import ConversionResult
+import dxf_writer
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
-from shapely.geometry import Point
-import ezdxf
+import pyogrio
+import shapely
 from csv import QUOTE_NONNUMERIC
 
 # region ...for the future
@@ -63,7 +66,7 @@ def df_to_geodataframe(df, x_field: str = "st70_X", y_field: str = "st70_Y", z_f
     north = df[x_field] if swap_xy else df[y_field]
     elev = df[z_field]
 
-    df[geometry_col] = [Point(e, n, z) for e, n, z in zip(east, north, elev)]
+    df[geometry_col] = shapely.points(east.to_numpy(), north.to_numpy(), elev.to_numpy())
 
     print(
         f"{'Swapping' if swap_xy else 'Using'} {x_field} and {y_field} "
@@ -73,6 +76,62 @@ def df_to_geodataframe(df, x_field: str = "st70_X", y_field: str = "st70_Y", z_f
     return gpd.GeoDataFrame(df, geometry=geometry_col, crs=crs)
 
 
+def _point_wkb(east, north, elev) -> np.ndarray:
+    # ISO WKB Point Z records (byte order, geometry type 1001, x, y, z) of the coordinate arrays, 29 bytes each
+    records = np.empty(len(east), dtype=[("order", "u1"), ("type", "<u4"), ("xyz", "<f8", 3)])
+    records["order"] = 1  # little endian
+    records["type"] = 1001
+    records["xyz"] = np.column_stack([east, north, elev])
+    return records
+
+
+def _write_point_shapefile(shapefile_path, df, east, north, elev, crs):
+    """
+    Writes a 3D point shapefile straight from column arrays, without creating a geometry object per point.
+
+    The points are encoded as WKB with NumPy and written by pyogrio together with the columns of df (the
+    attribute table): through GDAL's Arrow interface when pyarrow is installed, from the arrays otherwise.
+
+    Args:
+        shapefile_path (str or Path): Output .shp file.
+        df (pd.DataFrame): Attribute columns, in field order.
+        east, north, elev (np.ndarray): Point coordinates (full precision).
+        crs (str): Coordinate Reference System (e.g., "EPSG:3844").
+    """
+    records = _point_wkb(east, north, elev)
+    fields = list(df.columns)
+    # numeric columns as they are, text (pandas string or object) columns as object arrays of str
+    values = [df[name].to_numpy() if df[name].dtype.kind in "fiub" else df[name].to_numpy(dtype=object)
+              for name in fields]
+    options = dict(driver="ESRI Shapefile", geometry_type="Point Z", crs=crs)
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        pa = None
+
+    if pa is not None:
+        geometry = pa.FixedSizeBinaryArray.from_buffers(pa.binary(records.itemsize), len(records),
+                                                        [None, pa.py_buffer(records)])
+        table = pa.table([*values, geometry.cast(pa.binary())], names=[*fields, "geometry"])
+        pyogrio.write_arrow(table, shapefile_path, geometry_name="geometry", **options)
+    else:
+        data, size = records.tobytes(), records.itemsize
+        geometry = np.array([data[i:i + size] for i in range(0, len(data), size)], dtype=object)
+        pyogrio.raw.write(shapefile_path, geometry, values, fields, **options)
+
+
+def _points_frame(points, columns) -> pd.DataFrame:
+    """
+    DataFrame of conversion results with the given column labels.
+    A ConversionResult's float columns are viewed, not copied; legacy lists of row tuples are still accepted.
+    """
+    if isinstance(points, ConversionResult):
+        return points.to_pandas(columns)
+
+    return pd.DataFrame(points, columns=columns)
+
+
 # region st70 exports
 
 # OK
@@ -106,7 +165,7 @@ def save_st70_as_shape(points, shapefile_path, swap_xy = config.SWAP_XY_SHP):
     # Prepare transformed data for GeoDataFrame
     columns = ["Name", "Lat", "Lon", "H_Ell", "st70_X", "st70_Y", "H_mn"]
 
-    df = pd.DataFrame(points, columns=columns)
+    df = _points_frame(points, columns)
 
     # Filter out rows with NaN in any of the required columns
     df = df.dropna(subset=["Lat", "Lon", "H_Ell", "st70_X", "st70_Y", "H_mn"])
@@ -121,18 +180,16 @@ def save_st70_as_shape(points, shapefile_path, swap_xy = config.SWAP_XY_SHP):
     df["Lat_t"] = _dd_to_dms_vec(df["Lat"].values, safe=True)
     df["Lon_t"] = _dd_to_dms_vec(df["Lon"].values, safe=True)
 
+    # Geometry from the coordinate arrays before rounding (full precision for GIS processing)
+    east, north = ("st70_Y", "st70_X") if swap_xy else ("st70_X", "st70_Y")
+    coords = [df[name].to_numpy(copy=True) for name in (east, north, "H_mn")]
+
     # Round st70_X, st70_Y, and H_mn to 3 decimals for table attributes (while keeping geometry at full precision)
     df = _round_columns(df, ["st70_X", "st70_Y", "H_mn"])
 
-    # Create geometry (full precision for GIS processing)
-    gdf = df_to_geodataframe(df,
-                             x_field="st70_X", y_field="st70_Y", z_field="H_mn",
-                             swap_xy=swap_xy,
-                             crs = "EPSG:3844")
-
     # Save Shapefile
     try:
-        gdf.to_file(shapefile_path, driver="ESRI Shapefile", engine="fiona")
+        _write_point_shapefile(shapefile_path, df, *coords, crs="EPSG:3844")
     except Exception as e:
         log('Got exception while exporting:\n{e}', level='error', also_print=True)
         return "export failed",-1
@@ -165,7 +222,7 @@ def save_st70_as_excel(points, excel_path, force_csv=False, engine=None):
 
     excel_path = Path(excel_path)
     columns = ["Name", "Latitude", "Longitude", "Height_Ellipsoidal", "st70_X", "st70_Y", "H_mn"]
-    df = pd.DataFrame(points, columns=columns)
+    df = _points_frame(points, columns)
 
     # Filter out rows with NaN in any of the required columns
     df = df.dropna(subset=["Latitude", "Longitude", "Height_Ellipsoidal", "st70_X", "st70_Y", "H_mn"])
@@ -226,9 +283,7 @@ def save_st70_as_dxf(points, dxf_path, swap_xy = config.SWAP_XY_DXF):
 
     columns = ["Name", "Latitude", "Longitude", "Height_Ellipsoidal", "st70_X", "st70_Y", "H_mn"]
 
-    df = pd.DataFrame(points, columns=columns)
-
-    is_large = df.shape[0] > config.MAX_POINTS_FOR_DXF
+    df = _points_frame(points, columns)
 
     # Filter out rows with NaN in any of the required columns
     df = df.dropna(subset=["Latitude", "Longitude", "Height_Ellipsoidal", "st70_X", "st70_Y", "H_mn"])
@@ -241,35 +296,17 @@ def save_st70_as_dxf(points, dxf_path, swap_xy = config.SWAP_XY_DXF):
     # Fill missing names with default values
     df = _fill_missing_names(df, "Name", prefix="Point ")
 
-    # Round st70_X, st70_Y, and H_mn to 3 decimals for table attributes (while keeping geometry at full precision)
-    df = _round_columns(df, ["st70_X", "st70_Y", "H_mn"])
-    df = df.astype({"st70_X": "float32", "st70_Y": "float32", "H_mn": "float32"})
-
-    doc = ezdxf.new()
-    doc.header["$INSUNITS"] = 6 #meters
-    msp = doc.modelspace()
+    # Geometry from the coordinate arrays before rounding (full precision)
+    x_field, y_field = ("st70_X", "st70_Y") if swap_xy else ("st70_Y", "st70_X")
+    xs, ys, hs = (df[name].to_numpy(copy=True) for name in (x_field, y_field, "H_mn"))
 
-    # Prepare coordinates and labels efficiently
-    if swap_xy:
-        xs = df["st70_X"].values
-        ys = df["st70_Y"].values
-        hs = df["H_mn"].values
-    else:
-        xs = df["st70_Y"].values
-        ys = df["st70_X"].values
-        hs = df["H_mn"].values
+    # Round st70_X, st70_Y, and H_mn to 3 decimals (the DXF geometry above is not affected)
+    df = _round_columns(df, ["st70_X", "st70_Y", "H_mn"])
 
     labels = df["Name"].values
 
-    # Fast loop to add points (skip add_text for performance)
-    for x, y, h, label in zip(xs, ys, hs, labels):
-        msp.add_point((x, y, h), dxfattribs={"layer": "Stereo70_EPSG3844"})
-
-        # Optional: enable only if needed, slows down massively
-        if not is_large:
-            msp.add_text(label, dxfattribs={"insert": (x + 5, y + 5, h), "layer": "Labels"})
-
-    doc.saveas(dxf_path,fmt='bin')
+    # Points and labels are streamed from the columns (no per-entity objects), so every point keeps its label
+    dxf_writer.write_points(dxf_path, xs, ys, hs, labels, layer="Stereo70_EPSG3844", insunits=6) #meters
 
     prj_path = dest_dir / f"{dxf_name}.prj"
     with open(prj_path, "w") as prj_file:
@@ -315,7 +352,7 @@ def save_etrs_as_shape(points, shapefile_path, swap_xy = config.SWAP_LATLON_SHP)
     # Prepare transformed data for GeoDataFrame
     columns = ["Name", "st70_X", "st70_Y", "H_mn", "Lat", "Lon", "H_Ell"]
 
-    df = pd.DataFrame(points, columns=columns)
+    df = _points_frame(points, columns)
 
     # Filter out rows with NaN in any of the required columns
     df = df.dropna(subset=["Lat", "Lon", "H_Ell", "st70_X", "st70_Y", "H_mn"])
@@ -333,15 +370,13 @@ def save_etrs_as_shape(points, shapefile_path, swap_xy = config.SWAP_LATLON_SHP)
     # Round st70_X, st70_Y, and H_mn to 3 decimals for table attributes (while keeping geometry at full precision)
     df = _round_columns(df, ["st70_X", "st70_Y", "H_mn"])
 
-    # Create geometry (full precision for GIS processing)
-    gdf = df_to_geodataframe(df, 
-                             x_field="Lon", y_field="Lat", z_field="H_Ell",
-                             swap_xy=swap_xy,
-                             crs = "EPSG:4258")
+    # Geometry from the coordinate arrays (full precision for GIS processing)
+    east, north = ("Lat", "Lon") if swap_xy else ("Lon", "Lat")
 
     # Save Shapefile
     try:
-        gdf.to_file(shapefile_path, driver="ESRI Shapefile", engine="fiona")
+        _write_point_shapefile(shapefile_path, df, df[east].to_numpy(), df[north].to_numpy(),
+                               df["H_Ell"].to_numpy(), crs="EPSG:4258")
     except Exception as e:
         log('Got exception while exporting:\n{e}', level='error', also_print=True)
         return "export failed"
@@ -377,7 +412,7 @@ def save_etrs_as_excel(points, excel_path, force_csv=False, engine=None):
     
     excel_path = Path(excel_path)
     columns = ["Name", "st70_X", "st70_Y", "H_mn","Latitude", "Longitude", "Height_Ellipsoidal"]
-    df = pd.DataFrame(points, columns=columns)
+    df = _points_frame(points, columns)
 
     # Filter out rows with NaN in any of the required columns
     df = df.dropna(subset=["st70_X", "st70_Y", "H_mn","Latitude", "Longitude", "Height_Ellipsoidal"])    
@@ -435,9 +470,7 @@ def save_etrs_as_dxf(points, dxf_path, swap_xy = config.SWAP_XY_DXF):
 
     columns = ["Name", "st70_X", "st70_Y", "H_mn", "Latitude", "Longitude", "Height_Ellipsoidal"]
 
-    df = pd.DataFrame(points, columns=columns)
-
-    is_large = df.shape[0] > config.MAX_POINTS_FOR_DXF
+    df = _points_frame(points, columns)
 
     # Filter out rows with NaN in any of the required columns
     df = df.dropna(subset=["st70_X", "st70_Y", "H_mn", "Latitude", "Longitude", "Height_Ellipsoidal"])    
@@ -451,11 +484,6 @@ def save_etrs_as_dxf(points, dxf_path, swap_xy = config.SWAP_XY_DXF):
     
     # Round st70_X, st70_Y, and H_mn to 3 decimals for table attributes (while keeping geometry at full precision)
     df = _round_columns(df, ["st70_X", "st70_Y", "H_mn"])
-    df = df.astype({"st70_X": "float32", "st70_Y": "float32", "H_mn": "float32"})
-
-    doc = ezdxf.new()
-    doc.header["$INSUNITS"] = 21 #degrees
-    msp = doc.modelspace()
 
     # Prepare coordinates and labels efficiently
     if swap_xy:
@@ -469,15 +497,8 @@ def save_etrs_as_dxf(points, dxf_path, swap_xy = config.SWAP_XY_DXF):
 
     labels = df["Name"].values
 
-    # Fast loop to add points (skip add_text for performance)
-    for x, y, h, label in zip(xs, ys, hs, labels):
-        msp.add_point((x, y, h), dxfattribs={"layer": "ETRS89_EPSG4258"})
-
-        # Optional: enable only if needed, slows down massively
-        if not is_large:
-            msp.add_text(label, dxfattribs={"insert": (x + 5, y + 5, h), "layer": "Labels"})
-
-    doc.saveas(dxf_path, fmt='bin')
+    # Points and labels are streamed from the columns (no per-entity objects), so every point keeps its label
+    dxf_writer.write_points(dxf_path, xs, ys, hs, labels, layer="ETRS89_EPSG4258", insunits=21, decimals=10) #degrees
 
     return dxf_path, df.shape[0]  # Return the path and number of valid points saved
 
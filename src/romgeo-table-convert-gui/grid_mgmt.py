@@ -5,7 +5,7 @@ from logutil import log_function, log
 
 import config
 
-import spg_management as spg
+from romgeo_lite import gridfile
 
 
 ROMGEO_APPDATA  = Path(os.getenv('LOCALAPPDATA', os.path.expanduser("~\\AppData\\Local")))
@@ -44,6 +44,13 @@ def _compact_release_text(release):
 
     return f"{release['major']:02}.{release['minor']:02}{rev}{legacy}"
 
+@log_function(level='debug')
+def _grid_release(file, verify=False) -> dict:
+    """Release version (metadata.release) of a grid file, read through gridfile.load_grid_data: SPG v2
+    files are memory-mapped, so only their header is read (plus one checksum pass with verify=True)."""
+    data = gridfile.load_grid_data(file, verify=verify)
+    return data.get('metadata', {}).get('release', {'major': None, 'minor': None, 'revision': 0, 'legacy': None})
+
 @log_function(level='debug')
 def _get_exe_dir() -> str:
     if getattr(sys, 'frozen', False):
@@ -82,7 +89,7 @@ def _latest_grid(ROMGEO_GRID_DIR):
 
     # Fallback: return file with highest version
     def version_key(file: Path) -> tuple:
-        ver = spg.SPGFile(file).get_spg_version()
+        ver = _grid_release(file)
         return (
             int(ver.get('major') or 0),
             int(ver.get('minor') or 0),
@@ -234,9 +241,7 @@ def set_active_grid_file(file:str, ROMGEO_GRID_DIR:str = ROMGEO_GRID_DIR):
     GRID_VER = {'major': None, 'minor': None, 'revision': 0, 'legacy': None}
 
     if os.path.isfile(GRID_FILE):
-        grid = spg.SPGFile(GRID_FILE)
-        
-        GRID_VER = _compact_release_text(grid.get_spg_version())
+        GRID_VER = _compact_release_text(_grid_release(GRID_FILE, verify=True))
     else:
         raise Exception('Grid Invalid.')
     
@@ -273,9 +278,7 @@ def select_best_grid(ROMGEO_GRID_DIR:str = ROMGEO_GRID_DIR):
             shutil.copy2(GRID_FILE, Path(ROMGEO_GRID_DIR) / 'rom_grid3d_latest.spg' )
 
     if os.path.isfile(GRID_FILE):
-        grid = spg.SPGFile(GRID_FILE)
-        
-        GRID_VER = _compact_release_text(grid.get_spg_version())
+        GRID_VER = _compact_release_text(_grid_release(GRID_FILE, verify=True))
     else:
         raise Exception('Grid Invalid.')
 
@@ -0,0 +1,79 @@
+# Compiled parse plan: the configured line patterns compiled once per set of parser settings.
+#
+# config.ini overrides (ui_settings_dialog.load_config_overrides) can replace any pattern, so the plan is
+# built from the settings dict (functions.worker_settings) and rebuilt only when that dict changes (see
+# worker_entry.configure); pool workers get the same settings in their initializer. Standard library only.
+
+import re
+import time
+
+# Plan key: (config setting, re flags)
+PATTERNS = {
+    'dms4':         ('PREGEX_DMS4',         0),
+    'dms4_flipped': ('PREGEX_DMS4_FLIPPED', 0),
+    'float4':       ('PREGEX_FLOAT4',       re.VERBOSE),
+    'dms':          ('PREGEX_DMS',          0),
+}
+
+
+class ParsePlan:
+    """The parser patterns of one set of settings, compiled once, with per-pattern counters.
+
+    search() / match() run a pattern and count the attempt, the match and the time spent; counters()
+    returns them as flat info keys ('dms4_tried', 'dms4_matched', 'dms4_seconds', ...) that add up across
+    chunks (conversion_result.merge_info).
+
+    Args:
+        settings (dict): Parser settings (see functions.worker_settings); patterns that are missing or
+            None are left out of the plan.
+    """
+
+    def __init__(self, settings):
+        self.settings = dict(settings)
+        self.bbox = settings.get('BBOX_RO_ETRS')
+
+        t0 = time.perf_counter()
+        self.patterns = {key: re.compile(settings[name], flags)
+                         for key, (name, flags) in PATTERNS.items() if settings.get(name)}
+        self.compile_seconds = time.perf_counter() - t0
+
+        self.reset_counters()
+
+    def __repr__(self):
+        return f"ParsePlan(patterns={list(self.patterns)}, compiled in {self.compile_seconds:.4f} s)"
+
+    def reset_counters(self):
+        # key: [tried, matched, seconds]
+        self.stats = {key: [0, 0, 0.0] for key in self.patterns}
+
+    def _run(self, key, method, text):
+        stats = self.stats[key]
+        t0 = time.perf_counter()
+        match = method(text)
+        stats[2] += time.perf_counter() - t0
+        stats[0] += 1
+        if match:
+            stats[1] += 1
+        return match
+
+    def search(self, key, text):
+        """pattern.search(text) for the plan pattern key, counted."""
+        return self._run(key, self.patterns[key].search, text)
+
+    def match(self, key, text):
+        """pattern.match(text) for the plan pattern key, counted."""
+        return self._run(key, self.patterns[key].match, text)
+
+    def counters(self):
+        """{'<key>_tried': n, '<key>_matched': n, '<key>_seconds': s} for the patterns that were used."""
+        info = {}
+        for key, (tried, matched, seconds) in self.stats.items():
+            if tried:
+                info.update({f'{key}_tried': tried, f'{key}_matched': matched, f'{key}_seconds': seconds})
+        return info
+
+
+def describe(info):
+    """'dms4 98/100 in 0.012 s, ...' for the pattern counters in a result info dict."""
+    return ', '.join(f"{key} {info[f'{key}_matched']}/{info[f'{key}_tried']} in {info[f'{key}_seconds']:.3f} s"
+                     for key in PATTERNS if f'{key}_tried' in info)
@@ -1,3 +1,6 @@
 import romgeo_lite.crs
 import romgeo_lite.projections
 import romgeo_lite.transformations
+import romgeo_lite.backend
+import romgeo_lite.gridfile
+import romgeo_lite.sharedgrid
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# coding: utf-8
+# backend class - Select the compute backend for the bulk kernels
+
+import os
+import logging
+import importlib.util
+
+BACKEND_NUMPY = 'numpy'
+BACKEND_NUMBA = 'numba'
+
+# ROMGEO_BACKEND=numpy forces the NumPy path even when numba is installed.
+_requested = os.environ.get('ROMGEO_BACKEND', '').strip().lower()
+
+if _requested != BACKEND_NUMPY and importlib.util.find_spec('numba') is not None:
+    _backend = BACKEND_NUMBA
+else:
+    _backend = BACKEND_NUMPY
+
+_kernels = None
+
+logger = logging.getLogger(__name__)
+
+
+def active_backend():
+    """
+    Name of the backend used by the Transform bulk kernels: 'numba' or 'numpy'.
+    Loads the numba kernels first (see kernels()), so a numba install that cannot be imported reports 'numpy'.
+    """
+    kernels()
+    return _backend
+
+
+def disable_numba(reason=None):
+    """
+    Switch to the NumPy backend for the rest of the process. reason is logged as a warning.
+    """
+    global _backend
+
+    if reason and _backend == BACKEND_NUMBA:
+        logger.warning("numba backend disabled, using NumPy: %s", reason)
+
+    _backend = BACKEND_NUMPY
+
+
+def compile_errors():
+    """
+    Exception types numba raises when a kernel fails to type or compile (numba.core.errors.NumbaError),
+    for the NumPy fallback in the Transform bulk kernels. Empty when the numba kernels are not loaded.
+    """
+    if _kernels is None:
+        return ()
+
+    from numba.core import errors
+    return (errors.NumbaError,)
+
+
+def kernels():
+    """
+    Numba-compiled bulk kernels, built on first use (numba is imported lazily to keep startup fast).
+    Returns None and falls back to the NumPy backend when numba cannot be loaded.
+    """
+    global _kernels
+
+    if _backend != BACKEND_NUMBA:
+        return None
+
+    if _kernels is None:
+        try:
+            from romgeo_lite import kernels_numba
+            _kernels = kernels_numba
+        except Exception as exc:
+            disable_numba(f"numba could not be loaded ({exc!r})")
+            return None
+
+    return _kernels
@@ -2,52 +2,153 @@
 # coding: utf-8
 # crs class - Get CRS parameters
 
-import pyproj as prj
 import warnings
 import math
+from typing import NamedTuple
 
 warnings.filterwarnings('ignore')
 
+
+class axis(NamedTuple):
+    """
+    Axis description, the subset of pyproj.crs.Axis used by the projection classes.
+    """
+    name: str
+    abbrev: str
+    direction: str
+    unit_name: str
+
+
+# Static parameters for the CRSs the transformations use, as produced by pyproj
+# (CRS.from_epsg(code).to_dict() and axis_info). Codes listed here never load pyproj;
+# any other code falls back to the pyproj database.
+_CRS_TABLE = {
+    3844: {
+        'projection': {'proj': 'sterea', 'lat_0': 46, 'lon_0': 25, 'k': 0.99975, 'x_0': 500000, 'y_0': 500000,
+                       'ellps': 'krass', 'units': 'm', 'no_defs': None, 'type': 'crs'},
+        'ellipsoid': 7024,
+        'axes': (axis('Northing', 'X', 'north', 'metre'), axis('Easting', 'Y', 'east', 'metre')),
+    },
+    4258: {
+        'projection': {'proj': 'longlat', 'ellps': 'GRS80', 'no_defs': None, 'type': 'crs'},
+        'ellipsoid': 7019,
+        'axes': (axis('Geodetic latitude', 'Lat', 'north', 'degree'), axis('Geodetic longitude', 'Lon', 'east', 'degree')),
+    },
+}
+
+# EPSG ellipsoid code: (proj ellps name, semi-major axis, semi-minor axis, inverse flattening)
+_ELLIPSOID_TABLE = {
+    7019: ('GRS80', 6378137.0, 6356752.314140356, 298.257222101),
+    7024: ('krass', 6378245.0, 6356863.018773047, 298.3),
+}
+
+
+def _static_ellipsoid_code(crs_code, ellipsoid_code):
+    """
+    EPSG ellipsoid code from the static tables for a (crs, ellipsoid) code pair, or None if either is unknown.
+    ellipsoid_code may be an ellipsoid code or the code of a CRS whose ellipsoid is used. Do not call directly.
+    """
+    try:
+        crs_code = int(crs_code)
+        ellipsoid_code = None if ellipsoid_code is None else int(ellipsoid_code)
+    except (TypeError, ValueError):
+        return None
+
+    if crs_code not in _CRS_TABLE:
+        return None
+    if ellipsoid_code is None:
+        return _CRS_TABLE[crs_code]['ellipsoid']
+    if ellipsoid_code in _ELLIPSOID_TABLE:
+        return ellipsoid_code
+    if ellipsoid_code in _CRS_TABLE:
+        return _CRS_TABLE[ellipsoid_code]['ellipsoid']
+
+    return None
+
+
 class crs:
-    
+
     def __init__(self, crs_code, ellipsoid_code=None):    # intialise constants
 
+        self.crs_code = crs_code
+
+        static_ellipsoid = _static_ellipsoid_code(crs_code, ellipsoid_code)
+
+        if static_ellipsoid is not None:
+            self._init_static(int(crs_code), static_ellipsoid)
+        else:
+            self._init_pyproj(crs_code, ellipsoid_code)
+
+    def _init_static(self, crs_code, ellipsoid_code):
+        """ Set parameters from the static tables, without pyproj. Do not call directly.
+        """
+        entry = _CRS_TABLE[crs_code]
+        ellps, a, b, f = _ELLIPSOID_TABLE[ellipsoid_code]
+
+        self.projection = dict(entry['projection'])
+        if ellipsoid_code != entry['ellipsoid']:
+            self.projection['ellps'] = ellps
+
+        self.ellipsoid_code = ellipsoid_code
+        self.axes = list(entry['axes'])
+
+        self.projection['a'] = a
+        self.projection['b'] = b
+        self.projection['f'] = f
+
+    def _init_pyproj(self, crs_code, ellipsoid_code):
+        """ Set parameters from the pyproj CRS database. Do not call directly.
+        """
+        import pyproj as prj
+
         if str(crs_code) not in prj.database.get_codes(auth_name='EPSG',pj_type='CRS'):
             raise NotImplementedError(f'CRS code {crs_code} unsupported')
-        
-        self.crs_code = crs_code
+
         self.crs = prj.CRS.from_epsg(crs_code)
         self.projection = self.crs.to_dict()
-        
+
         if ellipsoid_code is None:
             self.ellipsoid = self.crs.ellipsoid
-            
+
         elif str(ellipsoid_code) in prj.database.get_codes(auth_name='EPSG',pj_type='ELLIPSOID'):
             self.ellipsoid = prj.crs.Ellipsoid.from_epsg(ellipsoid_code)
             self._update_ellps()
-                
+
         elif str(ellipsoid_code) in prj.database.get_codes(auth_name='EPSG',pj_type='CRS'):
             self.ellipsoid = prj.CRS.from_epsg(ellipsoid_code).ellipsoid
             self._update_ellps()
-            
+
         else:
             raise NotImplementedError(f'Ellipsoid code {ellipsoid_code} unsupported')
-            
+
         self.ellipsoid_code = self.ellipsoid.to_json_dict()['id']['code']
         self.axes = self.crs.axis_info
 
         self.projection['a'] = self.ellipsoid.semi_major_metre
         self.projection['b'] = self.ellipsoid.semi_minor_metre
         self.projection['f'] = self.ellipsoid.inverse_flattening
-        
+
+    def __getattr__(self, name):
+        # pyproj objects of a statically described CRS, built on first access
+        if name in ('crs', 'ellipsoid'):
+            import pyproj as prj
+
+            self.crs = prj.CRS.from_epsg(self.crs_code)
+            self.ellipsoid = prj.crs.Ellipsoid.from_epsg(self.ellipsoid_code)
+            return self.__dict__[name]
+
+        raise AttributeError(name)
+
     def _update_ellps(self):
+        import pyproj as prj
+
         ellipsoid_map = prj.list.get_ellps_map()
-        
+
         ellps = None
-        
+
         for e in ellipsoid_map:
             ellipsoid_name = ellipsoid_map[e]['description'].lower()
-            
+
             if '(' in ellipsoid_name:
                 ellipsoid_name = ellipsoid_name[:ellipsoid_name.find('(')]
 
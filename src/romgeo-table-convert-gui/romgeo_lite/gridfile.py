@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# coding: utf-8
+# gridfile - SPG v2 grid container: JSON header followed by aligned raw arrays, opened with np.memmap
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+
+import numpy as np
+
+from romgeo_lite import gridfile
+
+# File layout
+#   preamble   : magic b'SPG2', format version (uint16), reserved (uint16), header length (uint64), little-endian
+#   header     : UTF-8 JSON, padded with spaces up to ALIGNMENT
+#   data       : raw C-order arrays, each starting on an ALIGNMENT boundary
+#
+# The header holds everything the pickled .spg held except the grid arrays ('params', 'metadata',
+# 'grids' with their names/sources/metadata); each grid's 'grid' entry is replaced by
+# {'dtype', 'shape', 'offset', 'nbytes'}, offset being relative to the start of the data section.
+# header['checksum'] is the SHA-256 of the whole data section.
+
+SPG2_MAGIC     = b'SPG2'
+SPG2_VERSION   = 2
+SPG2_PREAMBLE  = struct.Struct('<4sHHQ')
+SPG2_ALIGNMENT = 64
+
+
+def _align(n):
+    return (n + SPG2_ALIGNMENT - 1) // SPG2_ALIGNMENT * SPG2_ALIGNMENT
+
+
+def _json_default(value):
+    # numpy scalars/arrays that pickled params may contain
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def is_spg2(filename):
+    """
+    True if filename starts with the SPG v2 magic, False for legacy pickled .spg files.
+    """
+    with open(filename, 'rb') as f:
+        return f.read(len(SPG2_MAGIC)) == SPG2_MAGIC
+
+
+def read_header(filename):
+    """
+    Return (header dict, absolute offset of the data section) without touching the grid data.
+    """
+    with open(filename, 'rb') as f:
+        magic, version, _, header_len = SPG2_PREAMBLE.unpack(f.read(SPG2_PREAMBLE.size))
+
+        if magic != SPG2_MAGIC:
+            raise ValueError(f"{filename} is not an SPG v2 grid file")
+        if version > SPG2_VERSION:
+            raise ValueError(f"{filename}: SPG format version {version} is newer than supported ({SPG2_VERSION})")
+
+        header = json.loads(f.read(header_len).decode('utf-8'))
+
+    return header, _align(SPG2_PREAMBLE.size + header_len)
+
+
+def data_checksum(filename, data_offset, chunk_size=1 << 20):
+    """
+    SHA-256 (hex) of the data section of an SPG v2 file.
+    """
+    digest = hashlib.sha256()
+
+    with open(filename, 'rb') as f:
+        f.seek(data_offset)
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def verify_spg2(filename):
+    """
+    True if the data section matches the checksum stored in the header.
+    """
+    header, data_offset = gridfile.read_header(filename)
+
+    return gridfile.data_checksum(filename, data_offset) == header['checksum']['sha256']
+
+
+def read_spg2(filename, verify=False):
+    """
+    Open an SPG v2 file and return the same dictionary layout as a pickled .spg.
+    The grids are read-only np.memmap views, so every process that opens the file shares the OS page cache.
+    With verify=True the data checksum is checked first (reads the whole file once).
+    """
+    header, data_offset = gridfile.read_header(filename)
+
+    if verify and gridfile.data_checksum(filename, data_offset) != header['checksum']['sha256']:
+        raise ValueError(f"{filename}: grid data checksum mismatch")
+
+    data = {key: value for key, value in header.items() if key not in ('format', 'checksum')}
+    data['grids'] = {}
+
+    for name, grid in header['grids'].items():
+        layout = grid['grid']
+        data['grids'][name] = dict(grid)
+        data['grids'][name]['grid'] = np.memmap(filename, dtype=np.dtype(layout['dtype']), mode='r',
+                                                offset=data_offset + layout['offset'], shape=tuple(layout['shape']))
+
+    return data
+
+
+def write_spg2(grid_data, filename, dtype=None):
+    """
+    Write a .spg dictionary (as loaded from a pickle) to filename in SPG v2 format.
+    dtype optionally converts the grid arrays (e.g. np.float64 so Transform can map them without a copy).
+    """
+    filename = os.fspath(filename)
+
+    header = {key: value for key, value in grid_data.items() if key != 'grids'}
+    header['format'] = {'name': 'spg', 'version': SPG2_VERSION, 'alignment': SPG2_ALIGNMENT, 'byteorder': 'little'}
+    header['grids'] = {}
+
+    arrays = []
+    offset = 0
+    for name, grid in grid_data['grids'].items():
+        array = np.asarray(grid['grid'], dtype=dtype)
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+
+        header['grids'][name] = {key: value for key, value in grid.items() if key != 'grid'}
+        header['grids'][name]['grid'] = {'dtype': array.dtype.str, 'shape': list(array.shape),
+                                         'offset': offset, 'nbytes': array.nbytes}
+        arrays.append(array)
+        offset += _align(array.nbytes)
+
+    # Each array is zero-padded up to the next ALIGNMENT boundary
+    padding = [b'\0' * (_align(array.nbytes) - array.nbytes) for array in arrays]
+
+    digest = hashlib.sha256()
+    for array, pad in zip(arrays, padding):
+        digest.update(memoryview(array).cast('B'))
+        digest.update(pad)
+    header['checksum'] = {'sha256': digest.hexdigest()}
+
+    header_bytes = json.dumps(header, default=_json_default).encode('utf-8')
+    header_bytes += b' ' * (_align(SPG2_PREAMBLE.size + len(header_bytes)) - SPG2_PREAMBLE.size - len(header_bytes))
+
+    tmp_name = filename + '.tmp'
+    with open(tmp_name, 'wb') as f:
+        f.write(SPG2_PREAMBLE.pack(SPG2_MAGIC, SPG2_VERSION, 0, len(header_bytes)))
+        f.write(header_bytes)
+        for array, pad in zip(arrays, padding):
+            f.write(memoryview(array).cast('B'))
+            f.write(pad)
+    os.replace(tmp_name, filename)
+
+
+def load_grid_data(filename, verify=False):
+    """
+    Load a grid file of either format: SPG v2 (memory-mapped) or a legacy pickled .spg.
+    """
+    if gridfile.is_spg2(filename):
+        return gridfile.read_spg2(filename, verify=verify)
+
+    with open(filename, 'rb') as f:
+        return pickle.load(f)
+
+
+def convert_spg(source, destination, dtype=np.float64):
+    """
+    Convert a legacy pickled .spg to SPG v2. Returns the destination path.
+    The grids are stored as float64 by default, matching Transform's default grid_dtype.
+    """
+    gridfile.write_spg2(gridfile.load_grid_data(source), destination, dtype=dtype)
+
+    return destination
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert a pickled .spg grid to the memory-mapped SPG v2 format.")
+    parser.add_argument('source')
+    parser.add_argument('destination')
+    parser.add_argument('--float32', action='store_true', help="store the grids as float32 (half the size)")
+    args = parser.parse_args()
+
+    convert_spg(args.source, args.destination, dtype=np.float32 if args.float32 else np.float64)
+    print(f"{args.destination}: checksum {'ok' if verify_spg2(args.destination) else 'FAILED'}")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# coding: utf-8
+# kernels_numba - Numba compiled bulk kernels, loaded by romgeo_lite.backend when numba is installed
+
+import math
+
+import numba
+import numpy as np
+from numba.extending import register_jitable
+
+from romgeo_lite import projections
+from romgeo_lite import transformations
+
+# The scalar kernels are plain Python; registering them lets the compiled loops below call them as-is.
+for fn in (projections._geodetic_to_stereographic,
+           projections._stereographic_to_geodetic_iter,
+           projections._tm_meridarc,
+           projections._tm_latlon2en,
+           transformations._helmert_2d):
+    register_jitable(fn)
+
+SPLINE_MATRIX = np.ascontiguousarray(transformations._SPLINE_MATRIX)
+INTERP_LINEAR  = transformations.INTERP_LINEAR
+INTERP_BICUBIC = transformations.INTERP_BICUBIC
+
+
+@numba.njit(cache=True, error_model='numpy')
+def _bicubic(x, y, minx, miny, stepx, stepy, grid, band):
+    # Same cell selection and bounds check as _bicubic_cells; NaN input fails the check
+    offset_x = abs((x - minx) / stepx)
+    offset_y = abs((y - miny) / stepy)
+
+    if not (offset_x < grid.shape[-1] - 3 and offset_y < grid.shape[-2] - 3):
+        return np.nan
+
+    cell_x = int(offset_x)
+    cell_y = int(offset_y)
+
+    # {relative coordinate of point X:}
+    xk = (x - (minx + cell_x * stepx)) / stepx
+    yk = (y - (miny + cell_y * stepy)) / stepy
+
+    shift_value = 0.0
+    for k in range(16):
+        ff = yk ** (k // 4) * xk ** (k % 4)
+        for m in range(16):
+            shift_value += ff * SPLINE_MATRIX[k, m] * grid[band, cell_y - 1 + m // 4, cell_x - 1 + m % 4]
+
+    return shift_value
+
+
+@numba.njit(cache=True, error_model='numpy')
+def _linear(x, y, minx, miny, stepx, stepy, grid, band):
+    # Same cell selection and bounds check as _doLinearInterpolation_vec
+    offset_x = (x - minx) / stepx
+    offset_y = (y - miny) / stepy
+
+    if not (0 <= offset_x <= grid.shape[-1] - 1 and 0 <= offset_y <= grid.shape[-2] - 1):
+        return np.nan
+
+    cell_x = min(int(offset_x), grid.shape[-1] - 2)
+    cell_y = min(int(offset_y), grid.shape[-2] - 2)
+
+    xk = offset_x - cell_x
+    yk = offset_y - cell_y
+
+    return ((1 - xk) * (1 - yk) * grid[band, cell_y, cell_x] + xk * (1 - yk) * grid[band, cell_y, cell_x + 1] +
+            (1 - xk) * yk * grid[band, cell_y + 1, cell_x] + xk * yk * grid[band, cell_y + 1, cell_x + 1])
+
+
+@numba.njit(cache=True, error_model='numpy')
+def _colocate(x, y, minx, miny, stepx, stepy, grid, band):
+    if not (math.isfinite(x) and math.isfinite(y)):
+        return np.nan
+
+    j = min(max(int(np.rint((x - minx) / stepx)), 0), grid.shape[-1] - 1)  # column index
+    i = min(max(int(np.rint((y - miny) / stepy)), 0), grid.shape[-2] - 1)  # row index
+
+    return grid[band, i, j]
+
+
+@numba.njit(cache=True, error_model='numpy')
+def _interp(code, x, y, minx, miny, stepx, stepy, grid, band):
+    if code == INTERP_BICUBIC:
+        return _bicubic(x, y, minx, miny, stepx, stepy, grid, band)
+    if code == INTERP_LINEAR:
+        return _linear(x, y, minx, miny, stepx, stepy, grid, band)
+    return _colocate(x, y, minx, miny, stepx, stepy, grid, band)
+
+
+@numba.njit(parallel=True, cache=True, error_model='numpy')
+def bulk_etrs_to_st70(lat, lon, z, e, n, height, sc, tE, tN, dm, Rz,
+                      shifts_grid, mine, minn, stepe, stepn,
+                      heights_grid, minla, minphi, stepla, stepphi, interpolations):
+    for i in numba.prange(lat.shape[0]):
+        en = projections._geodetic_to_stereographic(lat[i], lon[i], sc)
+        h = transformations._helmert_2d(en[0], en[1], tE, tN, dm, Rz)
+
+        e_shift = _interp(interpolations[0], h[0], h[1], mine, minn, stepe, stepn, shifts_grid, 0)
+        n_shift = _interp(interpolations[0], h[0], h[1], mine, minn, stepe, stepn, shifts_grid, 1)
+        h_shift = _interp(interpolations[1], lon[i], lat[i], minla, minphi, stepla, stepphi, heights_grid, 0)
+
+        e[i] = h[0] + e_shift
+        n[i] = h[1] + n_shift
+        height[i] = z[i] - h_shift
+
+
+@numba.njit(parallel=True, cache=True, error_model='numpy')
+def bulk_st70_to_etrs(e, n, height, lat, lon, z, sc, tE, tN, dm, Rz,
+                      shifts_grid, mine, minn, stepe, stepn,
+                      heights_grid, minla, minphi, stepla, stepphi, interpolations,
+                      iterations, converged):
+    for i in numba.prange(e.shape[0]):
+        e_shift = _interp(interpolations[0], e[i], n[i], mine, minn, stepe, stepn, shifts_grid, 0)
+        n_shift = _interp(interpolations[0], e[i], n[i], mine, minn, stepe, stepn, shifts_grid, 1)
+
+        h = transformations._helmert_2d(e[i] - e_shift, n[i] - n_shift, tE, tN, dm, Rz)
+
+        latlon = projections._stereographic_to_geodetic_iter(h[0], h[1], sc)
+
+        h_shift = _interp(interpolations[1], latlon[1], latlon[0], minla, minphi, stepla, stepphi, heights_grid, 0)
+
+        lat[i] = latlon[0]
+        lon[i] = latlon[1]
+        z[i] = height[i] + h_shift
+        iterations[i] = latlon[2]
+        converged[i] = latlon[3]
+
+
+@numba.njit(parallel=True, cache=True, error_model='numpy')
+def bulk_st70_to_utm(e, n, height, utm_e, utm_n, z, sc, tE, tN, dm, Rz,
+                     shifts_grid, mine, minn, stepe, stepn,
+                     heights_grid, minla, minphi, stepla, stepphi, zone, interpolations,
+                     iterations, converged):
+    lon0 = math.radians(zone * 6.0 - 183.0)
+    for i in numba.prange(e.shape[0]):
+        e_shift = _interp(interpolations[0], e[i], n[i], mine, minn, stepe, stepn, shifts_grid, 0)
+        n_shift = _interp(interpolations[0], e[i], n[i], mine, minn, stepe, stepn, shifts_grid, 1)
+
+        h = transformations._helmert_2d(e[i] - e_shift, n[i] - n_shift, tE, tN, dm, Rz)
+
+        latlon = projections._stereographic_to_geodetic_iter(h[0], h[1], sc)
+
+        h_shift = _interp(interpolations[1], latlon[1], latlon[0], minla, minphi, stepla, stepphi, heights_grid, 0)
+
+        utm = projections._tm_latlon2en(latlon[0], latlon[1], 500000.0, 0.0, 0.0, lon0, 0.9996, sc.a, sc.b)
+
+        utm_e[i] = utm[0]
+        utm_n[i] = utm[1]
+        z[i] = height[i] + h_shift
+        iterations[i] = latlon[2]
+        converged[i] = latlon[3]
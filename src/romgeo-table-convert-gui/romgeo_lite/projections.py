@@ -5,6 +5,7 @@
 
 import numpy as np
 import math
+from typing import NamedTuple
 
 from romgeo_lite import crs
 from romgeo_lite import projections
@@ -60,9 +61,33 @@ def _geocentric_to_geodetic(x, y, z, a, b):
     return math.degrees(phi), math.degrees(lda), h
 
 
-def _geodetic_to_stereographic(lat, lon, E0, N0, PHI0, LAMBDA0, k0, a, b):
-    fi = math.radians(lat)
-    la = math.radians(lon)
+class stereo_constants(NamedTuple):
+    """
+    Immutable Hristow oblique stereographic constants. They depend only on the ellipsoid and the
+    projection origin, so build them once per crs/Transform with _stereographic_constants().
+    """
+    E0: float
+    N0: float
+    PHI0: float
+    LAMBDA0: float
+    k0: float
+    a: float
+    b: float
+    ep: float       # first eccentricity
+    raza: float     # radius of the conformal sphere
+    n: float
+    c: float
+    hi0: float      # conformal latitude of the origin
+    sin_hi0: float
+    cos_hi0: float
+    g: float
+    h: float
+
+
+def _stereographic_constants(E0, N0, PHI0, LAMBDA0, k0, a, b):
+    """
+    Compute the Hristow oblique stereographic constants for an ellipsoid and origin. Do not call directly.
+    """
     ep = math.sqrt((a**2 - b**2) / a**2)
     w = math.sqrt(1 - ep**2 * math.sin(PHI0)**2)
     raza = (a * (1 - ep**2)) / (w**3)
@@ -75,49 +100,48 @@ def _geodetic_to_stereographic(lat, lon, E0, N0, PHI0, LAMBDA0, k0, a, b):
     w2 = c * w1
     hi0 = (w2 - 1) / (w2 + 1)
     hi0 = math.atan(hi0 / math.sqrt(1 - hi0**2))
+    g = 2 * raza * k0 * math.tan(math.pi / 4 - hi0 / 2)
+    h = 4 * raza * k0 * math.tan(hi0) + g
+
+    return stereo_constants(float(E0), float(N0), float(PHI0), float(LAMBDA0), float(k0), float(a), float(b),
+                            ep, raza, n, c, hi0, math.sin(hi0), math.cos(hi0), g, h)
+
+
+def _geodetic_to_stereographic(lat, lon, sc):
+    fi = math.radians(lat)
+    la = math.radians(lon)
     sa = (1 + math.sin(fi)) / (1 - math.sin(fi))
-    sb = (1 - ep * math.sin(fi)) / (1 + ep * math.sin(fi))
-    w = c * math.exp(n * math.log(sa * math.exp(ep * math.log(sb))))
+    sb = (1 - sc.ep * math.sin(fi)) / (1 + sc.ep * math.sin(fi))
+    w = sc.c * math.exp(sc.n * math.log(sa * math.exp(sc.ep * math.log(sb))))
     hi = (w - 1) / (w + 1)
     hi = math.atan(hi / math.sqrt(1 - hi**2))
-    lam = n * (la - LAMBDA0) + LAMBDA0
-    beta = 1 + math.sin(hi) * math.sin(hi0) + math.cos(hi) * math.cos(hi0) * math.cos(lam - LAMBDA0)
-    east = 2 * raza * k0 * math.cos(hi) * math.sin(lam - LAMBDA0) / beta
-    north = 2 * raza * k0 * (math.cos(hi0) * math.sin(hi) - math.sin(hi0) * math.cos(hi) * math.cos(lam-LAMBDA0)) / beta
-    north = north + N0
-    east = east + E0
+    lam = sc.n * (la - sc.LAMBDA0) + sc.LAMBDA0
+    beta = 1 + math.sin(hi) * sc.sin_hi0 + math.cos(hi) * sc.cos_hi0 * math.cos(lam - sc.LAMBDA0)
+    east = 2 * sc.raza * sc.k0 * math.cos(hi) * math.sin(lam - sc.LAMBDA0) / beta
+    north = 2 * sc.raza * sc.k0 * (sc.cos_hi0 * math.sin(hi) - sc.sin_hi0 * math.cos(hi) * math.cos(lam - sc.LAMBDA0)) / beta
+    north = north + sc.N0
+    east = east + sc.E0
 
     return east, north
 
 
-def _stereographic_to_geodetic(east, north, E0, N0, PHI0, LAMBDA0, k0, a, b):
-    fi = 0
-    la = 0
-    ep = math.sqrt((a**2 - b**2) / a**2)
-    w = math.sqrt(1 - ep**2 * math.sin(PHI0)**2)
-    raza = (a * (1 - ep**2)) / (w**3)
-    raza = math.sqrt(raza * a / w)
-    n = (ep**2 * math.cos(PHI0)**4) / (1 - ep**2)
-    n = math.sqrt(1 + n)
-    s1 = (1 + math.sin(PHI0)) / (1 - math.sin(PHI0))
-    s2 = (1 - ep * math.sin(PHI0)) / (1 + ep * math.sin(PHI0))
-    w1 = math.exp(n * math.log(s1 * math.exp(ep * math.log(s2))))
-    c = ((n + math.sin(PHI0)) * (1 - (w1 - 1) / (w1 + 1))) / ((n - math.sin(PHI0)) * (1 + (w1 - 1) / (w1 + 1)))
-    w2 = c * w1
-    hi0 = (w2 - 1) / (w2 + 1)
-    hi0 = math.atan(hi0 / math.sqrt(1 - hi0**2))
-    g = 2 * raza * k0 * math.tan(math.pi / 4 - hi0 / 2)
-    h = 4 * raza * k0 * math.tan(hi0) + g
-    ii = math.atan((east - E0) / (h + (north - N0)))
-    j = math.atan((east - E0) / (g - (north - N0))) - ii
-    lam = j + 2 * ii + LAMBDA0
-    la = LAMBDA0 + (lam - LAMBDA0) / n
-    hi = hi0 +2 * math.atan((north - N0 - (east - E0) * math.tan(j / 2)) / (2 * raza * k0))
-    North = north
-    East = east
-    fn = N0
-    fe = E0
-    csi = (0.5 * math.log((1 + math.sin(hi)) / (c * (1 - math.sin(hi))))) / n
+def _stereographic_to_geodetic(east, north, sc):
+    lat, lon, _, _ = projections._stereographic_to_geodetic_iter(east, north, sc)
+
+    return lat, lon
+
+
+def _stereographic_to_geodetic_iter(east, north, sc):
+    """
+    _stereographic_to_geodetic that also returns the iteration count and convergence flag. Do not call directly.
+    """
+    ep = sc.ep
+    ii = math.atan((east - sc.E0) / (sc.h + (north - sc.N0)))
+    j = math.atan((east - sc.E0) / (sc.g - (north - sc.N0))) - ii
+    lam = j + 2 * ii + sc.LAMBDA0
+    la = sc.LAMBDA0 + (lam - sc.LAMBDA0) / sc.n
+    hi = sc.hi0 + 2 * math.atan((north - sc.N0 - (east - sc.E0) * math.tan(j / 2)) / (2 * sc.raza * sc.k0))
+    csi = (0.5 * math.log((1 + math.sin(hi)) / (sc.c * (1 - math.sin(hi))))) / sc.n
     fi = 2 * math.atan(math.exp(csi)) - math.pi / 2
     i = 0
     tol = 1e-9
@@ -132,7 +156,89 @@ def _stereographic_to_geodetic(east, north, E0, N0, PHI0, LAMBDA0, k0, a, b):
         fi = fi - (csii - csi) * math.cos(fi) * (1 - ep**2 * math.sin(fi)**2) / (1-ep**2)
         dif = abs(math.degrees(fi) - math.degrees(fic)) * 3600
 
-    return math.degrees(fi), math.degrees(la)
+    return math.degrees(fi), math.degrees(la), i, dif <= tol
+
+
+def _geodetic_to_stereographic_vec(lat, lon, sc):
+    """
+    Array version of _geodetic_to_stereographic. Do not call directly.
+    lat, lon are NumPy arrays in decimal degrees; returns (east, north) arrays.
+    """
+    fi = np.radians(lat)
+    la = np.radians(lon)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sa = (1 + np.sin(fi)) / (1 - np.sin(fi))
+        sb = (1 - sc.ep * np.sin(fi)) / (1 + sc.ep * np.sin(fi))
+        w = sc.c * np.exp(sc.n * np.log(sa * np.exp(sc.ep * np.log(sb))))
+        hi = (w - 1) / (w + 1)
+        hi = np.arctan(hi / np.sqrt(1 - hi**2))
+        lam = sc.n * (la - sc.LAMBDA0) + sc.LAMBDA0
+        beta = 1 + np.sin(hi) * sc.sin_hi0 + np.cos(hi) * sc.cos_hi0 * np.cos(lam - sc.LAMBDA0)
+        east = 2 * sc.raza * sc.k0 * np.cos(hi) * np.sin(lam - sc.LAMBDA0) / beta
+        north = 2 * sc.raza * sc.k0 * (sc.cos_hi0 * np.sin(hi) - sc.sin_hi0 * np.cos(hi) * np.cos(lam - sc.LAMBDA0)) / beta
+
+    return east + sc.E0, north + sc.N0
+
+
+def _stereographic_to_geodetic_vec(east, north, sc):
+    """
+    Array version of _stereographic_to_geodetic. Do not call directly.
+    east, north are NumPy arrays; returns (lat, lon) arrays in decimal degrees.
+    """
+    lat, lon, _, _ = projections._stereographic_to_geodetic_masked(east, north, sc)
+
+    return lat, lon
+
+
+def _stereographic_to_geodetic_masked(east, north, sc, tol=1e-9, max_iter=100):
+    """
+    Array version of _stereographic_to_geodetic with per-point convergence. Do not call directly.
+    The latitude iteration only updates the points that are still above tolerance (a shrinking
+    active mask) and stops once every point has converged or max_iter is reached, so each point
+    gets the same number of iterations as the scalar loop.
+    Returns (lat, lon, iterations, converged); iterations is the per-point iteration count and
+    converged is False for points that hit max_iter, or produced NaN, without meeting tol.
+    """
+    ep = sc.ep
+    east = np.asarray(east, dtype=np.float64)
+    north = np.asarray(north, dtype=np.float64)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ii = np.arctan((east - sc.E0) / (sc.h + (north - sc.N0)))
+        j = np.arctan((east - sc.E0) / (sc.g - (north - sc.N0))) - ii
+        lam = j + 2 * ii + sc.LAMBDA0
+        la = sc.LAMBDA0 + (lam - sc.LAMBDA0) / sc.n
+        hi = sc.hi0 + 2 * np.arctan((north - sc.N0 - (east - sc.E0) * np.tan(j / 2)) / (2 * sc.raza * sc.k0))
+        csi = (0.5 * np.log((1 + np.sin(hi)) / (sc.c * (1 - np.sin(hi))))) / sc.n
+        fi = np.atleast_1d(2 * np.arctan(np.exp(csi)) - math.pi / 2)
+        csi = np.broadcast_to(csi, fi.shape).ravel()
+        fi = fi.ravel().copy()
+
+        iterations = np.zeros(fi.shape, dtype=np.int32)
+        converged = np.zeros(fi.shape, dtype=np.bool_)
+        active = np.arange(fi.shape[0])
+
+        i = 0
+        while active.size and (i < max_iter):
+            i = i + 1
+            fa = fi[active]
+            csii = np.log(np.tan(fa / 2 + math.pi / 4) * np.exp((ep / 2) *
+                   np.log((1 - ep * np.sin(fa)) / (1 + ep * np.sin(fa)))))
+            fn = fa - (csii - csi[active]) * np.cos(fa) * (1 - ep**2 * np.sin(fa)**2) / (1 - ep**2)
+            dif = np.abs(np.degrees(fn) - np.degrees(fa)) * 3600
+
+            fi[active] = fn
+            iterations[active] = i
+
+            # Same exit test as the scalar loop: a point leaves once dif > tol is False (NaN included)
+            done = ~(dif > tol)
+            converged[active[done]] = dif[done] <= tol
+            active = active[~done]
+
+    shape = np.shape(la)
+
+    return np.degrees(fi).reshape(shape), np.degrees(la), iterations.reshape(shape), converged.reshape(shape)
     
 # Numba JIT function to compute meridional arc
 
@@ -213,6 +319,44 @@ def _tm_latlon2en(LAT, LON, E0, N0, PHI0, LAMBDA0, F0, a, b):
 
     return E, N
 
+def _tm_meridarc_vec(bF0, n, PHI0, phi):
+    """ Array version of _tm_meridarc. Do not call directly.
+    """
+    m1 = (1.0 + n + ((5.0 / 4.0) * (pow(n,2))) + ((5.0 / 4.0) * (pow(n,3)))) * (phi - PHI0)
+    m2 = ((3.0 * n) + (3.0 * (pow(n,2))) + ((21.0 / 8.0) * (pow(n,3)))) * (np.sin(phi - PHI0)) * (np.cos(phi + PHI0))
+    m3 = (((15.0 / 8.0) * (pow(n,2))) + ((15.0 / 8.0) * (pow(n,3)))) * (np.sin(2 * (phi - PHI0))) * (np.cos(2 * (phi + PHI0)))
+    m4 = ((35.0 / 24.0) * (pow(n,3))) * (np.sin(3 * (phi - PHI0))) * (np.cos(3 * (phi + PHI0)))
+    m = bF0 * (m1 - m2 + m3 - m4)
+    return m
+
+def _tm_latlon2en_vec(LAT, LON, E0, N0, PHI0, LAMBDA0, F0, a, b):
+    """ Array version of _tm_latlon2en. Do not call directly.
+    """
+    bF0 = b * F0
+    e_sqr = (a**2 - b**2) / a**2
+    n = (a - b) / (a + b)
+    lambda1 = np.radians(LON)
+    phi1 = np.radians(LAT)
+    sinphi = np.sin(phi1)
+    cosphi = np.cos(phi1)
+    tanphi = np.tan(phi1)
+    nu = a * F0 * np.power(1 - (e_sqr * sinphi**2), -0.5)
+    rho = a * F0 * (1 - e_sqr) * np.power(1 - (e_sqr * sinphi**2), -1.5)
+    eta_sqr = (nu / rho) - 1
+    m = projections._tm_meridarc_vec(bF0, n, PHI0, phi1)
+    I = m + N0
+    II = (nu / 2.0) * sinphi * cosphi
+    III = (nu / 24.0) * (sinphi * cosphi**3) * (5 - tanphi**2 + (9 * eta_sqr))
+    IIIA = (nu / 720.0) * sinphi * cosphi**5 * (61 - (58 * tanphi**2) + tanphi**4)
+    IV = nu * cosphi
+    V = (nu / 6) * cosphi**3 * ((nu / rho) - tanphi**2)
+    VI = (nu / 120) * cosphi**5 * (5 - (18 * tanphi**2) + tanphi**4 + (14 * eta_sqr) - (58 * tanphi**2 * eta_sqr))
+    lambda2 = lambda1 - LAMBDA0
+    N = I + (II * lambda2**2) + (III * lambda2**4) + (IIIA * lambda2**6)
+    E = E0 + (IV * lambda2) + (V * lambda2**3) + (VI * lambda2**5)
+
+    return E, N
+
 class geocentric:
 
     def __init__(self, crs_code, ellipsoid_code=None):    # intialise constants
@@ -294,27 +438,29 @@ class stereographic:
 
         self.PHI0 = math.radians(self.crs.projection['lat_0'])
         self.LAMBDA0 = math.radians(self.crs.projection['lon_0'])
+
+        self.constants = projections._stereographic_constants(self.E0, self.N0, self.PHI0, self.LAMBDA0, self.k0, self.a, self.b)
         
     @staticmethod
 
-    def _bulk_geodetic_to_stereographic(lat, lon, e, n, E0, N0, PHI0, LAMBDA0, k0, a, b):
+    def _bulk_geodetic_to_stereographic(lat, lon, e, n, sc):
         """ Numba CPU Kernel to perform bulk stereographic projections from ETRS89 to Stereo70. Do not call directly.
         """
         for i in range(lat.shape[0]):
-            e[i], n[i] = projections._geodetic_to_stereographic(lat[i], lon[i], E0, N0, PHI0, LAMBDA0, k0, a, b)
+            e[i], n[i] = projections._geodetic_to_stereographic(lat[i], lon[i], sc)
             
     @staticmethod
-    def _bulk_stereographic_to_geodetic(e, n, lat, lon, E0, N0, PHI0, LAMBDA0, k0, a, b):
+    def _bulk_stereographic_to_geodetic(e, n, lat, lon, sc):
         """ Numba CPU Kernel to perform bulk sprojections from Stereo70 to ETRS89. Do not call directly.
         """
         for i in range(e.shape[0]):
-            lat[i], lon[i] = projections._stereographic_to_geodetic(e[i], n[i], E0, N0, PHI0, LAMBDA0, k0, a, b)  
+            lat[i], lon[i] = projections._stereographic_to_geodetic(e[i], n[i], sc)
         
     def geodetic_to_stereographic(self, lat, lon, e, n):
-        self._bulk_geodetic_to_stereographic(lat, lon, e, n, self.E0, self.N0, self.PHI0, self.LAMBDA0, self.k0, self.a, self.b)
+        self._bulk_geodetic_to_stereographic(lat, lon, e, n, self.constants)
         
     def stereographic_to_geodetic(self, e, n, lat, lon):
-        self._bulk_stereographic_to_geodetic(e, n, lat, lon, self.E0, self.N0, self.PHI0, self.LAMBDA0, self.k0, self.a, self.b)
+        self._bulk_stereographic_to_geodetic(e, n, lat, lon, self.constants)
         
 class mercator:
     """
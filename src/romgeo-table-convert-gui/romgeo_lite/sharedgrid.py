@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# coding: utf-8
+# sharedgrid - Publish the shift/geoid grids once in shared memory for process-pool workers
+
+import os
+
+import numpy as np
+from multiprocessing import shared_memory
+
+from romgeo_lite import gridfile
+from romgeo_lite import sharedgrid
+from romgeo_lite import transformations
+
+# SharedMemory handles attached by this (worker) process; kept alive for the lifetime of its Transform.
+_attached = []
+
+
+class SharedGrids:
+    """
+    Grids of one .spg file copied once into multiprocessing.shared_memory segments.
+
+    descriptor is a small picklable dict (segment names, dtypes, shapes and the grid parameters) to pass
+    to worker processes, e.g. as ProcessPoolExecutor(initializer=sharedgrid.attach_worker, initargs=(descriptor,)).
+    The creating process owns the segments: call release() (or use it as a context manager) when the job
+    ends, also on error. If the owner crashes, the OS (Windows) or the multiprocessing resource tracker
+    (POSIX) frees them.
+    """
+
+    def __init__(self, filename, grid_dtype=np.float64):
+        path = os.path.realpath(os.fspath(filename))
+        fingerprint = transformations._grid_fingerprint(path)
+        grid_data = gridfile.load_grid_data(path)
+
+        self.segments = []
+        self.descriptor = {
+            'filename': path,
+            'fingerprint': fingerprint,
+            'grid_dtype': np.dtype(grid_dtype).str,
+            'data': {key: value for key, value in grid_data.items() if key != 'grids'},
+            'grids': {},
+        }
+
+        try:
+            for name, grid in grid_data['grids'].items():
+                array = np.ascontiguousarray(grid['grid'], dtype=grid_dtype)
+
+                shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self.segments.append(shm)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+
+                self.descriptor['grids'][name] = {key: value for key, value in grid.items() if key != 'grid'}
+                self.descriptor['grids'][name]['grid'] = {'shm': shm.name, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+        except Exception:
+            self.release()
+            raise
+
+    @property
+    def nbytes(self):
+        return sum(shm.size for shm in self.segments)
+
+    def release(self):
+        """
+        Close and unlink the segments. Safe to call more than once.
+        """
+        while self.segments:
+            shm = self.segments.pop()
+            try:
+                shm.close()
+                shm.unlink()
+            except FileNotFoundError:
+                pass  # already unlinked
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def attach(descriptor):
+    """
+    Rebuild the .spg dictionary of a SharedGrids descriptor with the grids viewing the shared segments (no copy).
+    The SharedMemory handles are kept in this process until detach().
+    """
+    grid_data = dict(descriptor['data'])
+    grid_data['grids'] = {}
+
+    for name, grid in descriptor['grids'].items():
+        layout = grid['grid']
+        shm = shared_memory.SharedMemory(name=layout['shm'])
+        _attached.append(shm)
+
+        grid_data['grids'][name] = dict(grid)
+        grid_data['grids'][name]['grid'] = np.ndarray(tuple(layout['shape']), dtype=np.dtype(layout['dtype']), buffer=shm.buf)
+
+    return grid_data
+
+
+def attach_worker(descriptor):
+    """
+    Process-pool initializer: build a Transform over the shared grids and put it in the process-wide
+    Transform cache, so get_transform(<grid file>) in the worker returns it without reading the file.
+    """
+    grid_data = sharedgrid.attach(descriptor)
+
+    t = transformations.Transform(descriptor['filename'], grid_data=grid_data, grid_dtype=np.dtype(descriptor['grid_dtype']))
+    transformations._cache_transform(descriptor['filename'], tuple(descriptor['fingerprint']), t)
+
+
+def detach():
+    """
+    Drop this process' cached Transforms and close its handles on shared segments.
+    """
+    transformations.clear_transform_cache()
+
+    while _attached:
+        shm = _attached.pop()
+        try:
+            shm.close()
+        except BufferError:
+            pass  # still referenced by live arrays, released at process exit
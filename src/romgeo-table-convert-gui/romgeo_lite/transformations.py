@@ -7,11 +7,23 @@ import math
 import os
 import pickle
 import glob
+import threading
 
 from romgeo_lite import crs
 from romgeo_lite import projections
 from romgeo_lite import transformations
-
+from romgeo_lite import backend
+from romgeo_lite import gridfile
+
+# Interpolation tiers, fastest to most accurate. The grid's params.interpolation picks the default;
+# Transform.etrs_to_st70/st70_to_etrs/st70_to_utm accept a per-job override (see job_interpolations).
+#
+# Measured difference against INTERP_BICUBIC (2000 points, 5 km shift grid, 2' geoid grid, rough
+# synthetic surfaces with 5% node noise, i.e. a pessimistic case):
+#   INTERP_LINEAR    horizontal mean 0.013 m, p99 0.033 m, max 0.064 m; height mean 0.12 m, p99 0.40 m, max 0.63 m
+#   INTERP_COLOCATE  horizontal mean 0.052 m, p99 0.149 m, max 0.224 m; height mean 0.50 m, p99 1.81 m, max 2.42 m
+# Bilinear error scales with step**2 times the grid curvature, so smoother production grids come out lower;
+# use INTERP_LINEAR for previews and QA runs, not for published coordinates.
 INTERP_COLOCATE = 0
 INTERP_LINEAR   = 1
 INTERP_BICUBIC  = 2
@@ -20,13 +32,26 @@ def select_interp(code):
     if code == INTERP_COLOCATE:
         return transformations._doColocate
     elif code == INTERP_LINEAR:
-        raise NotImplementedError(f"LinearInterpolation not implemented.")
-        # return transformations._doLinearInterpolation
+        return transformations._doLinearInterpolation
     elif code == INTERP_BICUBIC:
         return transformations._doBSInterpolation
     else:
         raise ValueError(f"Unknown interpolation code: {code}")
 
+def select_interp_vec(code, table=None):
+    # table: optional precomputed bicubic coefficient table (see _bicubic_coefficients).
+    # When given, the returned interpolator reads the table and ignores its grid argument.
+    if code == INTERP_COLOCATE:
+        return transformations._doColocate_vec
+    elif code == INTERP_LINEAR:
+        return transformations._doLinearInterpolation_vec
+    elif code == INTERP_BICUBIC:
+        if table is None:
+            return transformations._doBSInterpolation_vec
+        return lambda x, y, minx, miny, stepx, stepy, grid: transformations._doBSInterpolation_table(x, y, minx, miny, stepx, stepy, table)
+    else:
+        raise ValueError(f"Unknown interpolation code: {code}")
+
 
 def _spline_params(xk, yk):
     # Return parameters of bicubic spline surface
@@ -51,47 +76,31 @@ def _spline_params(xk, yk):
 
 def _spline_grid(grid, cell_x, cell_y):
     # Return the 16 unknown coefficients of the interpolated surface
+    # grid may be 2-D (rows, cols) or 3-D (bands, rows, cols); nodes are then per-band arrays
     return (0.0,                                  # Dummy parameter
-            grid[cell_y - 1, cell_x],             # Parameter 1
-            grid[cell_y - 1, cell_x + 1],         # Parameter 2
-            grid[cell_y - 1, cell_x + 2],         # Parameter 3
-            grid[cell_y - 1, cell_x + 3],         # Parameter 4
-            grid[cell_y, cell_x],                 # Parameter 5
-            grid[cell_y, cell_x + 1],             # Parameter 6
-            grid[cell_y, cell_x + 2],             # Parameter 7
-            grid[cell_y, cell_x + 3],             # Parameter 8
-            grid[cell_y + 1, cell_x],             # Parameter 9
-            grid[cell_y + 1, cell_x + 1],         # Parameter 10
-            grid[cell_y + 1, cell_x + 2],         # Parameter 11
-            grid[cell_y + 1, cell_x + 3],         # Parameter 12
-            grid[cell_y + 2, cell_x],             # Parameter 13
-            grid[cell_y + 2, cell_x + 1],         # Parameter 14
-            grid[cell_y + 2, cell_x + 2],         # Parameter 15
-            grid[cell_y + 2, cell_x + 3])         # Parameter 16
-
-
-def _doBSInterpolation(x, y, minx, miny, stepx, stepy, grid):
-
-    offset_x = abs((x - minx) / stepx)
-    offset_y = abs((y - miny) / stepy)
-    cell_x = int(offset_x)
-    cell_y = int(offset_y)
-
-    xk = minx + cell_x * stepx # {lambda of point 6 / East of point 6}
-    yk = miny + cell_y * stepy # {phi of point 6 / North of point 6}
-
-    # {relative coordinate of point X:}
-    xk = (x - xk) / stepx
-    yk = (y - yk) / stepy
-
-    if cell_x < -1 or cell_x + 3 >= grid.shape[1] or cell_y < -1 or cell_y + 3 >= grid.shape[0]:
-        return np.nan
-
-    # Slice grid to coordinates
-    az = transformations._spline_grid(grid, cell_x-1, cell_y)
-
-    # {Parameters of bicubic spline surface}
-    ff = transformations._spline_params(xk, yk)
+            grid[..., cell_y - 1, cell_x],             # Parameter 1
+            grid[..., cell_y - 1, cell_x + 1],         # Parameter 2
+            grid[..., cell_y - 1, cell_x + 2],         # Parameter 3
+            grid[..., cell_y - 1, cell_x + 3],         # Parameter 4
+            grid[..., cell_y, cell_x],                 # Parameter 5
+            grid[..., cell_y, cell_x + 1],             # Parameter 6
+            grid[..., cell_y, cell_x + 2],             # Parameter 7
+            grid[..., cell_y, cell_x + 3],             # Parameter 8
+            grid[..., cell_y + 1, cell_x],             # Parameter 9
+            grid[..., cell_y + 1, cell_x + 1],         # Parameter 10
+            grid[..., cell_y + 1, cell_x + 2],         # Parameter 11
+            grid[..., cell_y + 1, cell_x + 3],         # Parameter 12
+            grid[..., cell_y + 2, cell_x],             # Parameter 13
+            grid[..., cell_y + 2, cell_x + 1],         # Parameter 14
+            grid[..., cell_y + 2, cell_x + 2],         # Parameter 15
+            grid[..., cell_y + 2, cell_x + 3])         # Parameter 16
+
+
+def _bicubic_surface(az, ff):
+    """
+    Evaluate the bicubic spline surface from the 16 grid nodes (az) and the
+    16 spline parameters (ff). Works on floats and on NumPy arrays alike. Do not call directly.
+    """
 
     # Linear coefficients
     cf_1 = az[6]
@@ -142,6 +151,57 @@ def _doBSInterpolation(x, y, minx, miny, stepx, stepy, grid):
 
     return shift_value
 
+def _doBSInterpolation(x, y, minx, miny, stepx, stepy, grid):
+    """
+    Bicubic spline interpolation of a single point. grid is 2-D (rows, cols) or 3-D (bands, rows, cols);
+    for a 3-D grid the spline parameters are computed once and one value per band is returned.
+    """
+
+    offset_x = abs((x - minx) / stepx)
+    offset_y = abs((y - miny) / stepy)
+    cell_x = int(offset_x)
+    cell_y = int(offset_y)
+
+    xk = minx + cell_x * stepx # {lambda of point 6 / East of point 6}
+    yk = miny + cell_y * stepy # {phi of point 6 / North of point 6}
+
+    # {relative coordinate of point X:}
+    xk = (x - xk) / stepx
+    yk = (y - yk) / stepy
+
+    if cell_x < -1 or cell_x + 3 >= grid.shape[-1] or cell_y < -1 or cell_y + 3 >= grid.shape[-2]:
+        return np.nan if grid.ndim == 2 else np.full(grid.shape[0], np.nan)
+
+    # Slice grid to coordinates
+    az = transformations._spline_grid(grid, cell_x-1, cell_y)
+
+    # {Parameters of bicubic spline surface}
+    ff = transformations._spline_params(xk, yk)
+
+    return transformations._bicubic_surface(az, ff)
+
+def _doLinearInterpolation(x, y, minx, miny, stepx, stepy, grid):
+    """
+    Bilinear interpolation of a single point from the 4 surrounding grid nodes.
+    grid is 2-D (rows, cols) or 3-D (bands, rows, cols); for a 3-D grid one value per band is returned.
+    Points outside the grid return NaN.
+    """
+    offset_x = (x - minx) / stepx
+    offset_y = (y - miny) / stepy
+
+    if not (0 <= offset_x <= grid.shape[-1] - 1 and 0 <= offset_y <= grid.shape[-2] - 1):
+        return np.nan if grid.ndim == 2 else np.full(grid.shape[0], np.nan)
+
+    # Last row/column belong to the cell before them
+    cell_x = min(int(offset_x), grid.shape[-1] - 2)
+    cell_y = min(int(offset_y), grid.shape[-2] - 2)
+
+    xk = offset_x - cell_x
+    yk = offset_y - cell_y
+
+    return ((1 - xk) * (1 - yk) * grid[..., cell_y, cell_x] + xk * (1 - yk) * grid[..., cell_y, cell_x + 1] +
+            (1 - xk) * yk * grid[..., cell_y + 1, cell_x] + xk * yk * grid[..., cell_y + 1, cell_x + 1])
+
 def _doColocate(x, y, minx, miny, stepx, stepy, grid, return_indices=False):
     """
     Nearest-neighbor 'colocation' lookup.
@@ -191,6 +251,170 @@ def _doColocate(x, y, minx, miny, stepx, stepy, grid, return_indices=False):
 
     return (value, (i, j)) if return_indices else value
 
+# Bicubic spline as a linear map: shift_value = ff @ _SPLINE_MATRIX @ az, with ff the 16 spline
+# parameters of the point and az the 16 grid nodes of its 4x4 neighbourhood (both without the dummy).
+# Derived once from _bicubic_surface by feeding it unit vectors.
+_SPLINE_MATRIX = _bicubic_surface((0.0,) + tuple(np.eye(16)[m][None, :] for m in range(16)),
+                                  (0.0,) + tuple(np.eye(16)[k][:, None] for k in range(16)))
+
+_SPLINE_POWERS = np.arange(4)
+_SPLINE_ROWS   = np.arange(-1, 3)
+_SPLINE_COLS   = np.arange(-1, 3)
+
+def _bicubic_cells(x, y, minx, miny, stepx, stepy, nrows, ncols):
+    """
+    Cell indices, relative coordinates and validity mask for arrays of points.
+    Same arithmetic and bounds check as _doBSInterpolation. Do not call directly.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    with np.errstate(invalid='ignore'):
+        offset_x = np.abs((x - minx) / stepx)
+        offset_y = np.abs((y - miny) / stepy)
+
+        valid = np.isfinite(offset_x) & np.isfinite(offset_y)
+        valid &= (offset_x < ncols - 3) & (offset_y < nrows - 3)
+
+    cell_x = np.where(valid, offset_x, 0.0).astype(np.intp)
+    cell_y = np.where(valid, offset_y, 0.0).astype(np.intp)
+
+    # {relative coordinate of point X:}
+    xk = (x - (minx + cell_x * stepx)) / stepx
+    yk = (y - (miny + cell_y * stepy)) / stepy
+
+    return cell_x, cell_y, xk, yk, valid
+
+def _bicubic_basis(xk, yk):
+    """
+    Spline parameters 1..16 of _spline_params as an (n, 16) array. Do not call directly.
+    """
+    xp = xk[:, None] ** _SPLINE_POWERS
+    yp = yk[:, None] ** _SPLINE_POWERS
+    return (yp[:, :, None] * xp[:, None, :]).reshape(-1, 16)
+
+def _bicubic_gather(grid, cell_x, cell_y):
+    """
+    Gather the 4x4 neighbourhoods of _spline_grid(grid, cell_x - 1, cell_y) as an (n, 16) array,
+    or (bands, n, 16) for a 3-D grid. Do not call directly.
+    """
+    rows = cell_y[:, None, None] + _SPLINE_ROWS[None, :, None]
+    cols = cell_x[:, None, None] + _SPLINE_COLS[None, None, :]
+    return grid[..., rows, cols].reshape(grid.shape[:-2] + (-1, 16))
+
+def _bicubic_weights(x, y, minx, miny, stepx, stepy, nrows, ncols):
+    """
+    Per-point bicubic weights, shared by every band of a grid. Do not call directly.
+    Returns (cell_x, cell_y, weights (n, 16), valid mask).
+    """
+    cell_x, cell_y, xk, yk, valid = transformations._bicubic_cells(x, y, minx, miny, stepx, stepy, nrows, ncols)
+    weights = transformations._bicubic_basis(xk, yk) @ _SPLINE_MATRIX
+
+    return cell_x, cell_y, weights, valid
+
+def _bicubic_apply(grid, cell_x, cell_y, weights, valid):
+    """
+    Apply precomputed bicubic weights to a 2-D grid, or to every band of a 3-D grid in one pass.
+    Returns (n,) or (bands, n). Do not call directly.
+    """
+    nodes = transformations._bicubic_gather(grid, cell_x, cell_y)
+    shift_value = np.einsum('ij,...ij->...i', weights, nodes)
+
+    return np.where(valid, shift_value, np.nan)
+
+def _doBSInterpolation_vec(x, y, minx, miny, stepx, stepy, grid):
+    """
+    Batched bicubic spline interpolation. Do not call directly.
+    x, y are 1-D NumPy arrays; grid is 2-D (rows, cols) or 3-D (bands, rows, cols). Returns (n,) or
+    (bands, n); the weights are computed once per point and applied to all bands.
+    Points failing the grid bounds check (or NaN input) return NaN.
+    """
+    cell_x, cell_y, weights, valid = transformations._bicubic_weights(np.ravel(x), np.ravel(y), minx, miny, stepx, stepy, grid.shape[-2], grid.shape[-1])
+
+    return transformations._bicubic_apply(grid, cell_x, cell_y, weights, valid)
+
+def _bicubic_coefficients(grid):
+    """
+    Precompute the 16 surface coefficients of every grid cell. Do not call directly.
+    grid is 2-D (rows, cols) or 3-D (bands, rows, cols); returns a (bands, rows, cols, 16) float64 table.
+    Cells that fail the _doBSInterpolation bounds check are NaN.
+    """
+    grid = np.asarray(grid, dtype=np.float64)
+    if grid.ndim == 2:
+        grid = grid[None]
+
+    bands, nrows, ncols = grid.shape
+    table = np.full((bands, nrows, ncols, 16), np.nan)
+
+    if nrows > 3 and ncols > 3:
+        cell_y, cell_x = np.meshgrid(np.arange(nrows - 3), np.arange(ncols - 3), indexing='ij')
+        nodes = transformations._bicubic_gather(grid, cell_x.ravel(), cell_y.ravel())
+        table[:, :nrows - 3, :ncols - 3, :] = (nodes @ _SPLINE_MATRIX.T).reshape(bands, nrows - 3, ncols - 3, 16)
+
+    return table
+
+def _doBSInterpolation_table(x, y, minx, miny, stepx, stepy, table):
+    """
+    Bicubic spline interpolation from a precomputed coefficient table (see _bicubic_coefficients).
+    Each query is a gather of the cell coefficients and a 16-term dot product with the spline parameters.
+    Returns (bands, n). Do not call directly.
+    """
+    cell_x, cell_y, xk, yk, valid = transformations._bicubic_cells(np.ravel(x), np.ravel(y), minx, miny, stepx, stepy, table.shape[-3], table.shape[-2])
+
+    coefs = table[..., cell_y, cell_x, :]
+    shift_value = np.einsum('ij,...ij->...i', transformations._bicubic_basis(xk, yk), coefs)
+
+    return np.where(valid, shift_value, np.nan)
+
+def _doLinearInterpolation_vec(x, y, minx, miny, stepx, stepy, grid):
+    """
+    Array version of _doLinearInterpolation. Do not call directly.
+    grid is 2-D (rows, cols) or 3-D (bands, rows, cols); returns (n,) or (bands, n).
+    Points outside the grid (or NaN input) return NaN.
+    """
+    x = np.ravel(np.asarray(x, dtype=np.float64))
+    y = np.ravel(np.asarray(y, dtype=np.float64))
+    nrows, ncols = grid.shape[-2:]
+
+    with np.errstate(invalid='ignore'):
+        offset_x = (x - minx) / stepx
+        offset_y = (y - miny) / stepy
+
+        valid = (offset_x >= 0) & (offset_x <= ncols - 1) & (offset_y >= 0) & (offset_y <= nrows - 1)
+
+    # Last row/column belong to the cell before them
+    cell_x = np.minimum(np.where(valid, offset_x, 0.0).astype(np.intp), ncols - 2)
+    cell_y = np.minimum(np.where(valid, offset_y, 0.0).astype(np.intp), nrows - 2)
+
+    xk = offset_x - cell_x
+    yk = offset_y - cell_y
+
+    shift_value = ((1 - xk) * (1 - yk) * grid[..., cell_y, cell_x] + xk * (1 - yk) * grid[..., cell_y, cell_x + 1] +
+                   (1 - xk) * yk * grid[..., cell_y + 1, cell_x] + xk * yk * grid[..., cell_y + 1, cell_x + 1])
+
+    return np.where(valid, shift_value, np.nan)
+
+def _doColocate_vec(x, y, minx, miny, stepx, stepy, grid):
+    """
+    Array version of _doColocate. Do not call directly.
+    grid is 2-D (rows, cols) or 3-D (bands, rows, cols); returns (n,) or (bands, n).
+    NaN input coordinates return NaN.
+    """
+    if stepx <= 0 or stepy <= 0:
+        raise ValueError("stepx and stepy must be positive.")
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    nrows, ncols = grid.shape[-2:]
+
+    valid = np.isfinite(x) & np.isfinite(y)
+
+    # Compute nearest integer indices, clamped to valid range
+    j = np.clip(np.rint(np.where(valid, (x - minx) / stepx, 0.0)), 0, ncols - 1).astype(np.intp)  # column index
+    i = np.clip(np.rint(np.where(valid, (y - miny) / stepy, 0.0)), 0, nrows - 1).astype(np.intp)  # row index
+
+    return np.where(valid, grid[..., i, j], np.nan)
+
 # Numba JIT function to compute 4 parameter Helmert transformation (2D)
 
 def _helmert_2d(east, north, tE, tN, dm, Rz):
@@ -218,69 +442,146 @@ def _helmert_7(x, y, z, cx, cy, cz, scale, rx, ry, rz):
     return x1, y1, z1
 
 
-def _etrs_to_st70(lat, lon, z, E0, N0, PHI0, LAMBDA0, k0, a, b, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, interpolations=(INTERP_BICUBIC, INTERP_BICUBIC)):
+def _etrs_to_st70(lat, lon, z, sc, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, interpolations=(INTERP_BICUBIC, INTERP_BICUBIC)):
     
     interpHoriz    = transformations.select_interp(interpolations[0])
     interpVertical = transformations.select_interp(interpolations[1])
 
-    en = projections._geodetic_to_stereographic(lat, lon, E0, N0, PHI0, LAMBDA0, k0, a, b,)
+    en = projections._geodetic_to_stereographic(lat, lon, sc)
     h = transformations._helmert_2d(en[0], en[1], tE, tN, dm, Rz)
 
-    e_shift =    interpHoriz(h[0], h[1],   mine, minn,      stepe, stepn,      shifts_grid[0])
-    n_shift =    interpHoriz(h[0], h[1],   mine, minn,      stepe, stepn,      shifts_grid[1])
+    e_shift, n_shift = interpHoriz(h[0], h[1], mine, minn, stepe, stepn, shifts_grid)
     h_shift = interpVertical(lon, lat,     minla, minphi,   stepla, stepphi,   heights_grid[0])
 
     return  h[0] + e_shift, h[1] + n_shift, z - h_shift
 
 
-def _etrs_to_st70_en(e, n, height, E0, N0, PHI0, LAMBDA0, k0, a, b, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, interpolations=(INTERP_BICUBIC, INTERP_BICUBIC)):
+def _etrs_to_st70_en(e, n, height, sc, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, interpolations=(INTERP_BICUBIC, INTERP_BICUBIC)):
     
     interpHoriz    = transformations.select_interp(interpolations[0])
     interpVertical = transformations.select_interp(interpolations[1])
     
-    latlon = projections._stereographic_to_geodetic(e, n, E0, N0, PHI0, LAMBDA0, k0, a, b)
+    latlon = projections._stereographic_to_geodetic(e, n, sc)
     h = transformations._helmert_2d(e, n, tE, tN, dm, Rz)
 
-    e_shift =    interpHoriz(h[0], h[1],             mine,  minn,    stepe,  stepn,     shifts_grid[0])
-    n_shift =    interpHoriz(h[0], h[1],             mine,  minn,    stepe,  stepn,     shifts_grid[1])
+    e_shift, n_shift = interpHoriz(h[0], h[1], mine, minn, stepe, stepn, shifts_grid)
     h_shift = interpVertical(latlon[1], latlon[0],   minla, minphi,  stepla, stepphi,   heights_grid[0])
 
     return latlon[0], latlon[1], height + h_shift, h[1] + n_shift, h[0] + e_shift, e_shift, n_shift
 
 
-def _st70_to_etrs(e, n, height, E0, N0, PHI0, LAMBDA0, k0, a, b, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, interpolations=(INTERP_BICUBIC, INTERP_BICUBIC)):
+def _st70_to_etrs(e, n, height, sc, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, interpolations=(INTERP_BICUBIC, INTERP_BICUBIC)):
     
     interpHoriz    = transformations.select_interp(interpolations[0])
     interpVertical = transformations.select_interp(interpolations[1])
         
-    e_shift = interpHoriz(e, n, mine, minn, stepe, stepn, shifts_grid[0])
-    n_shift = interpHoriz(e, n, mine, minn, stepe, stepn, shifts_grid[1])
+    e_shift, n_shift = interpHoriz(e, n, mine, minn, stepe, stepn, shifts_grid)
 
     h = transformations._helmert_2d(e - e_shift, n - n_shift, tE, tN, dm, Rz)
 
-    latlon = projections._stereographic_to_geodetic(h[0], h[1], E0, N0, PHI0, LAMBDA0, k0, a, b)
+    latlon = projections._stereographic_to_geodetic(h[0], h[1], sc)
 
     h_shift = interpVertical(latlon[1], latlon[0], minla, minphi, stepla, stepphi, heights_grid[0])
 
     return  latlon[0], latlon[1], height + h_shift
 
 
-def _st70_to_utm(e, n, height, E0, N0, PHI0, LAMBDA0, k0, a, b, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, zone, interpolations=(INTERP_BICUBIC, INTERP_BICUBIC)):
-    lat, lon, height = transformations._st70_to_etrs(e, n, height, E0, N0, PHI0, LAMBDA0, k0, a, b, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, interpolations=interpolations)
+def _st70_to_utm(e, n, height, sc, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, zone, interpolations=(INTERP_BICUBIC, INTERP_BICUBIC)):
+    lat, lon, height = transformations._st70_to_etrs(e, n, height, sc, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, interpolations=interpolations)
+
+    utm = projections._tm_latlon2en(lat, lon, 500000.0, 0.0, 0.0, math.radians(zone * 6.0 - 183.0), 0.9996, sc.a, sc.b)
+
+    return utm[0], utm[1], height
+
+def _etrs_to_st70_vec(lat, lon, z, sc, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, interpolations=(INTERP_BICUBIC, INTERP_BICUBIC), coefficients=(None, None)):
+
+    interpHoriz    = transformations.select_interp_vec(interpolations[0], coefficients[0])
+    interpVertical = transformations.select_interp_vec(interpolations[1], coefficients[1])
+
+    en = projections._geodetic_to_stereographic_vec(lat, lon, sc)
+    h = transformations._helmert_2d(en[0], en[1], tE, tN, dm, Rz)
+
+    e_shift, n_shift = interpHoriz(h[0], h[1], mine, minn, stepe, stepn, shifts_grid)
+    h_shift = interpVertical(lon, lat,     minla, minphi,   stepla, stepphi,   heights_grid)[0]
+
+    return  h[0] + e_shift, h[1] + n_shift, z - h_shift
+
+
+def _st70_to_etrs_vec(e, n, height, sc, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, interpolations=(INTERP_BICUBIC, INTERP_BICUBIC), coefficients=(None, None), convergence=(None, None)):
+
+    interpHoriz    = transformations.select_interp_vec(interpolations[0], coefficients[0])
+    interpVertical = transformations.select_interp_vec(interpolations[1], coefficients[1])
+
+    e_shift, n_shift = interpHoriz(e, n, mine, minn, stepe, stepn, shifts_grid)
+
+    h = transformations._helmert_2d(e - e_shift, n - n_shift, tE, tN, dm, Rz)
+
+    latlon = projections._stereographic_to_geodetic_masked(h[0], h[1], sc)
+
+    # Optional (iterations, converged) output arrays for the inverse stereographic latitude loop
+    if convergence[0] is not None:
+        convergence[0][:] = latlon[2]
+    if convergence[1] is not None:
+        convergence[1][:] = latlon[3]
+
+    h_shift = interpVertical(latlon[1], latlon[0], minla, minphi, stepla, stepphi, heights_grid)[0]
+
+    return  latlon[0], latlon[1], height + h_shift
+
+
+def _st70_to_utm_vec(e, n, height, sc, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, zone, interpolations=(INTERP_BICUBIC, INTERP_BICUBIC), coefficients=(None, None), convergence=(None, None)):
+    lat, lon, height = transformations._st70_to_etrs_vec(e, n, height, sc, tE, tN, dm, Rz, shifts_grid, mine, minn, stepe, stepn, heights_grid, minla, minphi, stepla, stepphi, interpolations=interpolations, coefficients=coefficients, convergence=convergence)
 
-    utm = projections._tm_latlon2en(lat, lon, 500000.0, 0.0, 0.0, math.radians(zone * 6.0 - 183.0), 0.9996, a, b)
+    utm = projections._tm_latlon2en_vec(lat, lon, 500000.0, 0.0, 0.0, math.radians(zone * 6.0 - 183.0), 0.9996, sc.a, sc.b)
 
     return utm[0], utm[1], height
 
+# Grids are normalised once by Transform.load_grids; _as_grid counts every grid the bulk kernels
+# still had to convert, so grid_copy_count() staying at 0 proves there are no per-call copies.
+_grid_copy_stats = {'copies': 0}
+
+
+def _as_grid(grid):
+    """
+    Return grid unchanged if it is a C-contiguous float32/float64 array, else a float64 copy (counted). Do not call directly.
+    """
+    if isinstance(grid, np.ndarray) and grid.dtype in (np.float32, np.float64) and grid.flags.c_contiguous:
+        return grid
+
+    _grid_copy_stats['copies'] += 1
+
+    return np.ascontiguousarray(grid, dtype=np.float64)
+
+
+def grid_copy_count():
+    """
+    Number of grid conversions made by the bulk kernels in this process (0 when all grids come from Transform).
+    """
+    return _grid_copy_stats['copies']
+
+
 class Transform:
 
-    def __init__(self, filename=None):    # intialise constants
+    def __init__(self, filename=None, precompute=False, cache=False, grid_dtype=np.float64, grid_data=None):    # intialise constants
+        """
+        filename: .spg grid file, defaults to the latest bundled grid.
+        precompute: build the per-cell bicubic coefficient tables at load (faster repeated bulk conversions).
+            Only the NumPy kernels read the tables, so they are not built while the numba backend is active.
+        cache: with precompute, keep the tables on disk next to the .spg (<name>.coef.npz) and reuse them.
+        grid_dtype: storage type of the shift/geoid grids of legacy .spg files, float64 (default) or float32 (half
+            the memory). SPG v2 grids stay memory-mapped in the dtype they were written with (see load_grids).
+        grid_data: already loaded .spg dictionary for filename (e.g. from sharedgrid.attach); the file is not read.
+        """
 
         if filename is None:
             filename = sorted(glob.glob(os.path.join(os.path.dirname(__file__), 'data', 'rom_grid3d_*.spg')))[-1]
 
-        with open(filename, 'rb') as f:
-            grid_data = pickle.load(f)
+        self.filename = filename
+        self.grid_dtype = np.dtype(grid_dtype)
+
+        # SPG v2 files are memory-mapped (grids shared through the page cache), legacy .spg files are unpickled
+        if grid_data is None:
+            grid_data = gridfile.load_grid_data(filename)
 
         self.params = grid_data['params']
         self.grid_version = grid_data['params']['version']
@@ -323,9 +624,25 @@ class Transform:
 
         self.set_ellipsoid_param()
 
+        self.coefficients = (None, None)
+        if precompute and backend.kernels() is None:
+            self.precompute_coefficients(cache)
+
     def load_grids(self, grid_data):
+        """
+        Normalise the shift and geoid grids once into C-contiguous, read-only buffers of grid_dtype.
+        Memory-mapped SPG v2 grids that are already C-contiguous float32/float64 are kept as they are (no copy,
+        the pages stay shared with other processes). The bulk kernels use the buffers as-is; see grid_copy_count().
+        """
         self.gpu = False
 
+        for grid in (self.grid_shifts, self.geoid_heights):
+            buffer = grid['grid']
+            if not (isinstance(buffer, np.memmap) and buffer.dtype in (np.float32, np.float64) and buffer.flags.c_contiguous):
+                buffer = np.ascontiguousarray(buffer, dtype=self.grid_dtype)
+            buffer.setflags(write=False)
+            grid['grid'] = buffer
+
     def set_ellipsoid_param(self):
 
         self.a = float(self.crs.projection['a'])
@@ -346,17 +663,71 @@ class Transform:
         self.PHI0 = math.radians(self.crs.projection['lat_0'])
         self.LAMBDA0 = math.radians(self.crs.projection['lon_0'])
 
+        self.stereo_constants = projections._stereographic_constants(self.E0, self.N0, self.PHI0, self.LAMBDA0, self.k0, self.a, self.b)
+
+    def precompute_coefficients(self, cache=False):
+        """
+        Build the (bands, rows, cols, 16) bicubic coefficient tables for the shifts and geoid grids.
+        With cache=True the tables are read from / written to <grid>.coef.npz next to the .spg file;
+        the cache is rebuilt when the size or modification time of the .spg changes, or when the grids
+        were loaded with another dtype or shape (the tables are computed in the grids' precision).
+        """
+        cache_file = os.path.splitext(self.filename)[0] + '.coef.npz'
+        stat = os.stat(self.filename)
+        grids = (self.grid_shifts['grid'], self.geoid_heights['grid'])
+        source = np.array([stat.st_size, stat.st_mtime_ns, *grids[0].shape, *grids[1].shape], dtype=np.int64)
+        dtypes = np.array([grid.dtype.str for grid in grids])
+
+        if cache and os.path.isfile(cache_file):
+            try:
+                with np.load(cache_file) as cached:
+                    if np.array_equal(cached['source'], source) and np.array_equal(cached['dtypes'], dtypes):
+                        self.coefficients = (cached['shifts'], cached['geoid'])
+                        return
+            except Exception:
+                pass  # unreadable cache, rebuild
+
+        self.coefficients = (transformations._bicubic_coefficients(self.grid_shifts['grid']),
+                             transformations._bicubic_coefficients(self.geoid_heights['grid']))
+
+        if cache:
+            try:
+                with open(cache_file, 'wb') as f:
+                    np.savez(f, source=source, dtypes=dtypes, shifts=self.coefficients[0], geoid=self.coefficients[1])
+            except OSError:
+                pass  # read-only grid folder, keep tables in memory only
+
+    def job_interpolations(self, interpolations=None):
+        """
+        (horizontal, vertical) interpolation codes for one job. interpolations may be None (use the grid's
+        params.interpolation), a single INTERP_* code for both grids, or a (horizontal, vertical) pair.
+        """
+        if interpolations is None:
+            return self.interpolate_methods
+        if isinstance(interpolations, (int, np.integer)):
+            return (int(interpolations), int(interpolations))
+
+        return (int(interpolations[0]), int(interpolations[1]))
+
     def helmert_2d(self, east, north, transform='etrs2stereo'):
         return _helmert_2d(east, north, **self.helmert[transform])
 
 
 
+    # The _bulk_* kernels run array-at-a-time (_etrs_to_st70_vec, _st70_to_etrs_vec, _st70_to_utm_vec).
+    # Results match the scalar per-point kernels (_etrs_to_st70, _st70_to_etrs, _st70_to_utm) to within
+    # 1e-6 m for projected coordinates and heights and 1e-10 degrees for latitude/longitude; the only
+    # differences come from floating-point evaluation order. Points outside the grids return NaN.
+    # With numba installed the same kernels run compiled and in parallel (romgeo_lite.backend, kernels_numba);
+    # precomputed coefficient tables only apply to the NumPy path.
+
     @staticmethod
     def _bulk_etrs_to_st70(lat, lon, z, e, n, height,
-                        E0, N0, PHI0, LAMBDA0, k0, a, b,
+                        sc,
                         tE, tN, dm, Rz,
                         shifts_grid, mine, minn, stepe, stepn,
-                        heights_grid, minla, minphi, stepla, stepphi, interpolations):
+                        heights_grid, minla, minphi, stepla, stepphi, interpolations,
+                        coefficients=(None, None)):
 
         lat = np.asarray(lat, dtype=np.float64)
         lon = np.asarray(lon, dtype=np.float64)
@@ -364,25 +735,36 @@ class Transform:
         e = np.asarray(e, dtype=np.float64)
         n = np.asarray(n, dtype=np.float64)
         height = np.asarray(height, dtype=np.float64)
-        shifts_grid = np.asarray(shifts_grid, dtype=np.float64)
-        heights_grid = np.asarray(heights_grid, dtype=np.float64)
-
-        for i in range(e.shape[0]):
-            e[i], n[i], height[i] = transformations._etrs_to_st70(
-                lat[i], lon[i], z[i],
-                E0, N0, PHI0, LAMBDA0, k0, a, b,
-                tE, tN, dm, Rz,
-                shifts_grid, mine, minn, stepe, stepn,
-                heights_grid, minla, minphi, stepla, stepphi,
-                interpolations
-            )
+        shifts_grid = transformations._as_grid(shifts_grid)
+        heights_grid = transformations._as_grid(heights_grid)
+
+        kernels = backend.kernels()
+        if kernels is not None:
+            try:
+                kernels.bulk_etrs_to_st70(lat, lon, z, e, n, height, sc, tE, tN, dm, Rz,
+                                          shifts_grid, mine, minn, stepe, stepn,
+                                          heights_grid, minla, minphi, stepla, stepphi, tuple(interpolations))
+                return
+            except backend.compile_errors() as exc:
+                backend.disable_numba(f"bulk_etrs_to_st70 failed to compile ({exc})")  # use the NumPy path from now on
+
+        e[:], n[:], height[:] = transformations._etrs_to_st70_vec(
+            lat, lon, z,
+            sc,
+            tE, tN, dm, Rz,
+            shifts_grid, mine, minn, stepe, stepn,
+            heights_grid, minla, minphi, stepla, stepphi,
+            interpolations,
+            coefficients
+        )
 
     @staticmethod
     def _bulk_st70_to_etrs(e, n, height, lat, lon, z,
-                        E0, N0, PHI0, LAMBDA0, k0, a, b,
+                        sc,
                         tE, tN, dm, Rz,
                         shifts_grid, mine, minn, stepe, stepn,
-                        heights_grid, minla, minphi, stepla, stepphi, interpolations):
+                        heights_grid, minla, minphi, stepla, stepphi, interpolations,
+                        coefficients=(None, None), convergence=(None, None)):
 
         e = np.asarray(e, dtype=np.float64)
         n = np.asarray(n, dtype=np.float64)
@@ -390,27 +772,42 @@ class Transform:
         lat = np.asarray(lat, dtype=np.float64)
         lon = np.asarray(lon, dtype=np.float64)
         z = np.asarray(z, dtype=np.float64)
-        shifts_grid = np.asarray(shifts_grid, dtype=np.float64)
-        heights_grid = np.asarray(heights_grid, dtype=np.float64)
-
-        for i in range(e.shape[0]):
-            lat[i], lon[i], z[i] = transformations._st70_to_etrs(
-                e[i], n[i], height[i],
-                E0, N0, PHI0, LAMBDA0, k0, a, b,
-                tE, tN, dm, Rz,
-                shifts_grid, mine, minn, stepe, stepn,
-                heights_grid, minla, minphi, stepla, stepphi,
-                interpolations
-            )
+        shifts_grid = transformations._as_grid(shifts_grid)
+        heights_grid = transformations._as_grid(heights_grid)
+
+        kernels = backend.kernels()
+        if kernels is not None:
+            iterations = convergence[0] if convergence[0] is not None else np.empty(e.shape, dtype=np.int32)
+            converged = convergence[1] if convergence[1] is not None else np.empty(e.shape, dtype=np.bool_)
+            try:
+                kernels.bulk_st70_to_etrs(e, n, height, lat, lon, z, sc, tE, tN, dm, Rz,
+                                          shifts_grid, mine, minn, stepe, stepn,
+                                          heights_grid, minla, minphi, stepla, stepphi, tuple(interpolations),
+                                          iterations, converged)
+                return
+            except backend.compile_errors() as exc:
+                backend.disable_numba(f"bulk_st70_to_etrs failed to compile ({exc})")  # use the NumPy path from now on
+
+        lat[:], lon[:], z[:] = transformations._st70_to_etrs_vec(
+            e, n, height,
+            sc,
+            tE, tN, dm, Rz,
+            shifts_grid, mine, minn, stepe, stepn,
+            heights_grid, minla, minphi, stepla, stepphi,
+            interpolations,
+            coefficients,
+            convergence
+        )
 
     @staticmethod
     def _bulk_st70_to_utm(e, n, height, utm_e, utm_n, z,
-                        E0, N0, PHI0, LAMBDA0, k0, a, b,
+                        sc,
                         tE, tN, dm, Rz,
                         shifts_grid, mine, minn, stepe, stepn,
                         heights_grid, minla, minphi, stepla, stepphi,
                         zone,
-                        interpolations):
+                        interpolations,
+                        coefficients=(None, None), convergence=(None, None)):
 
         e = np.asarray(e, dtype=np.float64)
         n = np.asarray(n, dtype=np.float64)
@@ -418,24 +815,42 @@ class Transform:
         utm_e = np.asarray(utm_e, dtype=np.float64)
         utm_n = np.asarray(utm_n, dtype=np.float64)
         z = np.asarray(z, dtype=np.float64)
-        shifts_grid = np.asarray(shifts_grid, dtype=np.float64)
-        heights_grid = np.asarray(heights_grid, dtype=np.float64)
-
-        for i in range(e.shape[0]):
-            utm_e[i], utm_n[i], z[i] = transformations._st70_to_utm(
-                e[i], n[i], height[i],
-                E0, N0, PHI0, LAMBDA0, k0, a, b,
-                tE, tN, dm, Rz,
-                shifts_grid, mine, minn, stepe, stepn,
-                heights_grid, minla, minphi, stepla, stepphi,
-                zone,
-                interpolations
-            )
+        shifts_grid = transformations._as_grid(shifts_grid)
+        heights_grid = transformations._as_grid(heights_grid)
+
+        kernels = backend.kernels()
+        if kernels is not None:
+            iterations = convergence[0] if convergence[0] is not None else np.empty(e.shape, dtype=np.int32)
+            converged = convergence[1] if convergence[1] is not None else np.empty(e.shape, dtype=np.bool_)
+            try:
+                kernels.bulk_st70_to_utm(e, n, height, utm_e, utm_n, z, sc, tE, tN, dm, Rz,
+                                         shifts_grid, mine, minn, stepe, stepn,
+                                         heights_grid, minla, minphi, stepla, stepphi, int(zone), tuple(interpolations),
+                                         iterations, converged)
+                return
+            except backend.compile_errors() as exc:
+                backend.disable_numba(f"bulk_st70_to_utm failed to compile ({exc})")  # use the NumPy path from now on
+
+        utm_e[:], utm_n[:], z[:] = transformations._st70_to_utm_vec(
+            e, n, height,
+            sc,
+            tE, tN, dm, Rz,
+            shifts_grid, mine, minn, stepe, stepn,
+            heights_grid, minla, minphi, stepla, stepphi,
+            zone,
+            interpolations,
+            coefficients,
+            convergence
+        )
 
 
 
 
-    def etrs_to_st70(self, lat, lon, z, e, n, height):
+    def etrs_to_st70(self, lat, lon, z, e, n, height, interpolations=None):
+        """
+        ETRS89 to Stereo70. interpolations optionally overrides the grid's params.interpolation for this
+        call, see job_interpolations().
+        """
         self._bulk_etrs_to_st70(
             np.asarray(lat, dtype=np.float64),
             np.asarray(lon, dtype=np.float64),
@@ -443,27 +858,31 @@ class Transform:
             np.asarray(e, dtype=np.float64),
             np.asarray(n, dtype=np.float64),
             np.asarray(height, dtype=np.float64),
-            np.float64(self.E0), np.float64(self.N0),
-            np.float64(self.PHI0), np.float64(self.LAMBDA0),
-            np.float64(self.k0), np.float64(self.a), np.float64(self.b),
+            self.stereo_constants,
             np.float64(self.helmert['etrs2stereo']['tE']),
             np.float64(self.helmert['etrs2stereo']['tN']),
             np.float64(self.helmert['etrs2stereo']['dm']),
             np.float64(self.helmert['etrs2stereo']['Rz']),
-            np.asarray(self.grid_shifts['grid'], dtype=np.float64),
+            self.grid_shifts['grid'],
             np.float64(self.grid_shifts['metadata']['mine']),
             np.float64(self.grid_shifts['metadata']['minn']),
             np.float64(self.grid_shifts['metadata']['stepe']),
             np.float64(self.grid_shifts['metadata']['stepn']),
-            np.asarray(self.geoid_heights['grid'], dtype=np.float64),
+            self.geoid_heights['grid'],
             np.float64(self.geoid_heights['metadata']['minla']),
             np.float64(self.geoid_heights['metadata']['minphi']),
             np.float64(self.geoid_heights['metadata']['stepla']),
             np.float64(self.geoid_heights['metadata']['stepphi']),
-            self.interpolate_methods
+            self.job_interpolations(interpolations),
+            self.coefficients
         )
 
-    def st70_to_etrs(self, e, n, height, lat, lon, z):
+    def st70_to_etrs(self, e, n, height, lat, lon, z, iterations=None, converged=None, interpolations=None):
+        """
+        Stereo70 to ETRS89. iterations (int) and converged (bool) are optional output arrays that receive
+        the per-point inverse stereographic iteration count and convergence flag.
+        interpolations overrides the grid's interpolation methods, as for etrs_to_st70.
+        """
         self._bulk_st70_to_etrs(
             np.asarray(e, dtype=np.float64),
             np.asarray(n, dtype=np.float64),
@@ -471,27 +890,30 @@ class Transform:
             np.asarray(lat, dtype=np.float64),
             np.asarray(lon, dtype=np.float64),
             np.asarray(z, dtype=np.float64),
-            np.float64(self.E0), np.float64(self.N0),
-            np.float64(self.PHI0), np.float64(self.LAMBDA0),
-            np.float64(self.k0), np.float64(self.a), np.float64(self.b),
+            self.stereo_constants,
             np.float64(self.helmert['stereo2etrs']['tE']),
             np.float64(self.helmert['stereo2etrs']['tN']),
             np.float64(self.helmert['stereo2etrs']['dm']),
             np.float64(self.helmert['stereo2etrs']['Rz']),
-            np.asarray(self.grid_shifts['grid'], dtype=np.float64),
+            self.grid_shifts['grid'],
             np.float64(self.grid_shifts['metadata']['mine']),
             np.float64(self.grid_shifts['metadata']['minn']),
             np.float64(self.grid_shifts['metadata']['stepe']),
             np.float64(self.grid_shifts['metadata']['stepn']),
-            np.asarray(self.geoid_heights['grid'], dtype=np.float64),
+            self.geoid_heights['grid'],
             np.float64(self.geoid_heights['metadata']['minla']),
             np.float64(self.geoid_heights['metadata']['minphi']),
             np.float64(self.geoid_heights['metadata']['stepla']),
             np.float64(self.geoid_heights['metadata']['stepphi']),
-            self.interpolate_methods
+            self.job_interpolations(interpolations),
+            self.coefficients,
+            (iterations, converged)
         )
 
-    def st70_to_utm(self, e, n, height, utm_e, utm_n, z, zone):
+    def st70_to_utm(self, e, n, height, utm_e, utm_n, z, zone, iterations=None, converged=None, interpolations=None):
+        """
+        Stereo70 to UTM in the given zone. iterations, converged and interpolations are as for st70_to_etrs.
+        """
         self._bulk_st70_to_utm(
             np.asarray(e, dtype=np.float64),
             np.asarray(n, dtype=np.float64),
@@ -499,27 +921,88 @@ class Transform:
             np.asarray(utm_e, dtype=np.float64),
             np.asarray(utm_n, dtype=np.float64),
             np.asarray(z, dtype=np.float64),
-            np.float64(self.E0), np.float64(self.N0),
-            np.float64(self.PHI0), np.float64(self.LAMBDA0),
-            np.float64(self.k0), np.float64(self.a), np.float64(self.b),
+            self.stereo_constants,
             np.float64(self.helmert['stereo2etrs']['tE']),
             np.float64(self.helmert['stereo2etrs']['tN']),
             np.float64(self.helmert['stereo2etrs']['dm']),
             np.float64(self.helmert['stereo2etrs']['Rz']),
-            np.asarray(self.grid_shifts['grid'], dtype=np.float64),
+            self.grid_shifts['grid'],
             np.float64(self.grid_shifts['metadata']['mine']),
             np.float64(self.grid_shifts['metadata']['minn']),
             np.float64(self.grid_shifts['metadata']['stepe']),
             np.float64(self.grid_shifts['metadata']['stepn']),
-            np.asarray(self.geoid_heights['grid'], dtype=np.float64),
+            self.geoid_heights['grid'],
             np.float64(self.geoid_heights['metadata']['minla']),
             np.float64(self.geoid_heights['metadata']['minphi']),
             np.float64(self.geoid_heights['metadata']['stepla']),
             np.float64(self.geoid_heights['metadata']['stepphi']),
             int(zone),
-            self.interpolate_methods
+            self.job_interpolations(interpolations),
+            self.coefficients,
+            (iterations, converged)
         )
 
 
+# Process-wide Transform cache: one loaded Transform per grid file, keyed by the resolved path and
+# invalidated when the file's size or modification time changes.
+_transform_cache = {}
+_transform_cache_lock = threading.Lock()
+_transform_cache_stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+
+def _grid_fingerprint(filename):
+    stat = os.stat(filename)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def get_transform(filename=None, precompute=False, cache=False):
+    """
+    Return the cached Transform for filename, loading it on first use or after the file changed.
+    Arguments are as for Transform(); precompute/cache only apply when the grid is (re)loaded.
+    """
+    if filename is None:
+        filename = sorted(glob.glob(os.path.join(os.path.dirname(__file__), 'data', 'rom_grid3d_*.spg')))[-1]
+
+    path = os.path.realpath(os.fspath(filename))
+    fingerprint = transformations._grid_fingerprint(path)
+
+    with _transform_cache_lock:
+        entry = _transform_cache.get(path)
+
+        if entry is not None and entry[0] == fingerprint:
+            _transform_cache_stats['hits'] += 1
+            return entry[1]
+
+        _transform_cache_stats['misses'] += 1
+        if entry is not None:
+            _transform_cache_stats['invalidations'] += 1
+
+        t = Transform(path, precompute=precompute, cache=cache)
+        _transform_cache[path] = (fingerprint, t)
+
+        return t
+
+
+def _cache_transform(filename, fingerprint, t):
+    """
+    Put an already built Transform for filename in the cache (used by sharedgrid.attach_worker). Do not call directly.
+    """
+    with _transform_cache_lock:
+        _transform_cache[os.path.realpath(os.fspath(filename))] = (fingerprint, t)
+
+
+def transform_cache_info():
+    """
+    Hit/miss/invalidation counters and the number of grids currently loaded in this process.
+    """
+    with _transform_cache_lock:
+        return dict(_transform_cache_stats, loaded=len(_transform_cache))
+
+
+def clear_transform_cache():
+    with _transform_cache_lock:
+        _transform_cache.clear()
+
+
 if __name__ == "__main__":
     pass
\ No newline at end of file
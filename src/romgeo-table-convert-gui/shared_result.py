@@ -0,0 +1,161 @@
+# Conversion results written by pool workers straight into shared memory.
+#
+# The parent preallocates one segment for the whole job (values, status and name spans of every row); each
+# worker fills the rows of its chunk in place and returns only a small per-chunk summary, so nothing of the
+# result is pickled. Point names are not copied either: workers record where the name sits in the input line
+# and the parent, which has the lines, slices them. Imports only NumPy (worker side, see worker_entry).
+
+import os
+import time
+
+import numpy as np
+from multiprocessing import shared_memory
+
+from conversion_result import ConversionResult, STATUS_INVALID, merge_info
+
+
+def _layout(fields, rows):
+    # (name, dtype, shape, byte offset) of each array in the segment, 8-byte aligned, and the total size
+    layout, offset = [], 0
+    for name, dtype, shape in (('values', np.float64, (len(fields), rows)),
+                               ('name_start', np.int32, (rows,)),
+                               ('name_end', np.int32, (rows,)),
+                               ('status', np.int8, (rows,))):
+        layout.append((name, np.dtype(dtype), shape, offset))
+        offset += -(-int(np.prod(shape)) * np.dtype(dtype).itemsize // 8) * 8
+    return layout, offset
+
+
+def _views(raw, fields, rows):
+    # {name: array} viewing the segment bytes in raw (uint8 array or buffer)
+    raw = np.frombuffer(raw, dtype=np.uint8) if not isinstance(raw, np.ndarray) else raw
+    layout, _ = _layout(fields, rows)
+    return {name: raw[offset:offset + int(np.prod(shape)) * dtype.itemsize].view(dtype).reshape(shape)
+            for name, dtype, shape, offset in layout}
+
+
+class _Owner:
+    # Exposes the segment as an array base that holds the SharedMemory handle, so the mapping stays open
+    # exactly as long as some array views it (SharedMemory.close() fails while views exist).
+    def __init__(self, shm, nbytes):
+        self.shm = shm
+        address = np.frombuffer(shm.buf, dtype=np.uint8, count=nbytes).ctypes.data
+        self.__array_interface__ = {'version': 3, 'shape': (nbytes,), 'typestr': '|u1', 'data': (address, False)}
+
+
+class SharedResult:
+    """Shared-memory output of one chunked conversion job, created by the parent.
+
+    descriptor is the small picklable dict workers need to write their rows (see write_chunk). The arrays
+    (values, status, name spans) view the segment; once the job is over, result() unlinks the segment and
+    returns a ConversionResult over the same memory, freed when the last array is dropped. Call release()
+    if the job fails.
+
+    Args:
+        fields (tuple[str]): Result fields (conversion_result.ETRS_ST70_FIELDS or ST70_ETRS_FIELDS).
+        rows (int): Total number of input lines of the job.
+    """
+
+    def __init__(self, fields, rows):
+        self.fields = tuple(fields)
+        self.rows = rows
+
+        _, nbytes = _layout(self.fields, rows)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+
+        self.arrays = _views(np.asarray(_Owner(self.shm, max(nbytes, 1))), self.fields, rows)
+        self.arrays['values'][...] = np.nan
+        self.arrays['status'][...] = STATUS_INVALID
+        self.arrays['name_start'][...] = 0
+        self.arrays['name_end'][...] = 0
+
+        self.descriptor = {'shm': self.shm.name, 'fields': self.fields, 'rows': rows}
+
+    @property
+    def nbytes(self):
+        return self.shm.size
+
+    def result(self, lines, stats):
+        """Builds the job's ConversionResult over the shared arrays (no copy) and unlinks the segment.
+
+        Args:
+            lines (list[str]): All input lines of the job, in row order.
+            stats (list[dict]): Per-chunk summaries returned by write_chunk.
+        """
+        starts = self.arrays['name_start'].tolist()
+        ends = self.arrays['name_end'].tolist()
+
+        names = np.empty(self.rows, dtype=object)
+        names[:] = [line[s:e] for line, s, e in zip(lines, starts, ends)]
+        for chunk in stats:
+            for row, name in chunk['names'].items():
+                names[row] = name
+
+        result = ConversionResult(self.fields, names, self.arrays['values'], self.arrays['status'],
+                                  merge_info(chunk['info'] for chunk in stats))
+        self._unlink()
+        self.arrays = {}
+        return result
+
+    def _unlink(self):
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass  # already unlinked
+
+    def release(self):
+        """Drops the shared arrays and unlinks the segment. Safe to call more than once."""
+        self.arrays = {}
+        self._unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def write_chunk(descriptor, start, lines, result, elapsed=None):
+    """Worker side: copies a chunk's ConversionResult into rows start.. of the shared result.
+
+    Returns the chunk summary for the parent: row range, status counts, info counters, pid, seconds, and
+    the names that are not a substring of their input line (e.g. 'invalid_format'), keyed by job row.
+    """
+    t0 = time.perf_counter()
+    fields, rows = tuple(descriptor['fields']), descriptor['rows']
+    stop = start + len(result)
+
+    if result.fields != fields or stop > rows:
+        raise ValueError(f"chunk at row {start} ({len(result)} rows, {result.fields}) does not fit the shared result")
+
+    names = {}
+    name_start = np.zeros(len(result), dtype=np.int32)
+    name_end = np.zeros(len(result), dtype=np.int32)
+    for i, (line, name) in enumerate(zip(lines, result.names)):
+        if name:
+            position = line.find(name)
+            if position < 0:
+                names[start + i] = name
+            else:
+                name_start[i], name_end[i] = position, position + len(name)
+
+    shm = shared_memory.SharedMemory(name=descriptor['shm'])
+    try:
+        arrays = _views(shm.buf, fields, rows)
+        arrays['values'][:, start:stop] = result.values
+        arrays['status'][start:stop] = result.status
+        arrays['name_start'][start:stop] = name_start
+        arrays['name_end'][start:stop] = name_end
+        del arrays
+    finally:
+        shm.close()
+
+    return {
+        'start': start,
+        'rows': len(result),
+        'pid': os.getpid(),
+        'seconds': (elapsed or 0.0) + time.perf_counter() - t0,
+        'status': result.status_counts(),
+        'info': result.info,
+        'names': names,
+    }
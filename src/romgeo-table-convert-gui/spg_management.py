@@ -9,7 +9,7 @@ from typing import Optional, Literal
 class SPGFile:
     """SPGFile class for handling and processing SPG (Spatial Pickle Grid) files.
     
-    This class provides methods to load, save, visualize, and compare geodetic shifts and geoid heights from SPG files. It supports various formats for saving data, including JSON and CSV, and allows for the generation of metadata files.
+    This class provides methods to load, save, visualize, and compare geodetic shifts and geoid heights from SPG files (legacy pickles or the memory-mapped SPG v2 format). It supports various formats for saving data, including JSON and CSV, and allows for the generation of metadata files.
     
     Attributes:
         data (dict): The loaded data from the SPG pickle file.
@@ -22,6 +22,9 @@ class SPGFile:
     Methods:
         _load_pickle() -> dict:
             Load the SPG pickle file and return its contents as a dictionary.
+
+        _load_spg2() -> dict:
+            Load an SPG v2 file (memory-mapped grids) after checking its data checksum.
     
         get_metadata() -> dict:
             Return metadata for both geodetic shifts and geoid heights grids.
@@ -35,6 +38,9 @@ class SPGFile:
         save_spg(output_path: str):
             Save the current data back into a .spg (pickle) file.
     
+        save_spg2(output_path: str, dtype=np.float64):
+            Save the current data as an SPG v2 file (JSON header + aligned raw arrays, with checksum).
+    
         save_json(output_path: str):
             Save the SPG file content as JSON.
     
@@ -70,7 +76,7 @@ class SPGFile:
         """Initialize the SPG file by loading data and structuring it."""
         if file_path:
             self.file_path = file_path
-            self.data = self._load_pickle()
+            self.data = self._load_pickle() if not self._is_spg2() else self._load_spg2()
         else:
             self.data = self.generate_empty_spg_structure()
 
@@ -87,6 +93,23 @@ class SPGFile:
         """Load the SPG pickle file."""
         with open(self.file_path, "rb") as file:
             return pickle.load(file)
+
+    def _is_spg2(self) -> bool:
+        """Check for the SPG v2 (memory-mapped) magic bytes."""
+        with open(self.file_path, "rb") as file:
+            return file.read(4) == b"SPG2"
+
+    def _load_spg2(self) -> dict:
+        """Load an SPG v2 file, verifying the data checksum stored in its header."""
+        from romgeo_lite import gridfile  # imported lazily, romgeo_lite pulls in pyproj
+
+        return gridfile.read_spg2(self.file_path, verify=True)
+
+    def save_spg2(self, output_path: str, dtype=np.float64):
+        """Save the current data as an SPG v2 (memory-mapped) file."""
+        from romgeo_lite import gridfile
+
+        gridfile.write_spg2(self.data, output_path, dtype=dtype)
     
     def generate_empty_spg_structure():
         return {
@@ -0,0 +1,346 @@
+# Columnar text output of conversion results (result panes, "Salvează" text files) and the DMS engine
+# shared by every output (panes, Excel, shapefile attributes, DXF labels).
+#
+# Every column is rendered for all rows at once into a byte matrix (digits by integer arithmetic, names
+# through NumPy string ops), then the columns are scattered into one preallocated UTF-8 buffer, so no
+# Python string is built per row. Values whose correctly rounded digits cannot be decided from the scaled
+# float (ties, infinities, huge values) fall back to format(); the output matches Python's '.Nf'.
+
+import numpy as np
+
+import config
+from conversion_result import ETRS_ST70_FIELDS, ST70_ETRS_FIELDS
+
+SEPARATORS = {'space': ' ', 'tab': '\t', 'comma': ','}
+
+# Output columns after the point name: (field, decimals); lat/lon may be written as DMS instead
+OUTPUT_FIELDS = {
+    ETRS_ST70_FIELDS: (('st70_x', 3), ('st70_y', 3), ('h_mn', 3)),
+    ST70_ETRS_FIELDS: (('lat', 9), ('lon', 9), ('h_ell', 3)),
+}
+DMS_FIELDS = ('lat', 'lon')
+
+# Minute and second marks of the DMS variants (both write the degree sign)
+DMS_MARKS = {
+    'safe':    ("'", '"'),            # ASCII marks: text panes, shapefile attributes
+    'unicode': ('\u2032', '\u2033'),  # prime, double prime: Excel
+}
+
+_SPACE, _MINUS, _POINT, _ZERO = ord(' '), ord('-'), ord('.'), ord('0')
+_POW10 = 10 ** np.arange(1, 19, dtype=np.int64)
+
+
+class Column:
+    """One rendered column: a (rows, width) byte matrix holding each row's value left-aligned (align '<')
+    or right-aligned ('>'), spaces elsewhere.
+
+    nbytes is the length of each value in bytes, nchars in characters (they differ for non-ASCII text and
+    the degree sign); align is also the side the value sits on when padded to a fixed width.
+    """
+
+    def __init__(self, mat, nbytes, nchars, align):
+        self.mat = mat
+        self.nbytes = nbytes
+        self.nchars = nchars
+        self.align = align
+
+    @property
+    def width(self):
+        return self.mat.shape[1]
+
+    def widen(self, width):
+        """The same column in a matrix width bytes wide (right-aligned columns stay right-aligned)."""
+        if width == self.width:
+            return self
+        mat = np.full((self.mat.shape[0], width), _SPACE, dtype=np.uint8)
+        shift = width - self.width if self.align == '>' else 0
+        mat[:, shift:shift + self.width] = self.mat
+        return Column(mat, self.nbytes, self.nchars, self.align)
+
+
+def _put_digits(mat, column, value, count, fill=None):
+    # Writes the last count digits of value (int64) leftwards from column; with fill, digits beyond
+    # fill[r] are left untouched. Modifies value.
+    for k in range(count):
+        digits = (_ZERO + value % 10).astype(mat.dtype)
+        if fill is None:
+            mat[:, column - k] = digits
+        else:
+            mat[:, column - k] = np.where(k < fill, digits, mat[:, column - k])
+        value //= 10
+
+
+def _int_digits(value):
+    # Number of decimal digits of non-negative int64 values
+    return 1 + np.searchsorted(_POW10, value, side='right')
+
+
+def text_column(texts):
+    """Stripped texts (e.g. point names), left-aligned."""
+    texts = np.strings.strip(np.asarray(texts, dtype=object).astype(str))
+    rows = texts.shape[0]
+    nchars = np.strings.str_len(texts).astype(np.int64)
+
+    itemsize = texts.dtype.itemsize // 4
+    codes = texts.view(np.uint32).reshape(rows, itemsize) if itemsize else np.zeros((rows, 0), np.uint32)
+    if not codes.size or codes.max() < 128:
+        mat, nbytes = codes.astype(np.uint8), nchars
+    else:
+        encoded = np.strings.encode(texts, 'utf-8')
+        mat = encoded.view(np.uint8).reshape(rows, encoded.dtype.itemsize).copy()
+        nbytes = np.strings.str_len(encoded).astype(np.int64)
+    mat[mat == 0] = _SPACE
+
+    return Column(mat, nbytes, nchars, '<')
+
+
+def decimal_column(values, decimals):
+    """format(value, f'.{decimals}f') of every value, right-aligned; NaN is written as 'NaN'."""
+    values = np.asarray(values, dtype=np.float64)
+    rows = values.shape[0]
+    nan = np.isnan(values)
+
+    with np.errstate(invalid='ignore', over='ignore'):
+        scaled = np.abs(values) * 10.0 ** decimals
+        frac = scaled - np.floor(scaled)
+        # rint(scaled) is the correctly rounded result unless scaled is near a tie (within its own
+        # rounding error) or has no exact integer representation
+        exact = (scaled < 2.0 ** 52) & ~(np.abs(frac - 0.5) <= 4 * np.spacing(scaled))
+    slow = np.flatnonzero(~exact & ~nan)
+    slow_text = [format(value, f'.{decimals}f').encode('ascii') for value in values[slow].tolist()]
+
+    scaled = np.where(exact, np.rint(scaled), 0.0).astype(np.int64)
+    whole, part = np.divmod(scaled, 10 ** decimals)
+    ndigits = _int_digits(whole)
+    negative = np.signbit(values) & exact
+
+    tail = decimals + 1 if decimals else 0
+    nbytes = negative + ndigits + tail
+    nbytes[nan] = 3
+    nbytes[slow] = [len(text) for text in slow_text]
+    # At least the digit layout of 0 (written in every row, then replaced), for columns that are all NaN
+    width = max(int(nbytes.max()), 1 + tail) if rows else 0
+
+    mat = np.full((rows, width), _SPACE, dtype=np.uint8)
+    if rows:
+        if decimals:
+            _put_digits(mat, width - 1, part, decimals)
+            mat[:, width - 1 - decimals] = _POINT
+        _put_digits(mat, width - 1 - tail, whole, int(ndigits.max()), fill=ndigits)
+        mat[negative, width - nbytes[negative]] = _MINUS
+        mat[~exact] = _SPACE
+        mat[nan, width - 3:] = np.frombuffer(b'NaN', dtype=np.uint8)
+        for row, text in zip(slow.tolist(), slow_text):
+            mat[row, width - len(text):] = np.frombuffer(text, dtype=np.uint8)
+
+    return Column(mat, nbytes, nbytes.copy(), '>')
+
+
+def _dms_matrix(values, decimals, marks, dtype):
+    # Right-aligned DMS text of values as a (rows, width) matrix of code units: UTF-8 bytes (uint8) or
+    # code points (uint32). Returns the matrix, the units and the characters of each row.
+    values = np.asarray(values, dtype=np.float64)
+    rows = values.shape[0]
+    bad = ~np.isfinite(values)
+
+    scale = 10 ** decimals
+    total = np.rint(np.where(bad, 0.0, np.abs(values)) * (3600.0 * scale)).astype(np.int64)
+    seconds, fraction = np.divmod(total, scale)
+    minutes, seconds = np.divmod(seconds, 60)
+    degrees, minutes = np.divmod(minutes, 60)
+    negative = (values < 0) & (total > 0)
+
+    def units(text):
+        if dtype == np.uint8:
+            return np.frombuffer(text.encode('utf-8'), dtype=np.uint8)
+        return np.array([ord(char) for char in text], dtype=np.uint32)
+
+    # after the degree digits: literal units and (digits, count)
+    minute_mark, second_mark = DMS_MARKS[marks]
+    tail = ['\N{DEGREE SIGN}', (minutes, 2), minute_mark, (seconds, 2)]
+    tail += ['.', (fraction, decimals)] if decimals else []
+    tail.append(second_mark)
+    tail_chars = sum(len(part) if isinstance(part, str) else part[1] for part in tail)
+    tail = [units(part) if isinstance(part, str) else part for part in tail]
+    tail_units = sum(len(part) if isinstance(part, np.ndarray) else part[1] for part in tail)
+
+    ndigits = np.maximum(_int_digits(degrees), 2)
+    nunits = negative + ndigits + tail_units
+    nchars = nunits - (tail_units - tail_chars)
+    nunits[bad] = nchars[bad] = 3
+    # At least the layout of 0 (written in every row, then replaced), for columns without finite values
+    width = max(int(nunits.max()), 2 + tail_units) if rows else 0
+
+    mat = np.full((rows, width), _SPACE, dtype=dtype)
+    if rows:
+        end = width
+        for part in reversed(tail):
+            if isinstance(part, np.ndarray):
+                mat[:, end - len(part):end] = part
+                end -= len(part)
+            else:
+                _put_digits(mat, end - 1, *part)
+                end -= part[1]
+        _put_digits(mat, end - 1, degrees, int(ndigits.max()), fill=ndigits)
+        mat[negative, width - nunits[negative]] = _MINUS
+        mat[bad] = _SPACE
+        mat[bad, width - 3:] = units('NaN')
+
+    return mat, nunits, nchars
+
+
+def dms_column(values, decimals=None, marks='safe'):
+    """[-]DD°MM'SS.ssssss" of every value, right-aligned; non-finite values are written as 'NaN'.
+
+    The value is rounded once, to a whole number of 10**-decimals seconds, and split into degrees, minutes
+    and seconds by integer division, so seconds and minutes never show as 60.
+
+    Args:
+        values (np.ndarray): Decimal degrees.
+        decimals (int, optional): Decimals of the seconds. Defaults to config.DMS_DECIMALS, read at call
+            time so settings changes apply.
+        marks (str, optional): Key of DMS_MARKS. Defaults to 'safe'.
+    """
+    decimals = config.DMS_DECIMALS if decimals is None else decimals
+    return Column(*_dms_matrix(values, decimals, marks, np.uint8), '>')
+
+
+def dms_strings(values, decimals=None, marks='unicode'):
+    """DMS text of every value as a str array (e.g. for DataFrame columns); same digits as dms_column."""
+    decimals = config.DMS_DECIMALS if decimals is None else decimals
+    mat, _, _ = _dms_matrix(values, decimals, marks, np.uint32)
+    if not mat.shape[1]:
+        return np.zeros(mat.shape[0], dtype=str)
+    return np.strings.lstrip(mat.view(f'U{mat.shape[1]}').ravel())
+
+
+def choose(mask, a, b):
+    """Rows of column a where mask is set, rows of column b elsewhere."""
+    width = max(a.width, b.width)
+    a, b = a.widen(width), b.widen(width)
+    return Column(np.where(mask[:, None], a.mat, b.mat), np.where(mask, a.nbytes, b.nbytes),
+                  np.where(mask, a.nchars, b.nchars), a.align)
+
+
+def constant_column(data, rows):
+    """The same bytes in every row (e.g. fixed tags between values)."""
+    mat = np.broadcast_to(np.frombuffer(data, dtype=np.uint8), (rows, len(data)))
+    size = np.full(rows, len(data), dtype=np.int64)
+    return Column(mat, size, size, '<')
+
+
+def bytes_column(mat):
+    """A column over a (rows, width) uint8 matrix whose rows are whole values (e.g. packed doubles)."""
+    size = np.full(mat.shape[0], mat.shape[1], dtype=np.int64)
+    return Column(mat, size, size, '<')
+
+
+def join_columns(columns, separator=b'', end=b'\n', spans=None):
+    """Joins columns row by row into one buffer: value, separator, value, ..., end, for every row.
+
+    Args:
+        columns (list[Column]): Columns with the same number of rows.
+        separator (bytes, optional): Written between the values of a row. Defaults to none.
+        end (bytes, optional): Written after every row. Defaults to a newline.
+        spans (list[np.ndarray], optional): Bytes each column takes in every row, padding included; the
+            padding is spaces on the side away from the column's alignment. Defaults to the values alone.
+
+    Returns:
+        np.ndarray: uint8 buffer.
+    """
+    rows = columns[0].mat.shape[0]
+    spans = spans or [column.nbytes for column in columns]
+    separator = np.frombuffer(separator, dtype=np.uint8)
+    end = np.frombuffer(end, dtype=np.uint8)
+
+    # Lay every row out at the widest size of each column, then drop the padding that only other rows need
+    slots = [max(int(span.max()), column.width) for column, span in zip(columns, spans)]
+    ragged = any(span.min() != slot for span, slot in zip(spans, slots))
+
+    lines = np.full((rows, sum(slots) + (len(columns) - 1) * len(separator) + len(end)), _SPACE, dtype=np.uint8)
+    keep = np.ones(lines.shape, dtype=bool) if ragged else None
+    position = 0
+    for i, (column, span, slot) in enumerate(zip(columns, spans, slots)):
+        if i and len(separator):
+            lines[:, position:position + len(separator)] = separator
+            position += len(separator)
+        offsets = np.arange(slot)
+        if column.align == '>':
+            lines[:, position + slot - column.width:position + slot] = column.mat
+            if ragged:
+                keep[:, position:position + slot] = offsets >= (slot - span)[:, None]
+        else:
+            lines[:, position:position + column.width] = column.mat
+            if ragged:
+                keep[:, position:position + slot] = offsets < span[:, None]
+        position += slot
+    lines[:, position:] = end
+
+    return lines[keep] if ragged else lines.reshape(-1)
+
+
+def render_columns(columns, mode='space', width=None):
+    """Joins rendered columns into one UTF-8 buffer, a line per row, without a final newline.
+
+    Args:
+        columns (list[Column]): Columns with the same number of rows.
+        mode (str): 'space' pads every column to width characters (left/right by column alignment)
+            and separates them with a space; 'tab' and 'comma' write the bare values.
+        width (int, optional): Column width in 'space' mode. Defaults to config.FMT_SPACE_SIZE, read at
+            call time so settings changes apply.
+
+    Returns:
+        np.ndarray: uint8 buffer with the text.
+    """
+    spans = None
+    if mode == 'space':
+        width = config.FMT_SPACE_SIZE if width is None else width
+        spans = [np.maximum(column.nbytes, width - column.nchars + column.nbytes) for column in columns]
+    return join_columns(columns, SEPARATORS[mode].encode('ascii'), b'\n', spans)[:-1]
+
+
+def result_columns(result, dms=False):
+    """The rendered output columns of a ConversionResult: name, then the OUTPUT_FIELDS of its direction.
+
+    With dms, latitude and longitude are written as DMS in rows where both have a value.
+    """
+    columns = [text_column(result.names)]
+    both = dms and ~np.isnan(result['lat']) & ~np.isnan(result['lon'])
+
+    for field, decimals in OUTPUT_FIELDS[result.fields]:
+        column = decimal_column(result[field], decimals)
+        if dms and field in DMS_FIELDS and both.any():
+            column = choose(both, dms_column(np.where(both, result[field], 0.0)), column)
+        columns.append(column)
+    return columns
+
+
+def render(result, mode='space', dms=False, width=None):
+    """Renders a ConversionResult as text, one line per row. Returns the uint8 buffer (UTF-8).
+
+    width defaults to config.FMT_SPACE_SIZE (see render_columns).
+    """
+    if not len(result):
+        return np.empty(0, dtype=np.uint8)
+    return render_columns(result_columns(result, dms), mode, width)
+
+
+def to_text(result, mode='space', dms=False, width=None):
+    """Rendered text of a ConversionResult as a str (see render)."""
+    return str(render(result, mode, dms, width).data, 'utf-8')
+
+
+def write_text(result, path, mode='space', dms=False, width=None):
+    """Writes the rendered text of a ConversionResult to path (UTF-8)."""
+    with open(path, 'wb') as f:
+        f.write(render(result, mode, dms, width).data)
+
+
+def separator_mode(text):
+    """Mode key of a separator combo box entry ('SPATIU', 'TAB', 'VIRGULA')."""
+    text = text.upper()
+    if 'TAB' in text:
+        return 'tab'
+    if 'VIRGULA' in text:
+        return 'comma'
+    return 'space'
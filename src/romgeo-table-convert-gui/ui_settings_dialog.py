@@ -64,6 +64,10 @@ def load_config_overrides(ini_path: None):
                 setattr(config, key_upper, value)
                 log(f"Config: OVERWRIDE {key_upper} = {value}", also_print=True)
 
+    # The config changed: recompile the parser patterns (functions.parse_plan)
+    from functions import parse_plan
+    parse_plan()
+
 @log_function(level='debug')
 def load_config_settings(ini_path: None, group:str = 'UI'):
     import configparser
@@ -121,7 +125,10 @@ SETTINGS = {
     "SWAP_LATLON_SHP":        {"type": "bool", "default": config.SWAP_LATLON_SHP, "label": "Swap LatLon in SHP", "DEV_ONLY": False},
     "FMT_SPACE_SIZE":         {"type": "int",  "default": config.FMT_SPACE_SIZE, "label": "Fixed width padding", "DEV_ONLY": False},
     "CHUNK_SIZE":             {"type": "int",  "default": config.CHUNK_SIZE, "label": "Chunk size", "DEV_ONLY": False},
-    "MAX_POINTS_FOR_DXF":     {"type": "int",  "default": config.MAX_POINTS_FOR_DXF, "label": "Max DXF points", "DEV_ONLY": False},
+    "DXF_VERSION":            {"type": "enum", "default": config.DXF_VERSION, "label": "DXF version", "options": ["R12", "R2000"], "DEV_ONLY": False},
+    "DXF_FORMAT":             {"type": "enum", "default": config.DXF_FORMAT, "label": "DXF format", "options": ["bin", "asc"], "DEV_ONLY": False},
+    "DXF_LABELS":             {"type": "enum", "default": config.DXF_LABELS, "label": "DXF labels (block: one label definition, larger file)", "options": ["text", "block"], "DEV_ONLY": False},
+    "INTERPOLATION":          {"type": "enum", "default": config.INTERPOLATION, "label": "Grid interpolation", "options": ["grid", "bicubic", "linear", "colocate"], "DEV_ONLY": False},
     "PREGEX_FLOAT4":          {"type": "str",  "default": config.PREGEX_FLOAT4, "label": "Regex Float4", "DEV_ONLY": True},
     "PREGEX_DMS":             {"type": "str",  "default": config.PREGEX_DMS, "label": "Regex DMS", "DEV_ONLY": True},
     "PREGEX_DMS4":            {"type": "str",  "default": config.PREGEX_DMS4, "label": "Regex DMS4", "DEV_ONLY": True},
@@ -151,7 +158,10 @@ SETTINGS_LABELS_RO = {
     "SWAP_LATLON_SHP": "Inversează Lat/Lon în SHP",
     "FMT_SPACE_SIZE": "Spațiere format fix",
     "CHUNK_SIZE": "Dimensiune bloc de procesare",
-    "MAX_POINTS_FOR_DXF": "Puncte max pentru DXF",
+    "DXF_VERSION": "Versiune DXF",
+    "DXF_FORMAT": "Format DXF (binar/ASCII)",
+    "DXF_LABELS": "Etichete DXF (bloc: o singură definiție, fișier mai mare)",
+    "INTERPOLATION": "Interpolare grid (grid/bicubic/liniar/colocare)",
     "PREGEX_FLOAT4": "Regex pentru coordonate float",
     "PREGEX_DMS": "Regex pentru DMS",
     "PREGEX_DMS4": "Regex pentru DMS cu 4 componente",
@@ -306,6 +316,9 @@ class SettingsDialog(QDialog):
                 log(f"Config: SET {key} = {val}", also_print=True)
                 save_config_setting(section, key, val, grid_mgmt.ROMGEO_APPDATA / "config.ini")
 
+        # Apply the saved settings to this session (config and parse plan), not just to the next start
+        load_config_overrides(grid_mgmt.ROMGEO_APPDATA / "config.ini")
+
         self.accept()
 
 if __name__ == "__main__":
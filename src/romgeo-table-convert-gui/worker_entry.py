@@ -0,0 +1,526 @@
+# Minimal entry module for conversion pool workers.
+#
+# Spawned workers import the module that defines the submitted function. This one imports only the
+# standard library, NumPy and the romgeo_lite transform kernels: no Qt, config, logutil (which touches
+# the log file) or grid_mgmt (which creates AppData folders). Grids and parser settings arrive as plain
+# data from the parent (see init_worker); startup time and RSS are reported back by startup_info().
+
+import os
+import sys
+import time
+
+_T_IMPORT = time.perf_counter()
+
+import re
+
+import numpy as np
+
+from romgeo_lite import sharedgrid
+from romgeo_lite import transformations
+
+from conversion_result import ConversionResult, ETRS_ST70_FIELDS, ST70_ETRS_FIELDS
+from conversion_result import STATUS_OK, STATUS_FLIPPED, STATUS_NOT_CONVERGED, STATUS_INVALID, STATUS_OUT_OF_BOUNDS, STATUS_FAILED
+import shared_result
+from parse_plan import ParsePlan
+
+# (pid, seconds) of this module's imports; a forked worker inherits the values of the process that imported it
+_IMPORTED = (os.getpid(), time.perf_counter() - _T_IMPORT)
+
+# Compiled parser patterns and bounds of this process, rebuilt by configure() when the settings change
+PLAN = ParsePlan({})
+
+_startup = {}
+
+# INTERPOLATION setting -> romgeo_lite interpolation code; 'grid' (or unset) keeps the grid's own setting
+_INTERPOLATIONS = {
+    'bicubic':  transformations.INTERP_BICUBIC,
+    'linear':   transformations.INTERP_LINEAR,
+    'colocate': transformations.INTERP_COLOCATE,
+}
+
+
+def configure(settings):
+    """Sets the worker settings (parser patterns, bounds and interpolation) for this process, compiling a
+    new PLAN only when they differ from the current one.
+
+    Args:
+        settings (dict): Worker settings, plain data from config (see functions.worker_settings).
+
+    Returns:
+        ParsePlan: The active plan.
+    """
+    global PLAN
+
+    if PLAN.settings != settings:
+        PLAN = ParsePlan(settings)
+
+    return PLAN
+
+
+def _process_stats(launched=None):
+    # (seconds since the process was created, RSS in MB); psutil where available. Otherwise the seconds since
+    # launched (the parent's time.time() when it started the pool) and the peak RSS from resource.
+    try:
+        import psutil
+        process = psutil.Process()
+        return time.time() - process.create_time(), process.memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+
+    boot_seconds = time.time() - launched if launched is not None else float('nan')
+    try:
+        import resource
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return boot_seconds, maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+    except ImportError:
+        return boot_seconds, float('nan')
+
+
+def init_worker(descriptor, settings, launched=None):
+    """Process-pool initializer: attaches the shared grids and loads the transform kernels once per worker.
+
+    Args:
+        descriptor (dict): romgeo_lite.sharedgrid.SharedGrids.descriptor of the active grid.
+        settings (dict): Worker settings, see configure().
+        launched (float, optional): The parent's time.time() when it started the pool, for the boot time
+            when psutil is not available.
+    """
+    t0 = time.perf_counter()
+
+    # Import time of this worker: 0 when the modules came with a fork instead of being imported here
+    import_pid, import_seconds = _IMPORTED
+    if import_pid != os.getpid():
+        import_seconds = 0.0
+
+    configure(settings)
+    sharedgrid.attach_worker(descriptor)
+
+    # One-point round trip so the compiled kernels are loaded now, not on the first chunk
+    t = transformations.get_transform(descriptor['filename'])
+    a, b, c = np.zeros(1), np.zeros(1), np.zeros(1)
+    t.etrs_to_st70(np.array([46.0]), np.array([25.0]), np.array([0.0]), a, b, c)
+    t.st70_to_etrs(a, b, c, np.zeros(1), np.zeros(1), np.zeros(1))
+
+    boot_seconds, rss_mb = _process_stats(launched)
+    _startup.update(pid=os.getpid(),
+                    boot_seconds=boot_seconds,
+                    import_seconds=import_seconds,
+                    init_seconds=time.perf_counter() - t0,
+                    rss_mb=rss_mb,
+                    modules=len(sys.modules))
+
+
+def startup_info(delay=0.1):
+    """Returns this worker's startup measurements: pid, seconds from process creation (from the pool start
+    without psutil) to ready (boot), seconds this worker spent importing NumPy/romgeo_lite and in init_worker,
+    RSS in MB and the number of loaded modules.
+
+    The short delay keeps the worker busy so a warm-up round reaches every worker, not just the first one up.
+    """
+    time.sleep(delay)
+    return dict(_startup, pid=os.getpid())
+
+
+def _job_interpolation(INTERPOLATION):
+    # The job's own interpolation override, else the configured INTERPOLATION (None: the grid's setting)
+    if INTERPOLATION is not None:
+        return INTERPOLATION
+    return _INTERPOLATIONS.get(PLAN.settings.get('INTERPOLATION'))
+
+
+def _inside_etrs_bounds(lat, lon):
+    bbox = PLAN.bbox
+    return (bbox[1] <= lat <= bbox[3]) and (bbox[0] <= lon <= bbox[2])
+
+
+def _parse_line_etrs(x) -> tuple[float, float, float, str, list[str]]:
+    """Converts parameter to decimal dgrees.
+        Also flips Lat/lon if needed
+    Args:
+        x (string, float, whatever): value to be converted
+    Raises:
+        Exception: "Bad Value" conversion cannot be done
+    Returns:
+        float: Decimal degrees
+    """
+    pointName = ''
+    comment = []
+
+    match = PLAN.search('dms4', x)
+    if not match:
+        # Try flipped version
+        match = PLAN.search('dms4_flipped', x)
+        if not match:
+            return np.nan, np.nan, np.nan, pointName if pointName else 'invalid_format', ['invalid format']
+        flipped = True
+    else:
+        flipped = False
+
+    x = match.groupdict()
+    pointName = x['name'] if x['name'] else ''
+
+    def parse_coord(dd_key, d_key, m_key, s_key):
+        if x.get(d_key) and x.get(m_key) and x.get(s_key):
+            return float(x[d_key]) + float(x[m_key]) / 60 + float(x[s_key]) / 3600
+        elif x.get(dd_key):
+            return float(x[dd_key])
+        return np.nan
+
+    lat = parse_coord('lat_dd', 'lat_d', 'lat_m', 'lat_s')
+    lon = parse_coord('lon_dd', 'lon_d', 'lon_m', 'lon_s')
+    he = float(x['height']) if x['height'] else np.nan
+
+    if flipped:
+        lat, lon = lon, lat
+        comment.append('flipped lat/lon')
+
+    if not _inside_etrs_bounds(lat, lon):
+        lat, lon, he = np.nan, np.nan, np.nan
+        comment.append('out of bounds')
+
+    return lat, lon, he, pointName, comment
+
+
+def _status_from_comment(comment):
+    if 'out of bounds' in comment:
+        return STATUS_OUT_OF_BOUNDS
+    if 'flipped lat/lon' in comment:
+        return STATUS_FLIPPED
+    return STATUS_OK
+
+
+# Fast path for plain decimal-degree tables, [name] lat lon h (or lon lat h) separated by blanks or commas:
+# the joined chunk is screened by one strict-row scan and tokenized by np.loadtxt in one pass, and the regex
+# parser only sees the rows the fast path cannot vouch for. The ranges mirror the lat_dd / lon_dd groups of PREGEX_DMS4 and PREGEX_DMS4_FLIPPED;
+# the sniffed sample is checked against the regex parser, so overridden patterns disable the fast path.
+_SNIFF_LINES = 32
+_BISECT_LINES = 16
+
+_LAT_RANGE = (43.0, 49.0)           # 4[3-8].ddd
+_LON_RANGE = (20.0, 40.0)           # [23]d.ddd
+_LON_RANGE_FLIPPED = (23.0, 37.0)   # (2[3-9]|3[0-6]).ddd
+
+
+def _suspect_rows(delimiter, has_name):
+    # Matches the rows that are not strictly "name lat lon h" / "lat lon h" with plain decimals: those
+    # PREGEX_DMS4 may read differently from the tokenizer (names it would not take as they are, signs,
+    # exponents, leading zeros, extra fields, ...). Possessive quantifiers keep the scan linear.
+    number = r"-?(?:[1-9][0-9]*+|0)(?:\.[0-9]++)?"
+    separator = r"[ \t]++" if delimiter is None else r"[ \t]*+,[ \t]*+"
+    name = r"(?![NnEe][0-9]|[45][0-9])[^\s\d,][^\s,]*+" + separator if has_name else ""
+
+    row = name + separator.join([number] * 3) + r"[ \t]*+$"
+    return re.compile(r"^(?!" + row + r").*", re.M)
+
+
+_SUSPECT_ROWS = {(delimiter, has_name): _suspect_rows(delimiter, has_name) for delimiter in (None, ',') for has_name in (True, False)}
+
+
+def _sniff_decimal_layout(sample):
+    """(delimiter, has name column) of a plain decimal table, from a sample of lines; None for any other
+    layout (DMS, unknown) or if the fast path reads less than half of the sample or disagrees with the
+    regex parser on any sample line it reads.
+    """
+    if not sample:
+        return None
+
+    delimiter = ',' if sum(',' in line for line in sample) * 2 > len(sample) else None
+    fields = [len(line.split(delimiter)) for line in sample]
+    layout = (delimiter, fields.count(4) > fields.count(3))
+
+    check = ConversionResult.empty(ETRS_ST70_FIELDS, len(sample))
+    regex_rows = set(_parse_decimal_block(sample, layout, check).tolist())
+    if len(regex_rows) * 2 > len(sample):
+        return None
+
+    for i, line in enumerate(sample):
+        if i in regex_rows:
+            continue
+        lat, lon, h, name, comment = _parse_line_etrs(line)
+        if (name != check.names[i] or _status_from_comment(comment) != check.status[i]
+                or not np.array_equal([lat, lon, h], check.values[:3, i], equal_nan=True)):
+            return None
+
+    return layout
+
+
+def _loadtxt_rows(lines, rows, layout, values, rejected):
+    # np.loadtxt over lines[rows] into values[rows]; blocks that fail are halved until they are small,
+    # whose rows are then left to the regex parser
+    delimiter, has_name = layout
+    if not len(rows):
+        return
+
+    try:
+        text = lines if len(rows) == len(lines) else [lines[i] for i in rows.tolist()]
+        parsed = np.loadtxt(text, delimiter=delimiter, usecols=(1, 2, 3) if has_name else (0, 1, 2), comments=None, ndmin=2)
+        if parsed.shape[0] != len(rows):
+            raise ValueError("blank lines")  # skipped by loadtxt, rows would not line up
+        values[rows] = parsed
+    except ValueError:
+        if len(rows) <= _BISECT_LINES:
+            rejected[rows] = True
+        else:
+            half = len(rows) // 2
+            _loadtxt_rows(lines, rows[:half], layout, values, rejected)
+            _loadtxt_rows(lines, rows[half:], layout, values, rejected)
+
+
+def _parse_decimal_block(lines, layout, result):
+    """Fills the rows of result that the decimal fast path accepts (lat, lon, h, name, status, bounds
+    checked as in _parse_line_etrs) and returns the indices of the rows left for the regex parser.
+    Do not call directly.
+    """
+    delimiter, has_name = layout
+    rows = len(lines)
+
+    rejected = np.zeros(rows, dtype=bool)
+    block = '\n'.join(lines)
+    if block.count('\n') != rows - 1:
+        return np.arange(rows)  # embedded line breaks, row numbers would not line up
+
+    starts = [m.start() for m in _SUSPECT_ROWS[layout].finditer(block)]
+    if starts:
+        offsets = np.cumsum([0] + [len(line) + 1 for line in lines])
+        rejected[np.searchsorted(offsets, starts, side='right') - 1] = True
+
+    values = np.full((rows, 3), np.nan)
+    _loadtxt_rows(lines, np.flatnonzero(~rejected), layout, values, rejected)
+
+    a, b, h = values.T
+    plain = ~rejected & (a != np.floor(a)) & (b != np.floor(b))  # no integer degrees, the patterns need a fraction
+    normal = plain & (_LAT_RANGE[0] <= a) & (a < _LAT_RANGE[1]) & (_LON_RANGE[0] <= b) & (b < _LON_RANGE[1])
+    flipped = plain & ~normal & (_LON_RANGE_FLIPPED[0] <= a) & (a < _LON_RANGE_FLIPPED[1]) & (_LAT_RANGE[0] <= b) & (b < _LAT_RANGE[1])
+    fast = normal | flipped
+
+    # Same order as _parse_line_etrs: the FLIPPED pattern's groups already swap the columns and it swaps once more
+    lat, lon = a, b
+    bbox = PLAN.bbox
+    inside = (bbox[1] <= lat) & (lat <= bbox[3]) & (bbox[0] <= lon) & (lon <= bbox[2])
+
+    accepted = fast & inside
+    result.values[0][accepted], result.values[1][accepted], result.values[2][accepted] = lat[accepted], lon[accepted], h[accepted]
+    result.status[fast] = STATUS_OUT_OF_BOUNDS
+    result.status[accepted & normal] = STATUS_OK
+    result.status[accepted & flipped] = STATUS_FLIPPED
+
+    if has_name:
+        idx = np.flatnonzero(fast).tolist()
+        if delimiter is None:
+            result.names[idx] = [lines[i].split(None, 1)[0] for i in idx]
+        else:
+            result.names[idx] = [lines[i].split(delimiter, 1)[0].rstrip() for i in idx]
+
+    return np.flatnonzero(~fast)
+
+
+def _split_floats_from_text(line: str) -> tuple[float, float, float, str]:
+    """
+    Extracts a name (optional) followed by exactly three floats from a line using named regex groups.
+    Supports any separator: spaces, commas, tabs.
+
+    Returns NaN for float values if not exactly 3 are found.
+
+    Args:
+        line (str): Input line with optional name and three float values.
+
+    Returns:
+        Tuple[float, float, float, str]: Parsed values.
+    """
+    match = PLAN.match('float4', line.strip())
+    if not match:
+        return np.nan, np.nan, np.nan, ""
+
+    try:
+        x = float(match.group("val1"))
+        y = float(match.group("val2"))
+        z = float(match.group("val3"))
+        name = match.group("name").strip(" ,\t")
+        return x, y, z, name
+    except Exception:
+        return np.nan, np.nan, np.nan, ""
+
+
+def _unique_lines(lines):
+    """(distinct lines in first-seen order, index of every line into them); the index is slice(None)
+    when no line repeats. Do not call directly.
+    """
+    distinct = dict.fromkeys(lines)
+    if len(distinct) == len(lines):
+        return lines, slice(None)
+
+    position = {line: i for i, line in enumerate(distinct)}
+    return list(distinct), np.fromiter(map(position.__getitem__, lines), dtype=np.intp, count=len(lines))
+
+
+def _unique_points(*columns):
+    """(distinct coordinate rows as columns, index of every row into them); the index is slice(None)
+    when no point repeats. Do not call directly.
+    """
+    order = np.lexsort(columns[::-1])
+    ordered = [column[order] for column in columns]
+
+    first = np.ones(len(order), dtype=bool)  # first row of each run of equal points in sorted order
+    if len(order) > 1:
+        first[1:] = np.logical_or.reduce([column[1:] != column[:-1] for column in ordered])
+    if first.all():
+        return list(columns), slice(None)
+
+    inverse = np.empty(len(order), dtype=np.intp)
+    inverse[order] = np.cumsum(first) - 1
+    return [column[first] for column in ordered], inverse
+
+
+def _scatter(result, inverse):
+    """Expands a result over distinct lines back to one row per input line. Do not call directly."""
+    if isinstance(inverse, slice):
+        return result  # no repeated lines
+
+    return ConversionResult(result.fields, result.names[inverse], result.values[:, inverse], result.status[inverse], result.info)
+
+
+def convert_etrs_st70(multiText: list[str], GRID, INTERPOLATION = None) -> ConversionResult:
+    """Converts coordinates from ETRS89 to the ST70 system (worker side of functions.convert_etrs_st70).
+
+    Repeated lines are parsed once and repeated points transformed once, then scattered back to every
+    input row. Plain decimal tables go through the np.loadtxt fast path (see _parse_decimal_block), other
+    lines are parsed one by one with PREGEX_DMS4; then all distinct valid points are transformed in one call.
+
+    Args:
+        multiText (list[str]): A list of strings, each containing coordinates in ETRS89 format.
+        GRID (str | Path): Grid file.
+        INTERPOLATION (int | tuple[int, int], optional): Interpolation tier for this job. Defaults to the
+                               INTERPOLATION setting (see configure), 'grid' meaning the grid's own setting.
+
+    Returns:
+        ConversionResult: ETRS_ST70_FIELDS (lat, lon, h_ell, st70_x, st70_y, h_mn) per line, NaN and a
+        status code for lines that cannot be parsed or converted; info holds the number of input lines,
+        distinct lines and distinct points (lines, unique_lines, unique_points), the distinct lines read
+        by the fast path (parsed_fast) and by the regex parser (parsed_regex), and the PLAN pattern counters.
+    """
+    lines, line_index = _unique_lines(multiText)
+
+    result = ConversionResult.empty(ETRS_ST70_FIELDS, len(lines))
+    PLAN.reset_counters()
+    lat, lon, h, st_x, st_y, st_h = result.values
+
+    # Plain decimal tables are read in one pass; the regex parser takes the rows the fast path rejects
+    regex_rows = range(len(lines))
+    layout = _sniff_decimal_layout(lines[:_SNIFF_LINES])
+    if layout is not None:
+        regex_rows = _parse_decimal_block(lines, layout, result).tolist()
+
+    for i in regex_rows:
+        try:
+            lat[i], lon[i], h[i], result.names[i], comment = _parse_line_etrs(lines[i])
+        except Exception:
+            continue
+
+        result.status[i] = _status_from_comment(comment)
+
+    result.info.update(lines=len(multiText), unique_lines=len(lines), unique_points=0,
+                       parsed_fast=len(lines) - len(regex_rows), parsed_regex=len(regex_rows), **PLAN.counters())
+
+    valid = ~(np.isnan(lat) | np.isnan(lon) | np.isnan(h))
+    result.status[~valid & (result.status < STATUS_INVALID)] = STATUS_INVALID
+
+    if valid.any():
+        # Cached per process, reloaded only when the grid file changes
+        t = transformations.get_transform(GRID)
+
+        (p_lat, p_lon, p_h), point_index = _unique_points(lat[valid], lon[valid], h[valid])
+        result.info['unique_points'] = len(p_lat)
+
+        out_y, out_x, out_h = np.zeros((3, len(p_lat)))
+        try:
+            t.etrs_to_st70(p_lat, p_lon, p_h, out_y, out_x, out_h, interpolations=_job_interpolation(INTERPOLATION))
+            st_x[valid], st_y[valid], st_h[valid] = out_x[point_index], out_y[point_index], out_h[point_index]
+        except Exception:
+            pass  # leave output as NaN
+
+    result.status[valid & np.isnan(result.values).any(axis=0)] = STATUS_FAILED
+
+    return _scatter(result, line_index)
+
+
+def convert_st70_etrs89(multiText: list[str], GRID, INTERPOLATION = None) -> ConversionResult:
+    """Converts coordinates from ST70 to ETRS89 (worker side of functions.convert_st70_etrs89).
+
+    Repeated lines are parsed once and repeated points transformed once, then scattered back to every
+    input row. Distinct lines are parsed one by one, then all distinct valid points are transformed in one call.
+
+    Args:
+        multiText (list[str]): A list of strings with easting, northing, height and an optional name.
+        GRID (str | Path): Grid file.
+        INTERPOLATION (int | tuple[int, int], optional): Interpolation tier for this job. Defaults to the
+                               INTERPOLATION setting (see configure), 'grid' meaning the grid's own setting.
+
+    Returns:
+        ConversionResult: ST70_ETRS_FIELDS (st70_x, st70_y, h_mn, lat, lon, h_ell) per line, NaN and a
+        status code for lines that cannot be parsed or converted; info holds the number of input lines,
+        distinct lines and distinct points (lines, unique_lines, unique_points), the not_converged row
+        count and max_iterations of the iterative inverse, and the PLAN pattern counters.
+    """
+    lines, line_index = _unique_lines(multiText)
+
+    result = ConversionResult.empty(ST70_ETRS_FIELDS, len(lines))
+    PLAN.reset_counters()
+    e, n, h, lat, lon, z = result.values
+
+    for i, line in enumerate(lines):
+        e[i], n[i], h[i], result.names[i] = _split_floats_from_text(line)
+
+    valid = ~(np.isnan(e) | np.isnan(n) | np.isnan(h))
+    result.status[valid] = STATUS_OK
+    result.info.update(lines=len(multiText), unique_lines=len(lines), unique_points=0,
+                       not_converged=0, max_iterations=0, **PLAN.counters())
+
+    if valid.any():
+        # Cached per process, reloaded only when the grid file changes
+        t = transformations.get_transform(GRID)
+
+        (p_n, p_e, p_h), point_index = _unique_points(n[valid], e[valid], h[valid])
+        result.info['unique_points'] = count = len(p_n)
+
+        out_lat, out_lon, out_z = np.zeros((3, count))
+        iterations = np.zeros(count, dtype=np.int32)
+        converged = np.zeros(count, dtype=bool)
+        try:
+            t.st70_to_etrs(p_n, p_e, p_h, out_lat, out_lon, out_z, iterations, converged, interpolations=_job_interpolation(INTERPOLATION))
+            lat[valid], lon[valid], z[valid] = out_lat[point_index], out_lon[point_index], out_z[point_index]
+
+            not_converged = ~converged[point_index]
+            status = result.status[valid]
+            status[not_converged] = STATUS_NOT_CONVERGED
+            result.status[valid] = status
+            result.info['max_iterations'] = int(iterations.max())
+        except Exception:
+            pass
+
+    result.status[valid & np.isnan(result.values).any(axis=0)] = STATUS_FAILED
+
+    # Counted per input row, after the scatter
+    result = _scatter(result, line_index)
+    result.info['not_converged'] = int(np.count_nonzero(result.status == STATUS_NOT_CONVERGED))
+
+    return result
+
+
+# Result fields of each conversion function, for preallocating its shared output
+RESULT_FIELDS = {
+    convert_etrs_st70:   ETRS_ST70_FIELDS,
+    convert_st70_etrs89: ST70_ETRS_FIELDS,
+}
+
+
+def convert_into_shared(func, multiText, GRID, descriptor, start, INTERPOLATION = None) -> dict:
+    """Runs func (convert_etrs_st70 / convert_st70_etrs89) on one chunk and writes its rows into the
+    parent's shared result (shared_result.SharedResult) at row start.
+
+    Returns:
+        dict: The chunk summary from shared_result.write_chunk (status counts, info, timing); the
+        converted values themselves stay in shared memory.
+    """
+    t0 = time.perf_counter()
+    result = func(multiText, GRID, INTERPOLATION)
+    return shared_result.write_chunk(descriptor, start, multiText, result, time.perf_counter() - t0)
@@ -0,0 +1,205 @@
+import os
+import atexit
+import multiprocessing
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from logutil import log
+
+
+class WarmPool:
+    """Long-lived process pool whose workers keep romgeo_lite imported and the active grid loaded.
+
+    The pool is built on first use for a grid file and reused by every following job. It is rebuilt
+    (grid hot-swap) when a job asks for another grid file or when the grid file changed on disk
+    (size/mtime); the old workers finish their queued chunks before the old shared grids are released.
+    Workers are spawned (not forked, on every platform) and start through worker_entry.init_worker, so they
+    import only worker_entry and what it needs; submit worker_entry functions to keep them light.
+    settings are the worker settings passed to the workers (a dict, or a callable returning one so config
+    changes are picked up; a change restarts the workers). Qt-free, so it can be used headless:
+
+        with WarmPool(max_workers=4, settings=functions.worker_settings) as pool:
+            results = pool.run_chunks(worker_entry.convert_etrs_st70, chunks, grid_file)
+            result, stats = pool.run_shared(worker_entry.convert_etrs_st70, chunks, grid_file)
+    """
+
+    def __init__(self, max_workers=None, settings=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.settings = settings
+        self.startup = []
+
+        self._lock = threading.RLock()
+        self._executor = None
+        self._shared = None
+        self._key = None
+
+        atexit.register(self.shutdown)
+
+    @property
+    def grid_file(self):
+        return self._key[0] if self._key else None
+
+    def _settings(self):
+        settings = self.settings() if callable(self.settings) else self.settings
+        return settings or {}
+
+    def _pool_key(self, grid_file):
+        import romgeo_lite
+        path = os.path.realpath(os.fspath(grid_file))
+        return path, romgeo_lite.transformations._grid_fingerprint(path), repr(sorted(self._settings().items()))
+
+    def _start(self, key):
+        import romgeo_lite
+        import worker_entry
+
+        t0 = time.perf_counter()
+        shared = romgeo_lite.sharedgrid.SharedGrids(key[0])
+        try:
+            # spawn: a fork would copy the parent's Qt state and can deadlock on threads it holds (numba, Qt)
+            executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                           mp_context=multiprocessing.get_context('spawn'),
+                                           initializer=worker_entry.init_worker,
+                                           initargs=(shared.descriptor, self._settings(), time.time()))
+        except Exception:
+            shared.release()
+            raise
+
+        self._executor, self._shared, self._key = executor, shared, key
+        log(f"WarmPool: {self.max_workers} workers for {key[0]}, shared grids {shared.nbytes / (1024 * 1024):.1f} MB, "
+            f"published in {time.perf_counter() - t0:.3f} seconds", level='debug', also_print=True)
+
+    def _stop(self, wait=True):
+        executor, shared = self._executor, self._shared
+        self._executor = self._shared = self._key = None
+        self.startup = []
+
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+        if shared is not None:
+            shared.release()
+
+    def executor(self, grid_file):
+        """Return the executor for grid_file, (re)building the pool if the grid was swapped or changed on disk
+        or the worker settings changed."""
+        key = self._pool_key(grid_file)
+
+        with self._lock:
+            if self._executor is not None and self._key != key:
+                reason = "grid" if self._key[:2] != key[:2] else "worker settings"
+                log(f"WarmPool: {reason} changed ({self._key[0]} -> {key[0]}), restarting workers", level='info', also_print=True)
+                self._stop()
+
+            if self._executor is None:
+                self._start(key)
+
+            return self._executor
+
+    def warm(self, grid_file, background=True):
+        """Start the workers for grid_file ahead of the first job (spawn, import and grid attach) and log each
+        worker's startup time and RSS (also kept in self.startup)."""
+        def _warm():
+            try:
+                t0 = time.perf_counter()
+                import worker_entry
+
+                executor = self.executor(grid_file)
+                infos = [f.result() for f in [executor.submit(worker_entry.startup_info) for _ in range(self.max_workers)]]
+                self.startup = list({info['pid']: info for info in infos}.values())
+
+                for info in self.startup:
+                    log(f"WarmPool: worker {info['pid']} ready {info['boot_seconds']:.3f} s after start (imports {info['import_seconds']:.3f} s, "
+                        f"init {info['init_seconds']:.3f} s), RSS {info['rss_mb']:.1f} MB, {info['modules']} modules", level='info', also_print=True)
+                log(f"WarmPool: {len(self.startup)} workers ready in {time.perf_counter() - t0:.3f} seconds", level='debug', also_print=True)
+            except Exception as e:
+                log(f"WarmPool: warm-up failed: {e}", level='warning', also_print=True)
+                self.invalidate()
+
+        if not background:
+            _warm()
+            return None
+
+        thread = threading.Thread(target=_warm, name="WarmPool-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def run_chunks(self, func, chunks, grid_file, progress=None):
+        """Run func(chunk, grid_file) for every chunk on the warm workers.
+
+        Returns the per-chunk results in input order; progress(percent) is called as chunks complete.
+        A broken pool (crashed worker) is dropped so the next job starts fresh workers.
+        """
+        return self._run([(func, chunk, grid_file) for chunk in chunks], grid_file, progress)
+
+    def run_shared(self, func, chunks, grid_file, progress=None):
+        """Run a worker_entry conversion function over the chunks, with the workers writing their rows
+        straight into one shared-memory result (shared_result.SharedResult) instead of returning them.
+
+        Only per-chunk summaries travel back to this process. Returns (ConversionResult over the shared
+        arrays, per-chunk summaries in chunk order).
+        """
+        import worker_entry
+        from shared_result import SharedResult
+        from conversion_result import describe_dedup
+
+        t0 = time.perf_counter()
+        starts = np.cumsum([0] + [len(chunk) for chunk in chunks]).tolist()
+        shared = SharedResult(worker_entry.RESULT_FIELDS[func], starts[-1])
+
+        try:
+            calls = [(worker_entry.convert_into_shared, func, chunk, grid_file, shared.descriptor, start)
+                     for chunk, start in zip(chunks, starts)]
+            stats = self._run(calls, grid_file, progress)
+            result = shared.result([line for chunk in chunks for line in chunk], stats)
+        except BaseException:
+            shared.release()
+            raise
+
+        busy = sum(chunk['seconds'] for chunk in stats)
+        log(f"WarmPool: {len(result)} rows in {len(chunks)} chunks, {time.perf_counter() - t0:.3f} seconds "
+            f"({busy:.3f} worker seconds), {shared.nbytes / (1024 * 1024):.1f} MB shared result, "
+            f"{sum(len(chunk['names']) for chunk in stats)} names returned by value, counters {result.info}", level='debug', also_print=True)
+        log(f"WarmPool: {describe_dedup(result.info)} (per chunk)", level='info', also_print=True)
+
+        return result, stats
+
+    def _run(self, calls, grid_file, progress=None):
+        # Submit (func, *args) calls to the pool for grid_file; results in call order
+        results = [None] * len(calls)
+        total = len(calls)
+
+        try:
+            with self._lock:
+                executor = self.executor(grid_file)
+                futures = {executor.submit(*call): idx for idx, call in enumerate(calls)}
+
+            for i, future in enumerate(as_completed(futures)):
+                results[futures[future]] = future.result()
+                if progress is not None:
+                    progress(int(((i + 1) / total) * 100))
+
+        except BrokenProcessPool:
+            log("WarmPool: worker process died, the pool will be restarted on the next job", level='error', also_print=True)
+            self.invalidate()
+            raise
+
+        return results
+
+    def invalidate(self):
+        """Drop the current workers and shared grids without waiting; the next job starts a new pool."""
+        with self._lock:
+            self._stop(wait=False)
+
+    def shutdown(self):
+        with self._lock:
+            self._stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
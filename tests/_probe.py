@@ -0,0 +1,8 @@
+# _probe - Tiny helpers submitted to spawned pool workers by the tests (imports nothing else)
+
+import sys
+
+
+def loaded(names):
+    """The subset of names already imported in this process."""
+    return sorted(name for name in names if name in sys.modules)
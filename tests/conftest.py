@@ -0,0 +1,78 @@
+# conftest - Shared fixtures: import path, throw-away app data folder and a small synthetic .spg grid
+
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# logutil and grid_mgmt create their folders under LOCALAPPDATA at import, keep them out of the tree
+os.environ['LOCALAPPDATA'] = tempfile.mkdtemp(prefix='romgeo-tests-')
+# NumPy kernels by default; the numba tests switch the backend explicitly
+os.environ.setdefault('ROMGEO_BACKEND', 'numpy')
+
+APP_DIR = Path(__file__).resolve().parents[1] / 'src' / 'romgeo-table-convert-gui'
+sys.path.insert(0, str(APP_DIR))
+
+
+def _smooth(rng, shape, amp):
+    # Smooth synthetic surface with a little node noise
+    r, c = np.meshgrid(np.linspace(0, 3, shape[1]), np.linspace(0, 2, shape[0]))
+    return amp * np.sin(r * 1.3 + rng.random()) * np.cos(c * 0.7 + rng.random()) + 0.05 * amp * rng.standard_normal(shape)
+
+
+def make_grid_data(seed=0):
+    """
+    .spg dictionary with a 5 km Stereo70 shift grid and a 2' geoid grid covering Romania.
+    """
+    rng = np.random.default_rng(seed)
+    shifts = np.stack([_smooth(rng, (121, 161), 1.5), _smooth(rng, (121, 161), 1.2)]).astype(np.float32)
+    geoid = (_smooth(rng, (165, 325), 20)[None] + 30).astype(np.float32)
+
+    return {
+        'params': {'version': '4.0.8', 'helmert': {
+            'os_st70': {'tE': 119.7, 'tN': -1.2, 'dm': 3.2, 'Rz': 1.1},
+            'st70_os': {'tE': -119.68, 'tN': 1.25, 'dm': -3.2, 'Rz': -1.1}}},
+        'grids': {
+            'geodetic_shifts': {'name': 'etrs_krasovsky', 'source': 'etrs89', 'target': 'st70', 'grid': shifts,
+                                'metadata': {'ndim': 2, 'mine': 100000.0, 'maxe': 900000.0, 'minn': 200000.0, 'maxn': 800000.0,
+                                             'stepe': 5000.0, 'stepn': 5000.0, 'crs_type': 'projected', 'ncols': 161, 'nrows': 121}},
+            'geoid_heights': {'name': 'geoid', 'source': 'etrs89', 'target': 'bs75', 'grid': geoid,
+                              'metadata': {'ndim': 1, 'minla': 19.9, 'maxla': 30.7, 'minphi': 43.3, 'maxphi': 48.76,
+                                           'stepla': 1 / 30, 'stepphi': 1 / 30, 'crs_type': 'geodetic', 'ncols': 325, 'nrows': 165}}},
+        'metadata': {'release': {'major': 25, 'minor': 4, 'revision': 0, 'legacy': 'no'}},
+    }
+
+
+def write_grid_file(path, seed=0):
+    with open(path, 'wb') as f:
+        pickle.dump(make_grid_data(seed), f)
+    return str(path)
+
+
+@pytest.fixture(scope='session')
+def grid_file(tmp_path_factory):
+    """
+    Legacy (pickled) .spg file, shared by the whole session: do not modify it.
+    """
+    return write_grid_file(tmp_path_factory.mktemp('grids') / 'rom_grid3d_25.04.spg')
+
+
+@pytest.fixture
+def own_grid_file(tmp_path):
+    """
+    Private copy of the synthetic grid for tests that touch or rewrite the file.
+    """
+    return write_grid_file(tmp_path / 'rom_grid3d_25.04.spg')
+
+
+@pytest.fixture
+def etrs_points():
+    """
+    Random ETRS89 points inside Romania: (lat, lon, height).
+    """
+    rng = np.random.default_rng(42)
+    return rng.uniform(44.0, 48.0, 200), rng.uniform(21.0, 29.0, 200), rng.uniform(50.0, 900.0, 200)
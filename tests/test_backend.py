@@ -0,0 +1,97 @@
+# test_backend - numba kernels against the NumPy path and the compile-failure fallback
+
+import logging
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from romgeo_lite import backend
+from romgeo_lite import transformations
+
+
+@pytest.fixture
+def transform(grid_file):
+    return transformations.Transform(grid_file)
+
+
+def _etrs_to_st70(t, lat, lon, z):
+    out = [np.empty_like(lat) for _ in range(3)]
+    t.etrs_to_st70(lat, lon, z, *out)
+    return out
+
+
+def _numba_backend(monkeypatch, kernels=None):
+    monkeypatch.setattr(backend, '_backend', backend.BACKEND_NUMBA)
+    monkeypatch.setattr(backend, '_kernels', kernels)
+
+
+def test_numba_matches_numpy(transform, etrs_points, monkeypatch):
+    pytest.importorskip('numba')
+    e, n, height = _etrs_to_st70(transform, *etrs_points)
+    expected = [np.empty_like(e) for _ in range(3)]
+    transform.st70_to_etrs(e, n, height, *expected)
+
+    _numba_backend(monkeypatch)
+    assert backend.kernels() is not None
+
+    for got, want in zip(_etrs_to_st70(transform, *etrs_points), (e, n, height)):
+        np.testing.assert_allclose(got, want, rtol=0, atol=1e-6)
+
+    lat, lon, z = (np.empty_like(e) for _ in range(3))
+    iterations, converged = np.empty(e.shape, dtype=np.int32), np.empty(e.shape, dtype=np.bool_)
+    transform.st70_to_etrs(e, n, height, lat, lon, z, iterations, converged)
+    np.testing.assert_allclose(lat, expected[0], rtol=0, atol=1e-10)
+    np.testing.assert_allclose(lon, expected[1], rtol=0, atol=1e-10)
+    np.testing.assert_allclose(z, expected[2], rtol=0, atol=1e-6)
+    assert converged.all() and (iterations > 0).all()
+    assert backend.active_backend() == backend.BACKEND_NUMBA
+
+
+def test_compile_error_falls_back_to_numpy(transform, etrs_points, monkeypatch, caplog):
+    errors = pytest.importorskip('numba.core.errors')
+    expected = _etrs_to_st70(transform, *etrs_points)
+
+    def bulk_etrs_to_st70(*args):
+        raise errors.TypingError('cannot type')
+
+    _numba_backend(monkeypatch, types.SimpleNamespace(bulk_etrs_to_st70=bulk_etrs_to_st70))
+
+    with caplog.at_level(logging.WARNING, logger=backend.__name__):
+        result = _etrs_to_st70(transform, *etrs_points)
+
+    assert backend.active_backend() == backend.BACKEND_NUMPY
+    assert 'bulk_etrs_to_st70 failed to compile' in caplog.text
+    for got, want in zip(result, expected):
+        np.testing.assert_array_equal(got, want)
+
+
+def test_other_errors_are_not_swallowed(transform, etrs_points, monkeypatch):
+    pytest.importorskip('numba')
+
+    def bulk_etrs_to_st70(*args):
+        raise ValueError('bad input')
+
+    _numba_backend(monkeypatch, types.SimpleNamespace(bulk_etrs_to_st70=bulk_etrs_to_st70))
+
+    with pytest.raises(ValueError):
+        _etrs_to_st70(transform, *etrs_points)
+    assert backend.active_backend() == backend.BACKEND_NUMBA
+
+
+def test_broken_numba_reports_numpy(monkeypatch, caplog):
+    _numba_backend(monkeypatch)
+    monkeypatch.setitem(sys.modules, 'romgeo_lite.kernels_numba', None)  # import fails
+    monkeypatch.delattr(sys.modules['romgeo_lite'], 'kernels_numba', raising=False)
+
+    with caplog.at_level(logging.WARNING, logger=backend.__name__):
+        assert backend.active_backend() == backend.BACKEND_NUMPY
+    assert 'numba could not be loaded' in caplog.text
+
+
+def test_coefficient_tables_only_for_numpy(grid_file, monkeypatch):
+    assert transformations.Transform(grid_file, precompute=True).coefficients[0] is not None
+
+    _numba_backend(monkeypatch, types.SimpleNamespace())
+    assert transformations.Transform(grid_file, precompute=True).coefficients == (None, None)
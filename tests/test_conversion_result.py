@@ -0,0 +1,91 @@
+# test_conversion_result - Columnar results: concat, legacy rows, zero-copy columns and DataFrame/Table export
+
+import sys
+
+import numpy as np
+import pytest
+
+from conversion_result import (ConversionResult, ETRS_ST70_FIELDS, STATUS_FAILED, STATUS_INVALID, STATUS_OK,
+                               merge_info)
+
+
+def _result(rows, offset=0.0, info=None):
+    result = ConversionResult.empty(ETRS_ST70_FIELDS, rows)
+    result.names[:] = [f"P{i}" for i in range(rows)]
+    result.values[:] = np.arange(len(ETRS_ST70_FIELDS) * rows, dtype=np.float64).reshape(-1, rows) + offset
+    result.status[:] = STATUS_OK
+    result.info = info or {}
+    return result
+
+
+def test_empty_is_invalid_and_nan():
+    result = ConversionResult.empty(ETRS_ST70_FIELDS, 3)
+    assert len(result) == 3
+    assert np.isnan(result.values).all() and not result.converted.any()
+    assert result.status_counts() == {'invalid format': 3}
+
+
+def test_concat_joins_in_order_and_merges_info():
+    a = _result(2, info={'lines': 2, 'max_iterations': 3})
+    b = _result(3, offset=100.0, info={'lines': 3, 'max_iterations': 5})
+
+    result = ConversionResult.concat([a, None, b])
+
+    assert len(result) == 5
+    np.testing.assert_array_equal(result['lat'], np.concatenate([a['lat'], b['lat']]))
+    assert result.info == {'lines': 5, 'max_iterations': 5}
+    assert merge_info([{'max_x': 1}, {'max_x': 0}]) == {'max_x': 1}
+
+    with pytest.raises(ValueError):
+        ConversionResult.concat([None])
+
+
+def test_rows_are_the_legacy_tuples():
+    result = _result(2)
+    result.values[1, 1] = np.nan
+    result.status[1] = STATUS_FAILED
+
+    rows = list(result)
+    assert rows[0] == ('P0', 0.0, 2.0, 4.0, 6.0, 8.0, 10.0)
+    assert rows[1][0] == 'P1' and np.isnan(rows[1][2])
+    assert result.converted.tolist() == [True, False]
+    assert result.status_counts() == {'ok': 1, 'transformation failed': 1}
+
+
+def test_columns_view_the_values():
+    result = _result(4)
+    columns = result.columns(('Name', 'B', 'L', 'H', 'X', 'Y', 'Z'))
+
+    assert list(columns) == ['Name', 'B', 'L', 'H', 'X', 'Y', 'Z']
+    assert columns['Name'] is result.names
+    assert all(np.shares_memory(columns[label], result.values) for label in 'BLHXYZ')
+    assert result['st70_x'].flags.c_contiguous
+
+
+def test_to_pandas_views_the_float_columns():
+    pytest.importorskip('pandas')
+    result = _result(4)
+    result.status[0] = STATUS_INVALID
+
+    frame = result.to_pandas(['Name', 'B', 'L', 'H', 'X', 'Y', 'Z'])
+
+    assert list(frame.columns) == ['Name', 'B', 'L', 'H', 'X', 'Y', 'Z']
+    assert frame['Name'].tolist() == ['P0', 'P1', 'P2', 'P3']
+    for label, field in zip('BLHXYZ', ETRS_ST70_FIELDS):
+        assert np.shares_memory(frame[label].to_numpy(), result.values)
+        np.testing.assert_array_equal(frame[label].to_numpy(), result[field])
+
+
+def test_to_arrow():
+    pa = pytest.importorskip('pyarrow')
+    table = _result(3).to_arrow()
+
+    assert table.column_names == ['name'] + list(ETRS_ST70_FIELDS)
+    assert table.schema.field('name').type == pa.string()
+    assert table.column('lon').to_pylist() == [3.0, 4.0, 5.0]
+
+
+def test_to_arrow_without_pyarrow(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    with pytest.raises(ImportError, match='requires pyarrow'):
+        _result(1).to_arrow()
@@ -0,0 +1,54 @@
+# test_crs - Static CRS parameter table against the pyproj database it was taken from
+
+import subprocess
+import sys
+
+import pytest
+
+from conftest import APP_DIR
+from romgeo_lite import crs
+
+pyproj = pytest.importorskip('pyproj')
+
+# to_dict() of a pyproj CRS warns about PROJ string conversion
+pytestmark = pytest.mark.filterwarnings('ignore::UserWarning')
+
+
+def _from_pyproj(crs_code, ellipsoid_code=None):
+    c = crs.crs.__new__(crs.crs)
+    c.crs_code = crs_code
+    c._init_pyproj(crs_code, ellipsoid_code)
+    return c
+
+
+@pytest.mark.parametrize('codes', [(3844, None), (4258, None), (3844, 4258), (3844, 7019)])
+def test_static_table_matches_pyproj(codes):
+    static = crs.crs(*codes)
+    reference = _from_pyproj(*codes)
+
+    assert 'crs' not in static.__dict__  # served from the table
+    assert static.projection == pytest.approx(reference.projection)
+    assert int(static.ellipsoid_code) == int(reference.ellipsoid_code)
+    assert [tuple(a) for a in static.axes] == [(a.name, a.abbrev, a.direction, a.unit_name) for a in reference.axes]
+
+
+def test_static_codes_do_not_load_pyproj():
+    code = ("import sys; sys.path.insert(0, sys.argv[1]); from romgeo_lite import crs, projections; "
+            "projections.stereographic(3844); crs.crs(4258); print('pyproj' in sys.modules)")
+    out = subprocess.run([sys.executable, '-c', code, str(APP_DIR)], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == 'False'
+
+
+def test_other_codes_fall_back_to_pyproj():
+    c = crs.crs(32635)  # WGS 84 / UTM zone 35N
+    assert c.projection['proj'] == 'utm' and c.projection['zone'] == 35
+    assert c.crs.to_epsg() == 32635
+
+    with pytest.raises(NotImplementedError):
+        crs.crs(3844, 999999)
+
+
+def test_pyproj_objects_are_built_on_demand():
+    c = crs.crs(3844)
+    assert c.crs.to_epsg() == 3844
+    assert c.ellipsoid.semi_major_metre == c.projection['a']
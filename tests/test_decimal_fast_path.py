@@ -0,0 +1,100 @@
+# test_decimal_fast_path - np.loadtxt fast path for decimal tables against the PREGEX_DMS4 line parser
+
+import numpy as np
+import pytest
+
+import functions
+import worker_entry
+from conversion_result import ConversionResult, ETRS_ST70_FIELDS
+
+# Lines the fast path must leave to the regex parser
+SUSPECT = [
+    "P1 +45.5 25.5 100.0",       # sign
+    "P2 45.5e0 25.5 100.0",      # exponent
+    "P3 045.5 25.5 100.0",       # leading zero
+    "N45.5 45.5 25.5 100.0",     # name the pattern would read as a coordinate
+    "P4 45.5 25.5 100.0 7",      # extra field
+    "P5 45 25.5 100.0",          # integer degrees
+    "P6 45 30 0.5 25 30 0.5 100",  # DMS
+    "",
+    "P7 45.5  25.5",             # missing height
+]
+
+
+@pytest.fixture(autouse=True)
+def plan():
+    worker_entry.configure(functions.worker_settings())
+
+
+def _lines(etrs_points, delimiter=' ', names=True):
+    lines = []
+    for i, (lat, lon, h) in enumerate(zip(*etrs_points)):
+        fields = [f"{lat:.9f}", f"{lon:.9f}", f"{h:.3f}"]
+        if i == 10:
+            fields[1] = "29.900000000"  # east of the bounding box
+        elif i % 7 == 3 and lon >= 23:
+            fields[:2] = fields[1::-1]  # lon lat h, read by PREGEX_DMS4_FLIPPED
+        lines.append(delimiter.join(([f"P{i}"] if names else []) + fields))
+    return lines
+
+
+def _assert_matches_regex_parser(lines, result, regex_rows):
+    for i, line in enumerate(lines):
+        if i in regex_rows:
+            continue
+        lat, lon, h, name, comment = worker_entry._parse_line_etrs(line)
+        assert result.names[i] == name, line
+        assert result.status[i] == worker_entry._status_from_comment(comment), line
+        np.testing.assert_array_equal(result.values[:3, i], [lat, lon, h], err_msg=line)
+
+
+@pytest.mark.parametrize('delimiter, names', [(' ', True), (' ', False), (',', True), (', ', False), ('\t', True)])
+def test_fast_rows_match_the_regex_parser(etrs_points, delimiter, names):
+    lines = _lines(etrs_points, delimiter, names)
+    layout = worker_entry._sniff_decimal_layout(lines[:worker_entry._SNIFF_LINES])
+    assert layout == ((',' if ',' in delimiter else None), names)
+
+    result = ConversionResult.empty(ETRS_ST70_FIELDS, len(lines))
+    regex_rows = set(worker_entry._parse_decimal_block(lines, layout, result).tolist())
+
+    flipped = sum(i % 7 == 3 and lon >= 23 for i, lon in enumerate(etrs_points[1]) if i != 10)
+    assert not regex_rows
+    assert result.status_counts()['ok'] == len(lines) - flipped - 1
+    _assert_matches_regex_parser(lines, result, regex_rows)
+
+
+def test_suspect_rows_go_to_the_regex_parser(etrs_points):
+    lines = _lines(etrs_points)
+    positions = list(range(5, 5 + 10 * len(SUSPECT), 10))
+    for position, line in zip(positions, SUSPECT):
+        lines[position] = line
+
+    result = ConversionResult.empty(ETRS_ST70_FIELDS, len(lines))
+    regex_rows = worker_entry._parse_decimal_block(lines, (None, True), result).tolist()
+
+    # A failing np.loadtxt block is bisected down to _BISECT_LINES rows, whose neighbours also fall back
+    assert set(positions) <= set(regex_rows)
+    assert len(regex_rows) <= len(SUSPECT) * worker_entry._BISECT_LINES
+    _assert_matches_regex_parser(lines, result, regex_rows)
+
+
+def test_conversion_is_the_same_either_way(etrs_points, grid_file, monkeypatch):
+    lines = _lines(etrs_points)
+    lines[50:50 + len(SUSPECT)] = SUSPECT
+
+    fast = worker_entry.convert_etrs_st70(lines, grid_file)
+    assert fast.info['parsed_regex'] >= len(SUSPECT) and fast.info['parsed_fast'] > len(lines) // 2
+
+    monkeypatch.setattr(worker_entry, '_sniff_decimal_layout', lambda sample: None)
+    regex = worker_entry.convert_etrs_st70(lines, grid_file)
+    assert regex.info['parsed_fast'] == 0
+
+    np.testing.assert_array_equal(fast.names, regex.names)
+    np.testing.assert_array_equal(fast.values, regex.values)
+    np.testing.assert_array_equal(fast.status, regex.status)
+
+
+def test_other_layouts_are_not_sniffed():
+    dms = ["P1 45 30 0.5 25 30 0.5 100"] * 8
+    assert worker_entry._sniff_decimal_layout(dms) is None
+    assert worker_entry._sniff_decimal_layout([]) is None
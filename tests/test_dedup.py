@@ -0,0 +1,65 @@
+# test_dedup - Repeated lines parsed once and repeated points transformed once, scattered back per row
+
+import numpy as np
+
+import functions
+import worker_entry
+from conversion_result import ConversionResult, ETRS_ST70_FIELDS
+
+
+def test_unique_lines_keep_first_seen_order():
+    lines = ["b", "a", "b", "c", "a"]
+    distinct, index = worker_entry._unique_lines(lines)
+
+    assert distinct == ["b", "a", "c"]
+    assert [distinct[i] for i in index] == lines
+
+    distinct, index = worker_entry._unique_lines(["a", "b"])
+    assert distinct == ["a", "b"] and index == slice(None)
+
+
+def test_unique_points_map_every_row():
+    lat = np.array([45.1, 45.2, 45.1, 45.1, -0.0])
+    lon = np.array([25.1, 25.2, 25.1, 25.3, 0.0])
+    h = np.array([100.0, 100.0, 100.0, 100.0, 0.0])
+
+    (p_lat, p_lon, p_h), index = worker_entry._unique_points(lat, lon, h)
+
+    assert len(p_lat) == 4
+    np.testing.assert_array_equal(p_lat[index], lat)
+    np.testing.assert_array_equal(p_lon[index], lon)
+    np.testing.assert_array_equal(p_h[index], h)
+
+    columns, index = worker_entry._unique_points(lat[:2], lon[:2], h[:2])
+    assert index == slice(None)
+    np.testing.assert_array_equal(columns[0], lat[:2])
+
+
+def test_scatter_expands_rows():
+    result = ConversionResult.empty(ETRS_ST70_FIELDS, 2)
+    result.names[:] = ["A", "B"]
+    result.values[:] = [[1.0, 2.0]] * len(ETRS_ST70_FIELDS)
+
+    expanded = worker_entry._scatter(result, np.array([1, 0, 1]))
+    assert expanded.names.tolist() == ["B", "A", "B"]
+    assert expanded['lat'].tolist() == [2.0, 1.0, 2.0]
+    assert worker_entry._scatter(result, slice(None)) is result
+
+
+def test_repeated_input_converts_like_distinct_input(grid_file, etrs_points):
+    worker_entry.configure(functions.worker_settings())
+    lines = [f"P{i} {lat:.9f} {lon:.9f} {h:.3f}" for i, (lat, lon, h) in enumerate(zip(*etrs_points))]
+    # Same point under another name: a distinct line, a repeated point
+    renamed = [line.replace("P", "Q", 1) for line in lines[:50]]
+    repeated = lines + lines[::2] + renamed + ["bad line"] * 3
+
+    result = worker_entry.convert_etrs_st70(repeated, grid_file)
+    expected = [worker_entry.convert_etrs_st70([line], grid_file) for line in repeated]
+
+    assert result.info['lines'] == len(repeated)
+    assert result.info['unique_lines'] == len(lines) + 50 + 1
+    assert result.info['unique_points'] == len(lines)
+    np.testing.assert_array_equal(result.names, [r.names[0] for r in expected])
+    # Single points and batches may differ in the last bit (vectorised sums), not more
+    np.testing.assert_allclose(result.values, np.hstack([r.values for r in expected]), rtol=0, atol=1e-9)
+    np.testing.assert_array_equal(result.status, [r.status[0] for r in expected])
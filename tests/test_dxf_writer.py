@@ -0,0 +1,144 @@
+# test_dxf_writer - Streamed DXF point exports read back with ezdxf
+
+import numpy as np
+import pytest
+
+import config
+import dxf_writer
+
+ezdxf = pytest.importorskip('ezdxf')
+from ezdxf.lldxf.encoding import decode_dxf_unicode
+
+VERSIONS = {'R12': 'AC1009', 'R2000': 'AC1015'}
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(11)
+    rows = 250
+    x, y, z = rng.uniform(1e5, 9e5, rows), rng.uniform(1e5, 9e5, rows), rng.uniform(-10, 900, rows)
+    labels = np.array([f"P{i}" if i % 7 else f"Ștefănești {i}" for i in range(rows)], dtype=object)
+    return x, y, z, labels
+
+
+def _read(path):
+    doc = ezdxf.readfile(path)
+    assert not doc.audit().has_errors
+    return doc, doc.modelspace()
+
+
+@pytest.mark.parametrize('version', VERSIONS)
+@pytest.mark.parametrize('fmt', dxf_writer.FORMATS)
+def test_text_labels_round_trip(tmp_path, points, version, fmt):
+    x, y, z, labels = points
+    path = tmp_path / f'{version}_{fmt}.dxf'
+
+    rows = dxf_writer.write_points(path, x, y, z, labels, layer='Stereo70_EPSG3844', version=version, fmt=fmt,
+                                   label_mode='text', insunits=6, chunk_rows=100)
+    doc, msp = _read(path)
+
+    assert rows == len(x) and doc.dxfversion == VERSIONS[version]
+    if version == 'R2000':
+        assert doc.header['$INSUNITS'] == 6
+
+    located = np.array([p.dxf.location for p in msp.query('POINT')])
+    atol = 0 if fmt == 'bin' else 5e-7  # binary DXF stores the doubles, ASCII 6 decimals
+    np.testing.assert_allclose(located, np.c_[x, y, z], rtol=0, atol=atol)
+    assert {p.dxf.layer for p in msp.query('POINT')} == {'Stereo70_EPSG3844'}
+
+    texts = msp.query('TEXT')
+    assert [decode_dxf_unicode(t.dxf.text) for t in texts] == labels.tolist()
+    assert {t.dxf.layer for t in texts} == {'Labels'}
+    np.testing.assert_allclose(np.array([t.dxf.insert for t in texts])[:, :2], np.c_[x, y] + 5.0, rtol=0, atol=max(atol, 1e-9))
+    assert texts[0].dxf.height == 2.5
+
+
+def test_points_without_labels(tmp_path, points):
+    x, y, z, _ = points
+    path = tmp_path / 'points.dxf'
+    dxf_writer.write_points(path, x[:3], y[:3], z[:3], version='R2000', fmt='asc', label_mode='text', decimals=3)
+
+    _, msp = _read(path)
+    assert len(msp.query('POINT')) == 3 and not len(msp.query('TEXT'))
+    np.testing.assert_allclose([p.dxf.location for p in msp.query('POINT')], np.c_[x[:3], y[:3], z[:3]], atol=5e-4)
+
+
+def test_defaults_are_read_from_config_at_call_time(tmp_path, points, monkeypatch):
+    x, y, z, labels = points
+    monkeypatch.setattr(config, 'DXF_VERSION', 'R12')
+    monkeypatch.setattr(config, 'DXF_FORMAT', 'bin')
+    monkeypatch.setattr(config, 'DXF_LABELS', 'text')
+
+    path = tmp_path / 'config.dxf'
+    dxf_writer.write_points(path, x, y, z, labels)
+
+    assert path.read_bytes().startswith(b'AutoCAD Binary DXF')
+    doc, msp = _read(path)
+    assert doc.dxfversion == 'AC1009' and len(msp.query('TEXT')) == len(x)
+
+
+def test_unsupported_output_is_rejected(tmp_path, points):
+    x, y, z, labels = points
+    with pytest.raises(ValueError, match='unsupported DXF output'):
+        dxf_writer.write_points(tmp_path / 'bad.dxf', x, y, z, labels, version='R14')
+
+
+@pytest.mark.parametrize('version', VERSIONS)
+@pytest.mark.parametrize('fmt', dxf_writer.FORMATS)
+def test_block_labels_round_trip(tmp_path, points, version, fmt):
+    x, y, z, labels = points
+    x[0], y[0] = 512345.678901234, 398765.432109876  # float32 would round these by centimetres
+    path = tmp_path / f'block_{version}_{fmt}.dxf'
+
+    dxf_writer.write_points(path, x, y, z, labels, layer='Stereo70_EPSG3844', version=version, fmt=fmt,
+                            label_mode='block', decimals=9, chunk_rows=64)
+    doc, msp = _read(path)
+
+    definition = doc.blocks.get(dxf_writer.BLOCK_NAME)
+    assert sorted(a.dxf.tag for a in definition.query('ATTDEF')) == ['HEIGHT', 'NAME']
+
+    inserts = msp.query('INSERT')
+    assert len(inserts) == len(x) and not len(msp.query('POINT')) and not len(msp.query('TEXT'))
+    assert {i.dxf.name for i in inserts} == {dxf_writer.BLOCK_NAME}
+    assert {i.dxf.layer for i in inserts} == {'Stereo70_EPSG3844'}
+
+    inserted = np.array([i.dxf.insert for i in inserts])
+    if fmt == 'bin':
+        np.testing.assert_array_equal(inserted, np.c_[x, y, z])  # the doubles themselves
+    else:
+        written = [[float(format(value, '.9f')) for value in row] for row in zip(x.tolist(), y.tolist(), z.tolist())]
+        np.testing.assert_array_equal(inserted, written)  # correctly rounded to the decimals asked for
+    assert abs(inserted[0, 0] - np.float32(x[0])) > 1e-3
+
+    for insert, label, height in zip(inserts, labels.tolist(), z.tolist()):
+        attribs = {a.dxf.tag: a for a in insert.attribs}
+        assert decode_dxf_unicode(attribs['NAME'].dxf.text) == label
+        assert attribs['HEIGHT'].dxf.text == format(height, '.3f')
+        assert {a.dxf.layer for a in attribs.values()} == {'Labels'}
+    first = {a.dxf.tag: a for a in inserts[0].attribs}['NAME']
+    assert first.dxf.insert[0] == pytest.approx(x[0] + 5.0, abs=1e-6)
+
+
+@pytest.mark.parametrize('label_mode', dxf_writer.LABEL_MODES)
+@pytest.mark.parametrize('swap_xy', [False, True])
+def test_st70_export_keeps_full_precision(tmp_path, monkeypatch, label_mode, swap_xy):
+    functions_gis = pytest.importorskip('functions_gis')
+    from conversion_result import ConversionResult, ETRS_ST70_FIELDS
+
+    monkeypatch.setattr(config, 'DXF_FORMAT', 'bin')
+    monkeypatch.setattr(config, 'DXF_LABELS', label_mode)
+
+    rng = np.random.default_rng(2)
+    rows = 50
+    result = ConversionResult.empty(ETRS_ST70_FIELDS, rows)
+    result.names[:] = [f"P{i}" for i in range(rows)]
+    result.values[:] = [rng.uniform(44, 48, rows), rng.uniform(21, 29, rows), rng.uniform(50, 900, rows),
+                        rng.uniform(250000, 750000, rows), rng.uniform(150000, 850000, rows), rng.uniform(0, 900, rows)]
+
+    path = tmp_path / 'st70.dxf'
+    assert functions_gis.save_st70_as_dxf(result, path, swap_xy=swap_xy) == (path, rows)
+
+    _, msp = _read(path)
+    placed = np.array([e.dxf.location for e in msp.query('POINT')] or [e.dxf.insert for e in msp.query('INSERT')])
+    x, y = (result['st70_x'], result['st70_y']) if swap_xy else (result['st70_y'], result['st70_x'])
+    np.testing.assert_array_equal(placed, np.c_[x, y, result['h_mn']])  # not rounded to the millimetre
@@ -0,0 +1,111 @@
+# test_gridfile - SPG v2 container: round trip, checksum, memory-mapped loading and grid selection
+
+import numpy as np
+import pytest
+
+from conftest import make_grid_data
+from romgeo_lite import gridfile
+from romgeo_lite import transformations
+
+
+@pytest.fixture
+def spg2_file(tmp_path):
+    path = tmp_path / 'rom_grid3d_25.04.spg'
+    gridfile.write_spg2(make_grid_data(), path)
+    return str(path)
+
+
+def _corrupt(path):
+    _, data_offset = gridfile.read_header(path)
+    with open(path, 'r+b') as f:
+        f.seek(data_offset + 100)
+        byte = f.read(1)
+        f.seek(data_offset + 100)
+        f.write(bytes([byte[0] ^ 0xFF]))
+
+
+def test_round_trip(spg2_file):
+    original = make_grid_data()
+
+    assert gridfile.is_spg2(spg2_file)
+    assert gridfile.verify_spg2(spg2_file)
+
+    data = gridfile.read_spg2(spg2_file, verify=True)
+    assert data['params'] == original['params']
+    assert data['metadata'] == original['metadata']
+
+    for name, grid in original['grids'].items():
+        loaded = data['grids'][name]
+        assert isinstance(loaded['grid'], np.memmap) and not loaded['grid'].flags.writeable
+        assert loaded['grid'].dtype == np.float32
+        np.testing.assert_array_equal(loaded['grid'], grid['grid'])
+        assert loaded['metadata'] == grid['metadata']
+
+
+def test_convert_legacy_pickle(grid_file, tmp_path):
+    destination = gridfile.convert_spg(grid_file, tmp_path / 'converted.spg')
+
+    assert not gridfile.is_spg2(grid_file)
+    data = gridfile.load_grid_data(destination, verify=True)
+    assert data['grids']['geodetic_shifts']['grid'].dtype == np.float64
+    np.testing.assert_array_equal(data['grids']['geodetic_shifts']['grid'], gridfile.load_grid_data(grid_file)['grids']['geodetic_shifts']['grid'])
+
+
+def test_corrupted_data_fails_the_checksum(spg2_file):
+    _corrupt(spg2_file)
+
+    assert not gridfile.verify_spg2(spg2_file)
+    with pytest.raises(ValueError, match='checksum mismatch'):
+        gridfile.read_spg2(spg2_file, verify=True)
+
+    # Without verify the file still opens (the header is intact)
+    assert 'geodetic_shifts' in gridfile.load_grid_data(spg2_file)['grids']
+
+
+def test_newer_format_version_is_rejected(spg2_file):
+    with open(spg2_file, 'r+b') as f:
+        f.seek(4)
+        f.write((gridfile.SPG2_VERSION + 1).to_bytes(2, 'little'))
+
+    with pytest.raises(ValueError, match='newer than supported'):
+        gridfile.read_header(spg2_file)
+
+
+def test_transform_keeps_memory_mapped_grids(spg2_file, grid_file, etrs_points):
+    t = transformations.Transform(spg2_file)
+    for grid in (t.grid_shifts['grid'], t.geoid_heights['grid']):
+        assert isinstance(grid, np.memmap)
+        assert grid.dtype == np.float32 and not grid.flags.writeable
+
+    legacy = transformations.Transform(grid_file)
+    assert legacy.grid_shifts['grid'].dtype == np.float64
+
+    copies = transformations.grid_copy_count()
+    results = []
+    for transform in (t, legacy):
+        out = [np.empty_like(etrs_points[0]) for _ in range(3)]
+        transform.etrs_to_st70(*etrs_points, *out)
+        results.append(out)
+    assert transformations.grid_copy_count() == copies
+
+    # Same float32 node values, widened to float64 in the arithmetic either way
+    for mapped, pickled in zip(*results):
+        np.testing.assert_allclose(mapped, pickled, rtol=0, atol=1e-9)
+
+
+def test_latest_grid_reads_versions_through_gridfile(tmp_path, monkeypatch):
+    import grid_mgmt
+
+    for name, release in (('a.spg', (25, 4, 0)), ('b.spg', (25, 10, 1)), ('c.spg', (24, 12, 3))):
+        data = make_grid_data()
+        data['metadata']['release'].update(major=release[0], minor=release[1], revision=release[2])
+        gridfile.write_spg2(data, tmp_path / name)
+
+    calls = []
+    load = gridfile.load_grid_data
+    monkeypatch.setattr(gridfile, 'load_grid_data', lambda filename, verify=False: calls.append((filename, verify)) or load(filename, verify))
+
+    assert grid_mgmt._latest_grid(tmp_path).name == 'b.spg'
+    assert len(calls) == 3 and not any(verify for _, verify in calls)
+
+    assert grid_mgmt._compact_release_text(grid_mgmt._grid_release(tmp_path / 'b.spg', verify=True)) == '25.10-1'
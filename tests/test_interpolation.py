@@ -0,0 +1,198 @@
+# test_interpolation - Batched grid interpolators against the scalar per-point versions
+
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+from conftest import make_grid_data
+from romgeo_lite import transformations
+
+MINX, MINY, STEPX, STEPY = 100.0, 200.0, 10.0, 5.0
+
+
+@pytest.fixture
+def grid():
+    rng = np.random.default_rng(1)
+    return rng.normal(size=(12, 15))
+
+
+@pytest.fixture
+def xy():
+    # Inside the grid, on nodes, on the last valid cell and outside on every side
+    rng = np.random.default_rng(2)
+    x = np.concatenate([rng.uniform(MINX, MINX + 14 * STEPX, 300), [MINX, MINX + 20.0, MINX + 11 * STEPX - 1e-9, MINX - 50.0, MINX + 500.0, np.nan]])
+    y = np.concatenate([rng.uniform(MINY, MINY + 11 * STEPY, 300), [MINY, MINY + 10.0, MINY + 8 * STEPY - 1e-9, MINY + 5.0, MINY + 5.0, MINY]])
+    return x, y
+
+
+def _scalar(interp, x, y, grid):
+    return np.array([interp(xx, yy, MINX, MINY, STEPX, STEPY, grid) for xx, yy in zip(x, y)])
+
+
+def test_bicubic_vec_matches_scalar(grid, xy):
+    x, y = xy
+    expected = _scalar(transformations._doBSInterpolation, x[:-1], y[:-1], grid)
+    result = transformations._doBSInterpolation_vec(x[:-1], y[:-1], MINX, MINY, STEPX, STEPY, grid)
+
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-12)
+
+
+def test_bicubic_vec_nan_input_and_bounds(grid, xy):
+    x, y = xy
+    result = transformations._doBSInterpolation_vec(x, y, MINX, MINY, STEPX, STEPY, grid)
+
+    # Past the last usable cell and NaN coordinates (left of the grid the legacy abs() offset mirrors)
+    assert np.isnan(result[-2:]).all()
+    assert np.isfinite(result[:300]).sum() > 200
+
+
+def test_spline_matrix_reproduces_bicubic_surface(grid):
+    # ff @ _SPLINE_MATRIX @ az is the same linear map as _bicubic_surface
+    rng = np.random.default_rng(3)
+    az = rng.normal(size=16)
+    xk, yk = 0.3, 0.7
+    ff = np.array(transformations._spline_params(xk, yk)[1:])
+
+    expected = transformations._bicubic_surface((0.0,) + tuple(az), (0.0,) + tuple(ff))
+    assert ff @ transformations._SPLINE_MATRIX @ az == pytest.approx(expected, abs=1e-12)
+
+
+def test_bicubic_bands_share_weights(grid, xy):
+    x, y = xy
+    bands = np.stack([grid, 2 * grid + 1])
+
+    result = transformations._doBSInterpolation_vec(x, y, MINX, MINY, STEPX, STEPY, bands)
+    assert result.shape == (2, x.size)
+
+    for band in range(2):
+        np.testing.assert_allclose(result[band], transformations._doBSInterpolation_vec(x, y, MINX, MINY, STEPX, STEPY, bands[band]), rtol=0, atol=1e-12)
+
+    # The scalar interpolator returns one value per band as well
+    np.testing.assert_allclose(transformations._doBSInterpolation(x[0], y[0], MINX, MINY, STEPX, STEPY, bands), result[:, 0], rtol=0, atol=1e-12)
+
+
+def test_coefficient_table_matches_direct(grid, xy):
+    x, y = xy
+    table = transformations._bicubic_coefficients(grid)
+
+    direct = transformations._doBSInterpolation_vec(x, y, MINX, MINY, STEPX, STEPY, grid)
+    from_table = transformations._doBSInterpolation_table(x, y, MINX, MINY, STEPX, STEPY, table)[0]
+
+    np.testing.assert_array_equal(np.isnan(from_table), np.isnan(direct))
+    np.testing.assert_allclose(from_table, direct, rtol=0, atol=1e-12)
+
+
+def test_coefficient_cache_reused_and_rebuilt(own_grid_file, monkeypatch):
+    t = transformations.Transform(own_grid_file, precompute=True, cache=True)
+    cache_file = os.path.splitext(own_grid_file)[0] + '.coef.npz'
+    assert os.path.isfile(cache_file)
+    assert t.coefficients[0].shape == (2, 121, 161, 16)
+
+    # Same .spg: the tables come from the cache, nothing is recomputed
+    def fail(grid):
+        raise AssertionError('coefficients recomputed')
+
+    with monkeypatch.context() as m:
+        m.setattr(transformations, '_bicubic_coefficients', fail)
+        cached = transformations.Transform(own_grid_file, precompute=True, cache=True)
+    np.testing.assert_array_equal(cached.coefficients[0], t.coefficients[0])
+
+    # Modified .spg: the cache is stale and rebuilt
+    calls = []
+    original = transformations._bicubic_coefficients
+    monkeypatch.setattr(transformations, '_bicubic_coefficients', lambda grid: calls.append(1) or original(grid))
+    stat = os.stat(own_grid_file)
+    os.utime(own_grid_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    transformations.Transform(own_grid_file, precompute=True, cache=True)
+    assert len(calls) == 2
+
+
+def test_coefficient_cache_is_keyed_by_grid_precision(tmp_path):
+    # float64 node values that float32 storage rounds
+    data = make_grid_data()
+    for grid in data['grids'].values():
+        grid['grid'] = grid['grid'].astype(np.float64) + 1e-4 / 3
+    path = tmp_path / 'rom_grid3d_25.04.spg'
+    path.write_bytes(pickle.dumps(data))
+    t = transformations.Transform(path, precompute=True, cache=True)
+
+    # Same .spg, grids held in float32: the tables cached from the float64 grids must not be reused
+    for grid in (t.grid_shifts, t.geoid_heights):
+        grid['grid'] = grid['grid'].astype(np.float32)
+    t.precompute_coefficients(cache=True)
+
+    for table, grid in zip(t.coefficients, (t.grid_shifts, t.geoid_heights)):
+        np.testing.assert_array_equal(table, transformations._bicubic_coefficients(grid['grid']))
+
+
+def test_coefficient_cache_is_keyed_by_grid_dtype(tmp_path):
+    # float64 node values that float32 storage rounds
+    data = make_grid_data()
+    for grid in data['grids'].values():
+        grid['grid'] = grid['grid'].astype(np.float64) + 1e-4 / 3
+    path = tmp_path / 'rom_grid3d_25.04.spg'
+    path.write_bytes(pickle.dumps(data))
+
+    single = transformations.Transform(path, precompute=True, cache=True, grid_dtype=np.float32)
+    fresh = transformations.Transform(path, precompute=True, grid_dtype=np.float64)
+
+    # A float64 load must not reuse the tables computed from the float32 grids
+    cached = transformations.Transform(path, precompute=True, cache=True, grid_dtype=np.float64)
+    for table, expected in zip(cached.coefficients, fresh.coefficients):
+        np.testing.assert_array_equal(table, expected)
+    assert not np.array_equal(single.coefficients[0], fresh.coefficients[0])
+
+
+def test_precomputed_transform_matches_plain(grid_file, etrs_points):
+    lat, lon, z = etrs_points
+    results = []
+    for precompute in (False, True):
+        t = transformations.Transform(grid_file, precompute=precompute)
+        out = [np.empty_like(lat) for _ in range(3)]
+        t.etrs_to_st70(lat, lon, z, *out)
+        results.append(out)
+
+    for plain, fast in zip(*results):
+        np.testing.assert_allclose(fast, plain, rtol=0, atol=1e-6)
+
+
+def test_bilinear_vec_matches_scalar(grid, xy):
+    x, y = xy
+    expected = _scalar(transformations._doLinearInterpolation, x[:-1], y[:-1], grid)
+    result = transformations._doLinearInterpolation_vec(x, y, MINX, MINY, STEPX, STEPY, grid)
+
+    np.testing.assert_array_equal(np.isnan(result[:-1]), np.isnan(expected))
+    np.testing.assert_allclose(result[:-1], expected, rtol=0, atol=1e-12)
+    assert np.isnan(result[-1])
+
+
+def test_bilinear_vs_bicubic():
+    # Both reproduce a plane exactly; on a curved surface bilinear is off by O(step**2), bicubic much less
+    rows, cols = np.meshgrid(np.arange(12.0), np.arange(15.0), indexing='ij')
+    rng = np.random.default_rng(4)
+    x = rng.uniform(MINX + STEPX, MINX + 11 * STEPX, 200)
+    y = rng.uniform(MINY + STEPY, MINY + 8 * STEPY, 200)
+    u, v = (x - MINX) / STEPX, (y - MINY) / STEPY
+
+    plane = 2.0 * cols - 3.0 * rows + 1.0
+    for interp in (transformations._doLinearInterpolation_vec, transformations._doBSInterpolation_vec):
+        np.testing.assert_allclose(interp(x, y, MINX, MINY, STEPX, STEPY, plane), 2.0 * u - 3.0 * v + 1.0, rtol=0, atol=1e-9)
+
+    curved = np.sin(cols / 3.0) * np.cos(rows / 4.0)
+    exact = np.sin(u / 3.0) * np.cos(v / 4.0)
+    linear_error = np.abs(transformations._doLinearInterpolation_vec(x, y, MINX, MINY, STEPX, STEPY, curved) - exact).max()
+    bicubic_error = np.abs(transformations._doBSInterpolation_vec(x, y, MINX, MINY, STEPX, STEPY, curved) - exact).max()
+
+    assert bicubic_error < linear_error / 3
+    assert linear_error < 0.05
+
+
+def test_select_interp_codes():
+    assert transformations.select_interp_vec(transformations.INTERP_LINEAR) is transformations._doLinearInterpolation_vec
+    assert transformations.select_interp_vec(transformations.INTERP_COLOCATE) is transformations._doColocate_vec
+    with pytest.raises(ValueError):
+        transformations.select_interp(7)
@@ -0,0 +1,67 @@
+# test_parse_plan - Parser patterns compiled once per set of settings, rebuilt only on config changes
+
+import pytest
+
+import config
+import functions
+import worker_entry
+from parse_plan import ParsePlan, describe
+
+
+@pytest.fixture
+def restore_plan():
+    yield
+    worker_entry.configure(functions.worker_settings())
+
+
+def test_plan_compiles_the_configured_patterns():
+    plan = ParsePlan(functions.worker_settings())
+
+    assert set(plan.patterns) == {'dms4', 'dms4_flipped', 'float4', 'dms'}
+    assert plan.bbox == config.BBOX_RO_ETRS
+    assert 'dms' not in ParsePlan(dict(functions.worker_settings(), PREGEX_DMS=None)).patterns
+
+
+def test_counters_add_up():
+    plan = ParsePlan(functions.worker_settings())
+    plan.search('dms4', "P1 45.5 25.5 100")
+    plan.search('dms4', "nothing here")
+    plan.match('float4', "P1 500000.0 400000.0 100.0")
+
+    info = plan.counters()
+    assert (info['dms4_tried'], info['dms4_matched'], info['float4_tried']) == (2, 1, 1)
+    assert 'dms_tried' not in info
+    assert describe(info).startswith('dms4 1/2 in ')
+
+    plan.reset_counters()
+    assert plan.counters() == {}
+
+
+def test_configure_rebuilds_only_on_changes(restore_plan):
+    settings = functions.worker_settings()
+    plan = worker_entry.configure(settings)
+
+    assert worker_entry.configure(dict(settings)) is plan
+    changed = worker_entry.configure(dict(settings, BBOX_RO_ETRS=[20.0, 43.0, 30.0, 49.0]))
+    assert changed is not plan and worker_entry.PLAN is changed
+
+
+def test_parsers_do_not_reconfigure_per_line(monkeypatch):
+    calls = []
+    monkeypatch.setattr(worker_entry, 'configure', lambda settings: calls.append(settings))
+
+    assert functions._parse_line_etrs("P1 45.5 25.5 100")[:3] == (45.5, 25.5, 100.0)
+    assert functions._split_floats_from_text("P1 500000.0 400000.0 100.0")[:3] == (500000.0, 400000.0, 100.0)
+    assert functions._dd_or_dms("45 30 36") == pytest.approx(45.51)
+    assert calls == []
+
+
+def test_config_overrides_reconfigure_the_plan(tmp_path, monkeypatch, restore_plan):
+    ui_settings_dialog = pytest.importorskip('ui_settings_dialog', exc_type=ImportError)
+
+    ini = tmp_path / 'config.ini'
+    ini.write_text("[SETTINGS]\nbbox_ro_etrs = 20.0, 43.0, 30.0, 49.0\n", encoding='utf-8')
+    monkeypatch.setattr(config, 'BBOX_RO_ETRS', list(config.BBOX_RO_ETRS))
+
+    ui_settings_dialog.load_config_overrides(ini)
+    assert worker_entry.PLAN.bbox == [20.0, 43.0, 30.0, 49.0]
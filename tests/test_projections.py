@@ -0,0 +1,78 @@
+# test_projections - Oblique stereographic (Stereo70) projection constants and kernels
+
+import numpy as np
+import pytest
+
+from romgeo_lite import projections
+
+
+@pytest.fixture(scope='module')
+def stereo():
+    return projections.stereographic(3844)
+
+
+@pytest.fixture
+def latlon():
+    rng = np.random.default_rng(5)
+    return rng.uniform(43.7, 48.2, 100), rng.uniform(20.3, 29.6, 100)
+
+
+def test_constants_are_immutable(stereo):
+    sc = stereo.constants
+    assert isinstance(sc, projections.stereo_constants)
+    assert (sc.E0, sc.N0, sc.k0) == (500000.0, 500000.0, 0.99975)
+    with pytest.raises(AttributeError):
+        sc.k0 = 1.0
+
+
+def test_projection_matches_pyproj(stereo, latlon):
+    pyproj = pytest.importorskip('pyproj')
+    lat, lon = latlon
+    e, n = np.empty_like(lat), np.empty_like(lat)
+    stereo.geodetic_to_stereographic(lat, lon, e, n)
+
+    # EPSG:3844 axis order is X (northing), Y (easting)
+    crs = pyproj.CRS.from_epsg(3844)
+    x, y = pyproj.Transformer.from_crs(crs.geodetic_crs, crs).transform(lat, lon)
+
+    np.testing.assert_allclose(e, y, rtol=0, atol=1e-3)
+    np.testing.assert_allclose(n, x, rtol=0, atol=1e-3)
+
+
+def test_vec_matches_scalar_and_round_trips(stereo, latlon):
+    lat, lon = latlon
+    sc = stereo.constants
+
+    e, n = projections._geodetic_to_stereographic_vec(lat, lon, sc)
+    expected = np.array([projections._geodetic_to_stereographic(la, lo, sc) for la, lo in zip(lat, lon)])
+    np.testing.assert_allclose(e, expected[:, 0], rtol=0, atol=1e-8)
+    np.testing.assert_allclose(n, expected[:, 1], rtol=0, atol=1e-8)
+
+    back_lat, back_lon = projections._stereographic_to_geodetic_vec(e, n, sc)
+    np.testing.assert_allclose(back_lat, lat, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(back_lon, lon, rtol=0, atol=1e-9)
+
+
+def test_masked_inverse_reports_convergence(stereo, latlon):
+    sc = stereo.constants
+    e, n = projections._geodetic_to_stereographic_vec(*latlon, sc)
+    e = np.append(e, np.nan)
+    n = np.append(n, 500000.0)
+
+    lat, lon, iterations, converged = projections._stereographic_to_geodetic_masked(e, n, sc)
+    expected = [projections._stereographic_to_geodetic_iter(ee, nn, sc) for ee, nn in zip(e[:-1], n[:-1])]
+
+    np.testing.assert_array_equal(iterations[:-1], [item[2] for item in expected])
+    np.testing.assert_allclose(lat[:-1], [item[0] for item in expected], rtol=0, atol=1e-12)
+    assert converged[:-1].all()
+    assert np.isnan(lat[-1]) and not converged[-1]
+
+
+def test_masked_inverse_flags_points_hitting_max_iter(stereo, latlon):
+    sc = stereo.constants
+    e, n = projections._geodetic_to_stereographic_vec(*latlon, sc)
+
+    _, _, iterations, converged = projections._stereographic_to_geodetic_masked(e, n, sc, max_iter=1)
+
+    assert (iterations == 1).all()
+    assert not converged.any()
@@ -0,0 +1,55 @@
+# test_shapefile - Point shapefiles written from column arrays, read back with pyogrio
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pyogrio = pytest.importorskip('pyogrio')
+shapely = pytest.importorskip('shapely')
+functions_gis = pytest.importorskip('functions_gis')
+
+
+@pytest.fixture
+def table():
+    rng = np.random.default_rng(5)
+    rows = 300
+    east, north, elev = rng.uniform(1e5, 9e5, rows), rng.uniform(1e5, 9e5, rows), rng.uniform(-10, 900, rows)
+    east[0], north[0] = 512345.678901234, 398765.432109876
+    df = pd.DataFrame({'Name': [f"P{i}" if i % 9 else f"Ștefănești {i}" for i in range(rows)],
+                       'H_mn': np.round(elev, 3), 'Lat': rng.uniform(43.6, 48.2, rows)})
+    return df, east, north, elev
+
+
+def test_point_wkb_matches_shapely():
+    east, north, elev = np.array([1.5, -2.25]), np.array([3.125, 4.0]), np.array([5.0, np.nan])
+    records = functions_gis._point_wkb(east, north, elev)
+
+    assert records.itemsize == 29
+    expected = shapely.to_wkb(shapely.points(east, north, elev), flavor='iso', byte_order=1, output_dimension=3)
+    assert [records[i:i + 1].tobytes() for i in range(2)] == expected.tolist()
+
+
+@pytest.mark.parametrize('arrow', [True, False], ids=['arrow', 'arrays'])
+def test_shapefile_round_trip(tmp_path, table, arrow, monkeypatch):
+    if arrow:
+        pytest.importorskip('pyarrow')
+    else:
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    df, east, north, elev = table
+    path = tmp_path / 'points.shp'
+
+    functions_gis._write_point_shapefile(path, df, east, north, elev, crs="EPSG:3844")
+
+    info = pyogrio.read_info(path)
+    assert info['geometry_type'] == 'Point Z' and info['features'] == len(df)
+    assert info['crs'] == 'EPSG:3844'
+
+    back = pyogrio.read_dataframe(path)
+    coords = shapely.get_coordinates(back.geometry.values, include_z=True)
+    np.testing.assert_array_equal(coords, np.c_[east, north, elev])  # bit-exact doubles
+
+    assert back['Name'].tolist() == df['Name'].tolist()
+    np.testing.assert_array_equal(back['H_mn'].to_numpy(), df['H_mn'].to_numpy())
+    np.testing.assert_allclose(back['Lat'].to_numpy(), df['Lat'].to_numpy(), rtol=1e-12)
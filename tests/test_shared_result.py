@@ -0,0 +1,84 @@
+# test_shared_result - Conversion results written by workers straight into a shared-memory block
+
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+import functions
+import worker_entry
+from conversion_result import ETRS_ST70_FIELDS, ST70_ETRS_FIELDS, STATUS_INVALID
+from shared_result import SharedResult, write_chunk
+from worker_pool import WarmPool
+
+
+@pytest.fixture
+def lines(etrs_points):
+    lines = [f"P{i} {lat:.9f} {lon:.9f} {h:.3f}" for i, (lat, lon, h) in enumerate(zip(*etrs_points))]
+    lines[5] = "not a point"
+    return lines
+
+
+@pytest.fixture
+def expected(grid_file, lines):
+    worker_entry.configure(functions.worker_settings())
+    return worker_entry.convert_etrs_st70(lines, grid_file)
+
+
+def _assert_same(result, expected):
+    np.testing.assert_array_equal(result.names, expected.names)
+    np.testing.assert_array_equal(result.values, expected.values)
+    np.testing.assert_array_equal(result.status, expected.status)
+
+
+def test_chunks_fill_the_shared_rows(grid_file, lines, expected):
+    shared = SharedResult(ETRS_ST70_FIELDS, len(lines))
+    assert shared.nbytes >= len(lines) * (len(ETRS_ST70_FIELDS) * 8 + 9)
+    assert (shared.arrays['status'] == STATUS_INVALID).all() and np.isnan(shared.arrays['values']).all()
+
+    stats = []
+    for start in (120, 0, 60):  # any completion order
+        chunk = lines[start:start + 60 if start < 120 else None]
+        stats.append(write_chunk(shared.descriptor, start, chunk, worker_entry.convert_etrs_st70(chunk, grid_file)))
+    result = shared.result(lines, stats)
+
+    _assert_same(result, expected)
+    assert sum(chunk['rows'] for chunk in stats) == len(lines)
+    assert result.status_counts() == expected.status_counts()
+
+    # Only names that are not part of their line travel by value
+    assert {row: name for chunk in stats for row, name in chunk['names'].items()} == {5: expected.names[5]}
+    assert expected.names[5] not in lines[5]
+
+
+def test_result_outlives_the_unlinked_segment(grid_file, lines):
+    shared = SharedResult(ETRS_ST70_FIELDS, len(lines))
+    stats = [write_chunk(shared.descriptor, 0, lines, worker_entry.convert_etrs_st70(lines, grid_file))]
+    result = shared.result(lines, stats)
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=shared.descriptor['shm'])
+    assert np.isfinite(result['st70_x']).sum() == len(lines) - 1
+    assert shared.arrays == {}
+
+
+def test_chunk_that_does_not_fit_is_rejected(grid_file, lines):
+    with SharedResult(ST70_ETRS_FIELDS, len(lines)) as shared:
+        result = worker_entry.convert_etrs_st70(lines[:10], grid_file)
+        with pytest.raises(ValueError, match='does not fit'):
+            write_chunk(shared.descriptor, 0, lines[:10], result)
+
+    with SharedResult(ETRS_ST70_FIELDS, 5) as shared:
+        with pytest.raises(ValueError, match='does not fit'):
+            write_chunk(shared.descriptor, 0, lines[:10], result)
+        shared.release()  # safe twice
+
+
+def test_run_shared_matches_in_process(grid_file, lines, expected):
+    settings = functions.worker_settings()
+    with WarmPool(max_workers=2, settings=lambda: settings) as pool:
+        chunks = [lines[i:i + 70] for i in range(0, len(lines), 70)]
+        result, stats = pool.run_shared(worker_entry.convert_etrs_st70, chunks, grid_file)
+
+    _assert_same(result, expected)
+    assert [chunk['start'] for chunk in stats] == [0, 70, 140]
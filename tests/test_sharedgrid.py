@@ -0,0 +1,59 @@
+# test_sharedgrid - Grids published once in shared memory and attached by pool workers
+
+import pickle
+
+import numpy as np
+import pytest
+
+from romgeo_lite import gridfile
+from romgeo_lite import sharedgrid
+from romgeo_lite import transformations
+
+
+@pytest.fixture
+def shared(grid_file):
+    grids = sharedgrid.SharedGrids(grid_file)
+    yield grids
+    sharedgrid.detach()
+    grids.release()
+
+
+def test_descriptor_is_small_and_picklable(shared):
+    blob = pickle.dumps(shared.descriptor)
+    assert len(blob) < 4096
+    assert shared.nbytes >= (2 * 121 * 161 + 165 * 325) * 8
+
+
+def test_attach_views_the_published_grids(shared, grid_file):
+    data = sharedgrid.attach(shared.descriptor)
+    original = gridfile.load_grid_data(grid_file)
+
+    for name in ('geodetic_shifts', 'geoid_heights'):
+        grid = data['grids'][name]['grid']
+        assert grid.dtype == np.float64
+        np.testing.assert_array_equal(grid, original['grids'][name]['grid'])
+        assert data['grids'][name]['metadata'] == original['grids'][name]['metadata']
+    assert data['params'] == original['params']
+
+
+def test_attach_worker_fills_the_transform_cache(shared, grid_file):
+    transformations.clear_transform_cache()
+    sharedgrid.attach_worker(shared.descriptor)
+
+    t = transformations.get_transform(grid_file)
+    assert transformations.transform_cache_info()['loaded'] == 1
+    assert not t.grid_shifts['grid'].flags.writeable
+
+    # The cached Transform reads the shared segment, not a private copy
+    shm = sharedgrid._attached[0]
+    assert np.shares_memory(t.grid_shifts['grid'], np.ndarray((shm.size,), dtype=np.uint8, buffer=shm.buf))
+
+
+def test_release_unlinks_the_segments(grid_file):
+    grids = sharedgrid.SharedGrids(grid_file)
+    descriptor = grids.descriptor
+    grids.release()
+    grids.release()  # safe twice
+
+    with pytest.raises(FileNotFoundError):
+        sharedgrid.attach(descriptor)
@@ -0,0 +1,127 @@
+# test_text_format - Columnar text rendering against Python's str.format
+
+import numpy as np
+import pytest
+
+import config
+import text_format
+from conversion_result import ConversionResult, ETRS_ST70_FIELDS, ST70_ETRS_FIELDS
+
+
+def _result(fields, names, values):
+    result = ConversionResult.empty(fields, len(names))
+    result.names[:] = names
+    result.values[:] = np.asarray(values, dtype=np.float64).T
+    return result
+
+
+@pytest.fixture
+def etrs_result():
+    return _result(ETRS_ST70_FIELDS, ["P1", "Ștefănești", " pad "], [
+        [45.5, 25.5, 100.0, 500000.12345, 400000.5, 98.7654],
+        [46.0, 26.0, 200.0, -1.0005, 1234567890.25, -0.0004],
+        [47.0, 27.0, 300.0, np.nan, 0.0, 12.0],
+    ])
+
+
+def test_decimal_column_matches_format():
+    rng = np.random.default_rng(7)
+    values = np.concatenate([rng.normal(0, 1e6, 500), [0.5, 1.5, 2.5, -0.0, 0.0, 1e17, -1e-12, 2.675, 1.0005, np.inf]])
+
+    for decimals in (0, 3, 9):
+        column = text_format.decimal_column(values, decimals)
+        text = [bytes(row).decode().strip() for row in column.mat]
+        assert text == [format(value, f'.{decimals}f') for value in values.tolist()]
+
+    for decimals in (0, 3, 9):
+        column = text_format.decimal_column([np.nan, np.nan], decimals)
+        assert bytes(column.mat[0]).strip() == b'NaN' and column.nbytes.tolist() == [3, 3]
+
+
+def test_space_mode_pads_to_the_width(etrs_result):
+    lines = text_format.to_text(etrs_result, width=15).split('\n')
+
+    expected = [f"{name.strip():<15} " + " ".join(f"{format(v, '.3f'):>15}" for v in row)
+                for name, row in zip(etrs_result.names, etrs_result.values[3:].T.tolist())]
+    assert lines == [line.replace('     nan', '     NaN') for line in expected]
+    assert len(lines[1]) == len(lines[0])  # padded by characters, not UTF-8 bytes
+
+
+def test_width_is_read_at_call_time(etrs_result, monkeypatch):
+    monkeypatch.setattr(config, 'FMT_SPACE_SIZE', 20)
+    assert text_format.to_text(etrs_result).split('\n')[0] == text_format.to_text(etrs_result, width=20).split('\n')[0]
+    assert text_format.to_text(etrs_result).startswith('P1' + ' ' * 19)
+
+
+def test_values_wider_than_the_width_are_kept(etrs_result):
+    line = text_format.to_text(etrs_result, width=4).split('\n')[1]
+    assert line.split() == ['Ștefănești', '-1.000', '1234567890.250', '-0.000']
+
+
+@pytest.mark.parametrize('mode, separator', [('tab', '\t'), ('comma', ',')])
+def test_separated_modes_write_bare_values(etrs_result, mode, separator):
+    lines = text_format.to_text(etrs_result, mode).split('\n')
+    assert lines[0] == separator.join(['P1', '500000.123', '400000.500', '98.765'])
+    assert lines[2] == separator.join(['pad', 'NaN', '0.000', '12.000'])
+
+
+def test_st70_direction_and_write_text(tmp_path):
+    result = _result(ST70_ETRS_FIELDS, ["A"], [[500000.0, 400000.0, 100.0, 45.123456789, 25.5, 150.25]])
+    path = tmp_path / 'out.txt'
+    text_format.write_text(result, path, 'comma')
+
+    assert path.read_bytes() == b'A,45.123456789,25.500000000,150.250'
+    assert text_format.to_text(_result(ST70_ETRS_FIELDS, [], np.empty((0, 6)))) == ''
+
+
+def test_rows_without_values(etrs_result):
+    failed = _result(ST70_ETRS_FIELDS, ["A", "B"], np.full((2, 6), np.nan))
+    assert text_format.to_text(failed, 'comma').split('\n') == ['A,NaN,NaN,NaN', 'B,NaN,NaN,NaN']
+    assert text_format.to_text(failed, width=4).split('\n')[0] == 'A     NaN  NaN  NaN'
+
+
+def _dms(degrees, minutes, seconds, sign=1):
+    return sign * (degrees + minutes / 60 + seconds / 3600)
+
+
+@pytest.mark.parametrize('value, text', [
+    (_dms(45, 30, 15.25), '45°30\'15.250000"'),
+    (_dms(45, 59, 59.9999995), '46°00\'00.000000"'),      # carries into minutes and degrees
+    (_dms(45, 58, 59.9999995), '45°59\'00.000000"'),      # carries into minutes
+    (_dms(45, 59, 59.9999994), '45°59\'59.999999"'),
+    (_dms(25, 30, 0.0, -1), '-25°30\'00.000000"'),
+    (_dms(0, 0, 59.9999996, -1), '-00°01\'00.000000"'),
+    (-1e-12, '00°00\'00.000000"'),                        # rounds to zero, no sign
+    (_dms(5, 0, 1.5), '05°00\'01.500000"'),
+    (_dms(123, 4, 5.0), '123°04\'05.000000"'),
+    (np.nan, 'NaN'),
+    (np.inf, 'NaN'),
+])
+def test_dms_strings(value, text):
+    assert text_format.dms_strings(np.array([value]), marks='safe')[0] == text
+
+
+def test_dms_column_matches_dms_strings():
+    rng = np.random.default_rng(3)
+    values = np.concatenate([rng.uniform(-180, 180, 300), [_dms(45, 59, 59.9999995), np.nan, -0.0]])
+
+    column = text_format.dms_column(values)
+    assert [bytes(row).decode().strip() for row in column.mat] == text_format.dms_strings(values, marks='safe').tolist()
+    assert column.nchars.tolist() == [len(text) for text in text_format.dms_strings(values, marks='safe').tolist()]
+
+    assert text_format.dms_strings(np.array([45.5]), 0) == ['45°30′00″']
+    assert text_format.dms_strings(np.array([]), 0).shape == (0,)
+    assert text_format.dms_strings(np.array([np.nan, np.inf])).tolist() == ['NaN', 'NaN']
+
+
+def test_dms_decimals_are_read_at_call_time(monkeypatch):
+    monkeypatch.setattr(config, 'DMS_DECIMALS', 2)
+    assert text_format.dms_strings(np.array([_dms(45, 59, 59.995)]), marks='safe')[0] == '46°00\'00.00"'
+    assert bytes(text_format.dms_column([45.5]).mat[0]) == b'45\xc2\xb030\'00.00"'
+
+
+def test_dms_output_columns():
+    st70 = _result(ST70_ETRS_FIELDS, ["A", "B"], [[0, 0, 0, 45.5, 25.25, 10.0], [0, 0, 0, np.nan, 25.25, 10.0]])
+    lines = text_format.to_text(st70, 'comma', dms=True).split('\n')
+
+    assert lines == ['A,45°30\'00.000000",25°15\'00.000000",10.000', 'B,NaN,25.250000000,10.000']
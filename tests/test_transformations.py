@@ -0,0 +1,126 @@
+# test_transformations - Array-at-a-time Transform kernels against the scalar per-point kernels
+
+import os
+
+import numpy as np
+import pytest
+
+from romgeo_lite import transformations
+
+
+def _grid_args(t):
+    shifts, geoid = t.grid_shifts, t.geoid_heights
+    return (shifts['grid'], shifts['metadata']['mine'], shifts['metadata']['minn'], shifts['metadata']['stepe'], shifts['metadata']['stepn'],
+            geoid['grid'], geoid['metadata']['minla'], geoid['metadata']['minphi'], geoid['metadata']['stepla'], geoid['metadata']['stepphi'])
+
+
+def _helmert(t, direction):
+    h = t.helmert[direction]
+    return h['tE'], h['tN'], h['dm'], h['Rz']
+
+
+def _etrs_to_st70(t, lat, lon, z):
+    e, n, height = np.empty_like(lat), np.empty_like(lat), np.empty_like(lat)
+    t.etrs_to_st70(lat, lon, z, e, n, height)
+    return e, n, height
+
+
+@pytest.fixture
+def transform(grid_file):
+    return transformations.Transform(grid_file)
+
+
+def test_bulk_etrs_to_st70_matches_scalar(transform, etrs_points):
+    lat, lon, z = etrs_points
+    e, n, height = _etrs_to_st70(transform, lat, lon, z)
+
+    expected = np.array([transformations._etrs_to_st70(la, lo, zz, transform.stereo_constants, *_helmert(transform, 'etrs2stereo'), *_grid_args(transform))
+                         for la, lo, zz in zip(lat, lon, z)])
+
+    np.testing.assert_allclose(e, expected[:, 0], rtol=0, atol=1e-6)
+    np.testing.assert_allclose(n, expected[:, 1], rtol=0, atol=1e-6)
+    np.testing.assert_allclose(height, expected[:, 2], rtol=0, atol=1e-6)
+
+
+def test_bulk_st70_to_etrs_matches_scalar(transform, etrs_points):
+    e, n, height = _etrs_to_st70(transform, *etrs_points)
+
+    lat, lon, z = np.empty_like(e), np.empty_like(e), np.empty_like(e)
+    transform.st70_to_etrs(e, n, height, lat, lon, z)
+
+    expected = np.array([transformations._st70_to_etrs(ee, nn, hh, transform.stereo_constants, *_helmert(transform, 'stereo2etrs'), *_grid_args(transform))
+                         for ee, nn, hh in zip(e, n, height)])
+
+    np.testing.assert_allclose(lat, expected[:, 0], rtol=0, atol=1e-10)
+    np.testing.assert_allclose(lon, expected[:, 1], rtol=0, atol=1e-10)
+    np.testing.assert_allclose(z, expected[:, 2], rtol=0, atol=1e-6)
+
+
+def test_bulk_st70_to_utm_matches_scalar(transform, etrs_points):
+    e, n, height = _etrs_to_st70(transform, *etrs_points)
+
+    utm_e, utm_n, z = np.empty_like(e), np.empty_like(e), np.empty_like(e)
+    transform.st70_to_utm(e, n, height, utm_e, utm_n, z, 35)
+
+    expected = np.array([transformations._st70_to_utm(ee, nn, hh, transform.stereo_constants, *_helmert(transform, 'stereo2etrs'), *_grid_args(transform), 35)
+                         for ee, nn, hh in zip(e, n, height)])
+
+    np.testing.assert_allclose(utm_e, expected[:, 0], rtol=0, atol=1e-6)
+    np.testing.assert_allclose(utm_n, expected[:, 1], rtol=0, atol=1e-6)
+    np.testing.assert_allclose(z, expected[:, 2], rtol=0, atol=1e-6)
+
+
+def test_points_outside_the_grids_are_nan(transform):
+    lat = np.array([46.0, 10.0, np.nan])
+    lon = np.array([25.0, 10.0, 25.0])
+    e, n, height = _etrs_to_st70(transform, lat, lon, np.zeros(3))
+
+    assert np.isfinite([e[0], n[0], height[0]]).all()
+    assert np.isnan([e[1], n[1], height[1], e[2], n[2], height[2]]).all()
+
+
+def test_transform_cache_hits_and_invalidates(own_grid_file):
+    transformations.clear_transform_cache()
+    before = transformations.transform_cache_info()
+
+    first = transformations.get_transform(own_grid_file)
+    assert transformations.get_transform(own_grid_file) is first
+
+    stat = os.stat(own_grid_file)
+    os.utime(own_grid_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    reloaded = transformations.get_transform(own_grid_file)
+    assert reloaded is not first
+
+    info = transformations.transform_cache_info()
+    assert info['hits'] - before['hits'] == 1
+    assert info['misses'] - before['misses'] == 2
+    assert info['invalidations'] - before['invalidations'] == 1
+    assert info['loaded'] == 1
+
+    transformations.clear_transform_cache()
+    assert transformations.transform_cache_info()['loaded'] == 0
+
+
+def test_grids_are_normalised_once(transform, etrs_points):
+    for grid in (transform.grid_shifts['grid'], transform.geoid_heights['grid']):
+        assert grid.flags.c_contiguous and not grid.flags.writeable
+        assert grid.dtype in (np.float32, np.float64)
+
+    copies = transformations.grid_copy_count()
+    lat, lon, z = etrs_points
+    e, n, height = _etrs_to_st70(transform, lat, lon, z)
+    transform.st70_to_etrs(e, n, height, np.empty_like(e), np.empty_like(e), np.empty_like(e))
+    assert transformations.grid_copy_count() == copies
+
+
+def test_as_grid_counts_conversions():
+    copies = transformations.grid_copy_count()
+    grid = np.zeros((4, 6))
+
+    assert transformations._as_grid(grid) is grid
+    assert transformations._as_grid(grid.astype(np.float32)).dtype == np.float32
+    assert transformations.grid_copy_count() == copies
+
+    converted = transformations._as_grid(grid[:, ::2])
+    assert converted.flags.c_contiguous
+    assert transformations.grid_copy_count() == copies + 1
@@ -0,0 +1,67 @@
+# test_worker_entry - Qt-free conversion functions run by the pool workers (and in-process)
+
+import os
+
+import numpy as np
+import pytest
+
+import functions
+import worker_entry
+from romgeo_lite import transformations
+
+
+@pytest.fixture
+def settings():
+    # Restore the process' parse plan after each test
+    yield functions.worker_settings()
+    worker_entry.configure(functions.worker_settings())
+
+
+def _etrs_lines(lat, lon, h):
+    return [f"P{i} {la:.9f} {lo:.9f} {hh:.3f}" for i, (la, lo, hh) in enumerate(zip(lat, lon, h))]
+
+
+def test_configured_interpolation_reaches_the_conversion(grid_file, etrs_points, settings):
+    lines = _etrs_lines(*etrs_points)
+    t = transformations.get_transform(grid_file)
+
+    results = {}
+    for name in ('grid', 'bicubic', 'linear'):
+        worker_entry.configure(dict(settings, INTERPOLATION=name))
+        results[name] = worker_entry.convert_etrs_st70(lines, grid_file)
+
+    # Same parsed inputs straight through the Transform with bilinear interpolation
+    parsed = results['linear']
+    e, n, height = (np.empty(len(lines)) for _ in range(3))
+    t.etrs_to_st70(parsed['lat'], parsed['lon'], parsed['h_ell'], e, n, height, interpolations=transformations.INTERP_LINEAR)
+
+    results = {name: result['st70_x'] for name, result in results.items()}
+    np.testing.assert_array_equal(results['grid'], results['bicubic'])
+    np.testing.assert_allclose(results['linear'], n, rtol=0, atol=1e-9)
+    assert np.abs(results['linear'] - results['bicubic']).max() > 1e-4
+
+    # An explicit per-job tier wins over the setting
+    explicit = worker_entry.convert_etrs_st70(lines, grid_file, transformations.INTERP_BICUBIC)['st70_x']
+    np.testing.assert_array_equal(explicit, results['bicubic'])
+
+
+def test_worker_settings_carry_the_interpolation(monkeypatch):
+    monkeypatch.setattr(functions.config, 'INTERPOLATION', 'linear')
+    assert functions.worker_settings()['INTERPOLATION'] == 'linear'
+    assert worker_entry._INTERPOLATIONS['linear'] == transformations.INTERP_LINEAR
+
+
+def test_spawned_workers_load_only_worker_entry(grid_file):
+    from worker_pool import WarmPool
+    import _probe
+
+    with WarmPool(max_workers=1, settings=functions.worker_settings) as pool:
+        pool.warm(grid_file, background=False)
+        info, = pool.startup
+        gui = pool.executor(grid_file).submit(_probe.loaded, ['PyQt5', 'config', 'logutil', 'grid_mgmt', 'functions', 'romgeo_table_convert_app']).result()
+
+    assert gui == []
+    assert info['pid'] != os.getpid()
+    # Measured in the worker, and a boot time even without psutil
+    assert 0 < info['import_seconds'] < info['boot_seconds']
+    assert np.isfinite(info['boot_seconds']) and info['init_seconds'] > 0
@@ -0,0 +1,82 @@
+# test_worker_pool - Warm process pool: results, reuse and restarts on grid or settings changes
+
+import os
+
+import numpy as np
+import pytest
+
+import functions
+import worker_entry
+from conversion_result import ConversionResult
+from worker_pool import WarmPool
+
+
+@pytest.fixture(scope='module')
+def pool():
+    settings = functions.worker_settings()
+    with WarmPool(max_workers=2, settings=lambda: settings) as pool:
+        yield pool
+
+
+@pytest.fixture
+def lines(etrs_points):
+    return [f"P{i} {lat:.9f} {lon:.9f} {h:.3f}" for i, (lat, lon, h) in enumerate(zip(*etrs_points))]
+
+
+def _chunks(lines, size=70):
+    return [lines[i:i + size] for i in range(0, len(lines), size)]
+
+
+def test_run_chunks_matches_in_process(pool, grid_file, lines):
+    worker_entry.configure(functions.worker_settings())
+    expected = worker_entry.convert_etrs_st70(lines, grid_file)
+
+    results = pool.run_chunks(worker_entry.convert_etrs_st70, _chunks(lines), grid_file)
+    result = ConversionResult.concat(results)
+
+    assert [len(r) for r in results] == [70, 70, 60]
+    np.testing.assert_array_equal(result.names, expected.names)
+    np.testing.assert_array_equal(result.values, expected.values)
+    np.testing.assert_array_equal(result.status, expected.status)
+
+
+def test_pool_is_reused_and_hot_swapped(pool, grid_file, own_grid_file, lines):
+    executor = pool.executor(grid_file)
+    pool.run_chunks(worker_entry.convert_etrs_st70, _chunks(lines), grid_file)
+    assert pool.executor(grid_file) is executor
+
+    pool.run_chunks(worker_entry.convert_etrs_st70, _chunks(lines), own_grid_file)
+    assert pool.executor(own_grid_file) is not executor
+    assert pool.grid_file.endswith(own_grid_file.rsplit('/', 1)[-1])
+
+
+def test_changed_grid_file_restarts_workers(own_grid_file):
+    with WarmPool(max_workers=1, settings=functions.worker_settings) as pool:
+        executor = pool.executor(own_grid_file)
+        stat = os.stat(own_grid_file)
+        os.utime(own_grid_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert pool.executor(own_grid_file) is not executor
+
+
+def test_settings_change_restarts_workers(grid_file, lines):
+    settings = functions.worker_settings()
+    with WarmPool(max_workers=1, settings=lambda: settings) as pool:
+        executor = pool.executor(grid_file)
+        settings = dict(settings, BBOX_RO_ETRS=[0.0, 0.0, 1.0, 1.0])
+        assert pool.executor(grid_file) is not executor
+
+
+def test_warm_reports_every_worker(grid_file):
+    with WarmPool(max_workers=2, settings=functions.worker_settings) as pool:
+        pool.warm(grid_file, background=False)
+
+        assert len(pool.startup) == 2
+        for info in pool.startup:
+            assert info['init_seconds'] > 0 and info['modules'] > 0
+
+
+def test_workers_are_spawned(pool, grid_file):
+    import _probe
+
+    # A forked worker would have inherited pytest from this process
+    assert pool.executor(grid_file).submit(_probe.loaded, ['pytest']).result() == []